@@ -15,14 +15,17 @@
 """
 
 import argparse
+import asyncio
+import numpy
 import re
 import sys
 
 import common
 import library.common as libCommon
+import library.fanout as fanout
 
 from enum import Enum
-from typing import List
+from typing import Dict, List, Sequence
 
 from library.model.draftedplayer import DraftedPlayer
 from library.model.player import Player
@@ -49,33 +52,26 @@ DEFAULT_OUTPUT_FORMAT = OutputFormat.HUMAN_READABLE
 DEFAULT_LEAGUE_REGEX_STRING = ".*"
 DEFAULT_PLATFORM = common.PlatformSelection.SLEEPER
 
+# Shown after the median and standard deviation in CSV output, earliest first
+DEFAULT_PERCENTILES = [10, 90]
+
 
 class AggregatedPlayerData(object):
-    def __init__(self, player: Player):
+    def __init__(self, player: Player, times_drafted: int,
+                 average_draft_position: float, min_draft_position: int,
+                 max_draft_position: int, median_draft_position: float,
+                 draft_position_stdev: float,
+                 percentile_draft_positions: List[float]):
         self.player = player
+        self.times_drafted = times_drafted
+        self.average_draft_position = average_draft_position
+        self.min_draft_position = min_draft_position
+        self.max_draft_position = max_draft_position
+        self.median_draft_position = median_draft_position
+        self.draft_position_stdev = draft_position_stdev
 
-        # Initialize the data storage fields, designed to be updated as data comes in
-        self.draft_positions = []
-        self.times_drafted = 0
-        self.average_draft_position = 0.0
-        self.min_draft_position = 10000
-        self.max_draft_position = 0
-        self.sum_draft_positions = 0
-
-    def add_draft_position(self, draft_position: int):
-        self.draft_positions.append(draft_position)
-        self._compute_adp_stats(draft_position)
-
-    def _compute_adp_stats(self, new_draft_position: int):
-        self.times_drafted += 1
-        self.sum_draft_positions += new_draft_position
-        self.average_draft_position = float(
-            self.sum_draft_positions) / self.times_drafted
-
-        if new_draft_position < self.min_draft_position:
-            self.min_draft_position = new_draft_position
-        if new_draft_position > self.max_draft_position:
-            self.max_draft_position = new_draft_position
+        # Lines up with the percentiles the data was aggregated with
+        self.percentile_draft_positions = percentile_draft_positions
 
     def __lt__(self, other):
         return self.average_draft_position < other.average_draft_position
@@ -84,6 +80,122 @@ class AggregatedPlayerData(object):
         return self.player.name + " " + str(self.average_draft_position)
 
 
+# Every drafted player across a set of drafts, sorted by ADP and grouped by
+# position and team as it's built, so each position's list can be pulled out
+# without going back through every draft.
+class ADPData(object):
+    def __init__(self,
+                 all_drafted_players: List[List[DraftedPlayer]],
+                 percentiles: Sequence[int] = DEFAULT_PERCENTILES):
+        self.percentiles = list(percentiles)
+
+        # Flatten every pick into a (player, draft position) pair, with players
+        # numbered in the order they first turn up
+        player_id_to_index: Dict[str, int] = {}
+        players: List[Player] = []
+        player_indexes = []
+        draft_positions = []
+
+        for drafted_players in all_drafted_players:
+            for drafted_player in drafted_players:
+                player_id = drafted_player.player.player_id
+
+                if player_id not in player_id_to_index:
+                    player_id_to_index[player_id] = len(players)
+                    players.append(drafted_player.player)
+
+                player_indexes.append(player_id_to_index[player_id])
+                draft_positions.append(drafted_player.draft_position)
+
+        self.all_players: List[AggregatedPlayerData] = _aggregate_draft_positions(
+            players, numpy.array(player_indexes, dtype=numpy.int64),
+            numpy.array(draft_positions, dtype=numpy.float64),
+            self.percentiles)
+        self.position_to_players: Dict[str, List[AggregatedPlayerData]] = {}
+        self.team_to_players: Dict[str, List[AggregatedPlayerData]] = {}
+
+        for individual_player_data in self.all_players:
+            self.position_to_players.setdefault(
+                individual_player_data.player.position,
+                []).append(individual_player_data)
+            self.team_to_players.setdefault(individual_player_data.player.team,
+                                            []).append(individual_player_data)
+
+    def get_players(self,
+                    position: str = INCLUDE_ALL,
+                    team: str = INCLUDE_ALL) -> List[AggregatedPlayerData]:
+        if position != INCLUDE_ALL:
+            players = self.position_to_players.get(position, [])
+            if team != INCLUDE_ALL:
+                players = [
+                    individual_player_data for individual_player_data in players
+                    if individual_player_data.player.team == team
+                ]
+            return players
+
+        if team != INCLUDE_ALL:
+            return self.team_to_players.get(team, [])
+
+        return self.all_players
+
+
+# Computes every player's statistics at once from parallel arrays of player
+# index and draft position, rather than a pick at a time. Players come back
+# sorted by ADP, ties kept in the order they were first drafted.
+def _aggregate_draft_positions(
+        players: List[Player], player_indexes: numpy.ndarray,
+        draft_positions: numpy.ndarray,
+        percentiles: List[int]) -> List[AggregatedPlayerData]:
+    if not players:
+        return []
+
+    player_count = len(players)
+
+    times_drafted = numpy.bincount(player_indexes, minlength=player_count)
+    averages = numpy.bincount(player_indexes,
+                              weights=draft_positions,
+                              minlength=player_count) / times_drafted
+
+    # Population standard deviation, so a player drafted once has 0
+    deviations = draft_positions - averages[player_indexes]
+    stdevs = numpy.sqrt(
+        numpy.bincount(player_indexes,
+                       weights=deviations * deviations,
+                       minlength=player_count) / times_drafted)
+
+    # Sorting by player and then draft position leaves each player's picks as
+    # an ordered run, so order statistics are just offsets into it
+    sorted_draft_positions = draft_positions[numpy.lexsort(
+        (draft_positions, player_indexes))]
+    run_starts = numpy.cumsum(times_drafted) - times_drafted
+
+    def get_quantiles(quantile: float) -> numpy.ndarray:
+        # Linear interpolation between the closest ranks, same as numpy's
+        # default percentile method
+        rank = quantile * (times_drafted - 1)
+        lower = numpy.floor(rank).astype(numpy.int64)
+        upper = numpy.minimum(lower + 1, times_drafted - 1)
+        lower_values = sorted_draft_positions[run_starts + lower]
+        upper_values = sorted_draft_positions[run_starts + upper]
+        return lower_values + (rank - lower) * (upper_values - lower_values)
+
+    minimums = sorted_draft_positions[run_starts]
+    maximums = sorted_draft_positions[run_starts + times_drafted - 1]
+    medians = get_quantiles(0.5)
+    percentile_values = [
+        get_quantiles(percentile / 100.0) for percentile in percentiles
+    ]
+
+    return [
+        AggregatedPlayerData(
+            players[index], int(times_drafted[index]), float(averages[index]),
+            int(minimums[index]), int(maximums[index]), float(medians[index]),
+            float(stdevs[index]),
+            [float(values[index]) for values in percentile_values])
+        for index in numpy.argsort(averages, kind="stable")
+    ]
+
+
 def _create_output_for_player(player: AggregatedPlayerData,
                               format: OutputFormat, league_size: int) -> str:
     if format == OutputFormat.HUMAN_READABLE:
@@ -139,21 +251,30 @@ def _convert_raw_adp_to_round_and_pick(raw_adp: float, league_size: int) -> str:
 
 
 def _create_csv_output_for_player(player: AggregatedPlayerData) -> str:
-    template = "{player_name},{n},{adp},{min},{max},{pos}"
-    return template.format(player_name=player.player.name,
-                           adp=round(player.average_draft_position, 2),
-                           min=player.min_draft_position,
-                           max=player.max_draft_position,
-                           n=player.times_drafted,
-                           pos=player.player.position)
+    template = "{player_name},{n},{adp},{min},{max},{pos},{median},{stdev}"
+    output = template.format(player_name=player.player.name,
+                             adp=round(player.average_draft_position, 2),
+                             min=player.min_draft_position,
+                             max=player.max_draft_position,
+                             n=player.times_drafted,
+                             pos=player.player.position,
+                             median=round(player.median_draft_position, 2),
+                             stdev=round(player.draft_position_stdev, 2))
+
+    for percentile_draft_position in player.percentile_draft_positions:
+        output += "," + str(round(percentile_draft_position, 2))
+
+    return output
 
 
 def _create_formatted_csv_output_for_player(player: AggregatedPlayerData, league_size: int) -> str:
-    template = "{player_name},{adp},{min},{max},{n}"
+    template = "{player_name},{adp},{min},{max},{n},{median},{stdev}"
     if league_size == 0:
         adp = player.average_draft_position
         minimum = player.min_draft_position
         maximum = player.max_draft_position
+        median = player.median_draft_position
+        percentile_draft_positions = player.percentile_draft_positions
     else:
         adp = _convert_raw_adp_to_round_and_pick(player.average_draft_position,
                                                  league_size)
@@ -161,11 +282,27 @@ def _create_formatted_csv_output_for_player(player: AggregatedPlayerData, league
                                                      league_size)
         maximum = _convert_raw_adp_to_round_and_pick(player.max_draft_position,
                                                      league_size)
-    return template.format(player_name=player.player.name,
-                           adp=adp,
-                           min=minimum,
-                           max=maximum,
-                           n=player.times_drafted)
+        median = _convert_raw_adp_to_round_and_pick(
+            player.median_draft_position, league_size)
+        percentile_draft_positions = [
+            _convert_raw_adp_to_round_and_pick(percentile_draft_position,
+                                               league_size)
+            for percentile_draft_position in player.percentile_draft_positions
+        ]
+
+    # The spread is a number of picks either way, so it stays a plain number
+    output = template.format(player_name=player.player.name,
+                             adp=adp,
+                             min=minimum,
+                             max=maximum,
+                             n=player.times_drafted,
+                             median=median,
+                             stdev=round(player.draft_position_stdev, 1))
+
+    for percentile_draft_position in percentile_draft_positions:
+        output += "," + str(percentile_draft_position)
+
+    return output
 
 
 def _parse_user_provided_flags() -> argparse.Namespace:
@@ -212,6 +349,13 @@ def _parse_user_provided_flags() -> argparse.Namespace:
                         help="Number of teams in the league",
                         type=int,
                         default=DEFAULT_LEAGUE_SIZE)
+    parser.add_argument(
+        "--percentiles",
+        help="Draft position percentiles to include in CSV output (default: "
+        + " ".join(map(str, DEFAULT_PERCENTILES)) + ")",
+        nargs="+",
+        type=int,
+        default=DEFAULT_PERCENTILES)
     group = parser.add_mutually_exclusive_group()
     group.add_argument("--human_readable",
                        dest="output_format",
@@ -240,7 +384,13 @@ def _parse_user_provided_flags() -> argparse.Namespace:
 
     parser.set_defaults(output_format=DEFAULT_OUTPUT_FORMAT,
                         platform_selection=DEFAULT_PLATFORM)
-    return parser.parse_args()
+    args = parser.parse_args()
+
+    for percentile in args.percentiles:
+        if percentile < 0 or percentile > 100:
+            parser.error("Percentiles must be between 0 and 100")
+
+    return args
 
 
 def aggregate_adp_data(
@@ -253,8 +403,48 @@ def aggregate_adp_data(
     minimum_times_drafted: int = DEFAULT_MIN_TIMES_DRAFTED,
     league_regex_string: str = DEFAULT_LEAGUE_REGEX_STRING,
     output_format: OutputFormat = DEFAULT_OUTPUT_FORMAT,
-    platform_selection: common.PlatformSelection = DEFAULT_PLATFORM
+    platform_selection: common.PlatformSelection = DEFAULT_PLATFORM,
+    max_workers: int = fanout.DEFAULT_MAX_WORKERS,
+    percentiles: Sequence[int] = DEFAULT_PERCENTILES
 ) -> List[str]:
+    adp_data = collect_adp_data(account_identifier, year, league_regex_string,
+                                platform_selection, max_workers, percentiles)
+
+    return format_adp_data(adp_data, league_size, position, team, max_results,
+                           minimum_times_drafted, output_format)
+
+
+async def aggregate_adp_data_async(
+    account_identifier: str,
+    league_size: int = DEFAULT_LEAGUE_SIZE,
+    year: int = libCommon.DEFAULT_YEAR,
+    position: str = DEFAULT_POSITION,
+    team: str = DEFAULT_TEAM,
+    max_results: int = DEFAULT_MAX_RESULTS,
+    minimum_times_drafted: int = DEFAULT_MIN_TIMES_DRAFTED,
+    league_regex_string: str = DEFAULT_LEAGUE_REGEX_STRING,
+    output_format: OutputFormat = DEFAULT_OUTPUT_FORMAT,
+    platform_selection: common.PlatformSelection = DEFAULT_PLATFORM,
+    percentiles: Sequence[int] = DEFAULT_PERCENTILES
+) -> List[str]:
+    adp_data = await collect_adp_data_async(account_identifier, year,
+                                            league_regex_string,
+                                            platform_selection, percentiles)
+
+    return format_adp_data(adp_data, league_size, position, team, max_results,
+                           minimum_times_drafted, output_format)
+
+
+# Pulls every draft once. Format the result as many times as needed, e.g. once
+# per position.
+def collect_adp_data(
+    account_identifier: str,
+    year: int = libCommon.DEFAULT_YEAR,
+    league_regex_string: str = DEFAULT_LEAGUE_REGEX_STRING,
+    platform_selection: common.PlatformSelection = DEFAULT_PLATFORM,
+    max_workers: int = fanout.DEFAULT_MAX_WORKERS,
+    percentiles: Sequence[int] = DEFAULT_PERCENTILES
+) -> ADPData:
 
     league_regex = re.compile(league_regex_string)
 
@@ -270,39 +460,54 @@ def aggregate_adp_data(
                                                 league_regex,
                                                 store_user_info=False)
 
-    player_data = {}
+    all_drafted_players = fanout.fan_out(
+        platform.get_drafted_players_for_league,
+        [(league, year) for league in leagues], max_workers)
 
-    for league in leagues:
-        drafted_players = platform.get_drafted_players_for_league(league, year)
+    return ADPData(all_drafted_players, percentiles)
 
-        for drafted_player in drafted_players:
-            player_id = drafted_player.player.player_id
 
-            if player_id not in player_data:
-                player_data[player_id] = AggregatedPlayerData(
-                    drafted_player.player)
+async def collect_adp_data_async(
+    account_identifier: str,
+    year: int = libCommon.DEFAULT_YEAR,
+    league_regex_string: str = DEFAULT_LEAGUE_REGEX_STRING,
+    platform_selection: common.PlatformSelection = DEFAULT_PLATFORM,
+    percentiles: Sequence[int] = DEFAULT_PERCENTILES
+) -> ADPData:
+
+    league_regex = re.compile(league_regex_string)
+
+    platform = await common.create_async_platform(platform_selection)
+
+    user = await platform.get_admin_user_by_identifier(account_identifier)
+    leagues = await platform.get_all_leagues_for_user(user,
+                                                      year,
+                                                      league_regex,
+                                                      store_user_info=False)
+
+    all_drafted_players = await asyncio.gather(*[
+        platform.get_drafted_players_for_league(league, year)
+        for league in leagues
+    ])
 
-            player_data[player_id].add_draft_position(
-                drafted_player.draft_position)
+    return ADPData(all_drafted_players, percentiles)
 
+
+def format_adp_data(
+        adp_data: ADPData,
+        league_size: int = DEFAULT_LEAGUE_SIZE,
+        position: str = DEFAULT_POSITION,
+        team: str = DEFAULT_TEAM,
+        max_results: int = DEFAULT_MAX_RESULTS,
+        minimum_times_drafted: int = DEFAULT_MIN_TIMES_DRAFTED,
+        output_format: OutputFormat = DEFAULT_OUTPUT_FORMAT) -> List[str]:
     results = []
-    for player_id in sorted(player_data, key=player_data.get):
+    for individual_player_data in adp_data.get_players(position, team):
 
         # Short circuit if we've printed enough
         if max_results != -1 and len(results) >= max_results:
             break
 
-        # Pull up the player
-        individual_player_data = player_data[player_id]
-
-        # Filter on position
-        if position != INCLUDE_ALL and individual_player_data.player.position != position:
-            continue
-
-        # Filter on team
-        if team != INCLUDE_ALL and individual_player_data.player.team != team:
-            continue
-
         # Filter out players who have been drafted fewer times than the specified minimum count
         if individual_player_data.times_drafted < minimum_times_drafted:
             continue
@@ -322,7 +527,8 @@ def main(argv):
                                   args.position, args.team, args.max_results,
                                   args.minimum_times_drafted,
                                   args.league_regex, args.output_format,
-                                  args.platform_selection)
+                                  args.platform_selection,
+                                  percentiles=args.percentiles)
 
     for player in adp_data:
         print(player)
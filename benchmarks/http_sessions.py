@@ -0,0 +1,154 @@
+"""
+   Copyright 2026 Kevin Emery
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+# Compares requests per second for a bare `requests.get` (new connection every
+# call) against the pooled keep-alive sessions in library.common, using a local
+# stand-in server. Every request is for a different URL, so the single-flight
+# coalescing in library.common never folds requests together and only the
+# connection handling is measured. Run from the repository root:
+#
+#     python -m benchmarks.http_sessions -n 2000 -t 8
+
+import argparse
+import json
+import sys
+import threading
+import time
+
+import requests
+
+import library.common as libCommon
+import library.ratelimiter as libRateLimiter
+
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List
+
+RESPONSE_BODY = json.dumps({"league_id": "1", "name": "Benchmark League"}).encode()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 is required for the server to honor keep-alive
+    protocol_version = "HTTP/1.1"
+
+    # Headers and body go out in separate writes. Without this, Nagle plus
+    # delayed ACKs stall every reused connection for ~40ms
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE_BODY)))
+        self.end_headers()
+        self.wfile.write(RESPONSE_BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _bare_request(request_url: str):
+    return requests.get(request_url).json()
+
+
+def _pooled_request(request_url: str):
+    return libCommon._make_get_request_with_logging(request_url, False)
+
+
+def _create_request_urls(base_url: str, label: str,
+                         request_count: int) -> List[str]:
+    return [
+        "{base}/{label}/{index}".format(base=base_url, label=label, index=index)
+        for index in range(request_count)
+    ]
+
+
+def _measure_requests_per_second(request_function: Callable[[str], object],
+                                 request_urls: List[str],
+                                 thread_count: int) -> float:
+    start = time.perf_counter()
+
+    if thread_count == 1:
+        for request_url in request_urls:
+            request_function(request_url)
+    else:
+        with ThreadPoolExecutor(max_workers=thread_count) as executor:
+            list(executor.map(request_function, request_urls))
+
+    return len(request_urls) / (time.perf_counter() - start)
+
+
+def _parse_user_provided_flags() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n",
+                        "--requests",
+                        help="Number of requests per run (default: 1000)",
+                        type=int,
+                        default=1000)
+    parser.add_argument(
+        "-t",
+        "--threads",
+        help="Number of concurrent client threads (default: 1)",
+        type=int,
+        default=1)
+
+    return parser.parse_args()
+
+
+def main(argv):
+    args = _parse_user_provided_flags()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = "http://127.0.0.1:{port}/league".format(
+        port=server.server_address[1])
+
+    libCommon.configure_http_sessions(pool_size=max(args.threads,
+                                                    libCommon.DEFAULT_POOL_SIZE))
+
+    # The stand-in server has no request budget, don't let the limiter pace us
+    libRateLimiter.configure_host_rate_limit(
+        "127.0.0.1:{port}".format(port=server.server_address[1]),
+        requests_per_second=1000000,
+        burst=args.requests)
+
+    # Warm up both paths so neither pays for first-call setup
+    _bare_request(base_url + "/warmup")
+    _pooled_request(base_url + "/warmup")
+
+    bare_rate = _measure_requests_per_second(
+        _bare_request, _create_request_urls(base_url, "bare", args.requests),
+        args.threads)
+    pooled_rate = _measure_requests_per_second(
+        _pooled_request, _create_request_urls(base_url, "pooled",
+                                              args.requests), args.threads)
+
+    template = "{label:<30}{rate:>10.1f} req/s"
+    print("{count} requests, {threads} thread(s)".format(count=args.requests,
+                                                         threads=args.threads))
+    print(template.format(label="New connection per request", rate=bare_rate))
+    print(template.format(label="Pooled keep-alive session", rate=pooled_rate))
+    print("Speedup: {speedup:.2f}x".format(speedup=pooled_rate / bare_rate))
+    print("Note: the stand-in server is plain HTTP on loopback. Against the real "
+          "APIs the pooled path also skips the TLS handshake, so the gap is larger.")
+
+    libCommon.close_http_sessions()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
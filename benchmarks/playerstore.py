@@ -0,0 +1,200 @@
+"""
+   Copyright 2026 Kevin Emery
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+# Compares loading Sleeper player data from the old JSON file against the
+# memory-mapped player store, for a synthetic player list about the size of
+# Sleeper's. Each load runs in a fresh interpreter so memory use isn't shared
+# between them. Run from the repository root:
+#
+#     python -m benchmarks.playerstore -n 11000 -l 200
+#
+# Memory use comes from /proc or the resource module, so this needs Linux or
+# macOS.
+
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from library.model.player import Player
+from library.model.player import PlayerEncoder
+from library.platforms.sleeper import playerstore
+
+from typing import Dict, List
+
+TEAMS = [
+    "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN", "DET",
+    "GB", "HOU", "IND", "JAX", "KC", "LAC", "LAR", "LV", "MIA", "MIN", "NE",
+    "NO", "NYG", "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS", None
+]
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF", "DL", "LB", "DB", None]
+STATUSES = [None, None, None, None, "Questionable", "Out", "IR", "PUP"]
+
+
+def _create_players(player_count: int) -> List[Player]:
+    generator = random.Random(0)
+
+    return [
+        Player(str(player_id),
+               "First{id} Last{id}".format(id=player_id),
+               generator.choice(TEAMS), generator.choice(POSITIONS),
+               generator.choice(STATUSES))
+        for player_id in range(1, player_count + 1)
+    ]
+
+
+# The loader Sleeper used before the player store
+def _load_json_player_data(file_path: str) -> Dict[str, Player]:
+    data = {}
+    with open(file_path, 'r') as file:
+        raw_data = json.load(file)
+
+        for player_id, player_raw_data in raw_data.items():
+            data[player_id] = Player(player_raw_data["player_id"],
+                                     player_raw_data["name"],
+                                     player_raw_data["team"],
+                                     player_raw_data["position"],
+                                     player_raw_data["status"])
+
+    return data
+
+
+def _get_rss_kilobytes() -> float:
+    # Current resident memory where Linux exposes it, otherwise the peak
+    if os.path.exists("/proc/self/statm"):
+        with open("/proc/self/statm") as file:
+            resident_pages = int(file.read().split()[1])
+        return resident_pages * resource.getpagesize() / 1024
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports kilobytes, macOS reports bytes
+    if sys.platform == "darwin":
+        return peak_rss / 1024
+    return peak_rss
+
+
+def _measure(store_format: str, file_path: str, player_ids: List[str]):
+    starting_rss = _get_rss_kilobytes()
+    start = time.perf_counter()
+
+    if store_format == "json":
+        player_id_to_player = _load_json_player_data(file_path)
+    else:
+        player_id_to_player = playerstore.PlayerStore(file_path)
+
+    loaded = time.perf_counter()
+    for player_id in player_ids:
+        player_id_to_player[player_id]
+    finished = time.perf_counter()
+
+    print(
+        json.dumps({
+            "load_seconds": loaded - start,
+            "lookup_seconds": finished - loaded,
+            "rss_kilobytes": _get_rss_kilobytes() - starting_rss
+        }))
+
+
+def _run_measurement(store_format: str, file_path: str,
+                     player_ids: List[str]):
+    result = subprocess.run([
+        sys.executable, "-m", "benchmarks.playerstore", "--measure",
+        store_format, file_path
+    ] + player_ids,
+                            capture_output=True,
+                            text=True,
+                            check=True)
+
+    return json.loads(result.stdout)
+
+
+def _parse_user_provided_flags() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n",
+                        "--players",
+                        help="Number of players in the file (default: 11000)",
+                        type=int,
+                        default=11000)
+    parser.add_argument("-l",
+                        "--lookups",
+                        help="Number of players looked up after loading (default: 200)",
+                        type=int,
+                        default=200)
+    parser.add_argument("--measure", nargs="+", help=argparse.SUPPRESS)
+
+    return parser.parse_args()
+
+
+def main(argv):
+    args = _parse_user_provided_flags()
+
+    # Child processes only measure a single load
+    if args.measure:
+        store_format, file_path, *player_ids = args.measure
+        _measure(store_format, file_path, player_ids)
+        return
+
+    players = _create_players(args.players)
+    player_ids = [
+        player.player_id for player in random.Random(1).sample(
+            players, min(args.lookups, len(players)))
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_file_path = os.path.join(directory, "sleeper_player_data")
+        store_file_path = os.path.join(directory, "sleeper_player_store")
+
+        with open(json_file_path, 'w') as file:
+            file.write(
+                json.dumps({player.player_id: player
+                            for player in players},
+                           cls=PlayerEncoder))
+        playerstore.write_player_store(store_file_path, players)
+
+        json_result = _run_measurement("json", json_file_path, player_ids)
+        store_result = _run_measurement("store", store_file_path, player_ids)
+
+        template = "{label:<24}{size:>10.0f} KB{load:>10.1f} ms{lookup:>10.2f} ms{rss:>10.0f} KB"
+        print("{players} players, {lookups} lookups".format(
+            players=args.players, lookups=len(player_ids)))
+        print("{label:<24}{size:>13}{load:>13}{lookup:>13}{rss:>13}".format(
+            label="", size="File", load="Load", lookup="Lookups",
+            rss="RSS"))
+        for label, file_path, result in [
+            ("JSON file", json_file_path, json_result),
+            ("Memory-mapped store", store_file_path, store_result)
+        ]:
+            print(
+                template.format(label=label,
+                                size=os.path.getsize(file_path) / 1024,
+                                load=result["load_seconds"] * 1000,
+                                lookup=result["lookup_seconds"] * 1000,
+                                rss=result["rss_kilobytes"]))
+
+        print("Load speedup: {speedup:.1f}x".format(
+            speedup=json_result["load_seconds"] /
+            store_result["load_seconds"]))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -59,25 +59,21 @@ class ADPCog(commands.Cog):
                                         "Posting to " + forum.name + " forum")
 
         await interaction.response.defer()
+
+        # Every post is cut from the same set of drafts, so only pull them once
+        fta_adp_data = await self._collect_fta_adp_data()
         await asyncio.gather(
-            await asyncio.to_thread(self._post_fta_position_adp, forum, "DEF",
-                                    "Team Defense", DEF_COLOR), await
-            asyncio.to_thread(self._post_fta_position_adp, forum, "K",
-                              "Kicker", K_COLOR), await
-            asyncio.to_thread(self._post_fta_position_adp, forum, "TE",
-                              "Tight End", TE_COLOR), await
-            asyncio.to_thread(self._post_fta_position_adp, forum, "WR",
-                              "Wide Receiver", WR_COLOR), await
-            asyncio.to_thread(self._post_fta_position_adp, forum, "RB",
-                              "Running Back", RB_COLOR), await
-            asyncio.to_thread(self._post_fta_position_adp, forum, "QB",
-                              "Quarterback", QB_COLOR), await
-            asyncio.to_thread(self._post_fta_position_adp, forum,
-                              adp.INCLUDE_ALL, "All Players",
-                              ALL_PLAYERS_COLOR))
+            self._post_fta_position_adp(forum, "DEF", "Team Defense", DEF_COLOR, fta_adp_data),
+            self._post_fta_position_adp(forum, "K", "Kicker", K_COLOR, fta_adp_data),
+            self._post_fta_position_adp(forum, "TE", "Tight End", TE_COLOR, fta_adp_data),
+            self._post_fta_position_adp(forum, "WR", "Wide Receiver", WR_COLOR, fta_adp_data),
+            self._post_fta_position_adp(forum, "RB", "Running Back", RB_COLOR, fta_adp_data),
+            self._post_fta_position_adp(forum, "QB", "Quarterback", QB_COLOR, fta_adp_data),
+            self._post_fta_position_adp(forum, adp.INCLUDE_ALL, "All Players",
+                                        ALL_PLAYERS_COLOR, fta_adp_data))
 
         if channel is not None:
-            await self._post_fta_raw_csv_data(channel)
+            await self._post_fta_raw_csv_data(channel, fta_adp_data)
 
         cogCommon.print_descriptive_log("send_all_fta_adp_posts", "Done")
         await interaction.followup.send("Done!")
@@ -203,22 +199,17 @@ class ADPCog(commands.Cog):
                                         "Posting to " + forum.name + " forum")
 
         await interaction.response.defer()
+
+        narffl_adp_data = await self._collect_narffl_adp_data()
         await asyncio.gather(
-            await asyncio.to_thread(self._post_narffl_position_adp, forum,
-                                    "D/ST", "Team Defense", DEF_COLOR), await
-            asyncio.to_thread(self._post_narffl_position_adp, forum, "K",
-                              "Kicker", K_COLOR), await
-            asyncio.to_thread(self._post_narffl_position_adp, forum, "TE",
-                              "Tight End", TE_COLOR), await
-            asyncio.to_thread(self._post_narffl_position_adp, forum, "WR",
-                              "Wide Receiver", WR_COLOR), await
-            asyncio.to_thread(self._post_narffl_position_adp, forum, "RB",
-                              "Running Back", RB_COLOR), await
-            asyncio.to_thread(self._post_narffl_position_adp, forum, "QB",
-                              "Quarterback", QB_COLOR), await
-            asyncio.to_thread(self._post_narffl_position_adp, forum,
-                              adp.INCLUDE_ALL, "All Players",
-                              ALL_PLAYERS_COLOR))
+            self._post_narffl_position_adp(forum, "D/ST", "Team Defense", DEF_COLOR, narffl_adp_data),
+            self._post_narffl_position_adp(forum, "K", "Kicker", K_COLOR, narffl_adp_data),
+            self._post_narffl_position_adp(forum, "TE", "Tight End", TE_COLOR, narffl_adp_data),
+            self._post_narffl_position_adp(forum, "WR", "Wide Receiver", WR_COLOR, narffl_adp_data),
+            self._post_narffl_position_adp(forum, "RB", "Running Back", RB_COLOR, narffl_adp_data),
+            self._post_narffl_position_adp(forum, "QB", "Quarterback", QB_COLOR, narffl_adp_data),
+            self._post_narffl_position_adp(forum, adp.INCLUDE_ALL, "All Players",
+                                           ALL_PLAYERS_COLOR, narffl_adp_data))
 
         cogCommon.print_descriptive_log("send_all_narffl_adp_posts", "Done")
         await interaction.followup.send("Done!")
@@ -402,43 +393,62 @@ class ADPCog(commands.Cog):
         now = datetime.now()
         return now.strftime("%m/%d/%y")
 
-    async def _post_fta_position_adp(self, forum: discord.ForumChannel,
-                                     position_short: str, position_long: str,
-                                     embed_color: discord.Colour):
-        adp_data = await asyncio.to_thread(
-            adp.aggregate_adp_data,
+    async def _collect_fta_adp_data(self) -> adp.ADPData:
+        return await adp.collect_adp_data_async(
             account_identifier=cogConstants.FTAFFL_USER,
+            league_regex_string=cogConstants.FTAFFL_LEAGUE_REGEX)
+
+    async def _collect_narffl_adp_data(self) -> adp.ADPData:
+        return await adp.collect_adp_data_async(
+            account_identifier=cogConstants.NARFFL_USER,
+            platform_selection=common.PlatformSelection.FLEAFLICKER)
+
+    async def _post_fta_position_adp(self,
+                                     forum: discord.ForumChannel,
+                                     position_short: str,
+                                     position_long: str,
+                                     embed_color: discord.Colour,
+                                     fta_adp_data: adp.ADPData = None):
+        if fta_adp_data is None:
+            fta_adp_data = await self._collect_fta_adp_data()
+
+        adp_data = adp.format_adp_data(
+            fta_adp_data,
             league_size=14,
             position=position_short,
-            league_regex_string=cogConstants.FTAFFL_LEAGUE_REGEX,
             output_format=adp.OutputFormat.FORMATTED_CSV)
         await self._post_position_adp_data(
             forum, adp_data, position_long, embed_color,
             strings.FTA_ADP_THREAD_CONTENT + strings.ADP_GLOSSARY)
 
-    async def _post_narffl_position_adp(self, forum: discord.ForumChannel,
+    async def _post_narffl_position_adp(self,
+                                        forum: discord.ForumChannel,
                                         position_short: str,
                                         position_long: str,
-                                        embed_color: discord.Colour):
-        adp_data = await asyncio.to_thread(
-            adp.aggregate_adp_data,
-            account_identifier=cogConstants.NARFFL_USER,
+                                        embed_color: discord.Colour,
+                                        narffl_adp_data: adp.ADPData = None):
+        if narffl_adp_data is None:
+            narffl_adp_data = await self._collect_narffl_adp_data()
+
+        adp_data = adp.format_adp_data(
+            narffl_adp_data,
             league_size=12,
             position=position_short,
-            output_format=adp.OutputFormat.FORMATTED_CSV,
-            platform_selection=common.PlatformSelection.FLEAFLICKER)
+            output_format=adp.OutputFormat.FORMATTED_CSV)
         await self._post_position_adp_data(
             forum, adp_data, position_long, embed_color,
             strings.NARFFL_ADP_THREAD_CONTENT + strings.ADP_GLOSSARY)
 
-    async def _post_fta_raw_csv_data(self, channel: discord.TextChannel):
-        adp_data = await asyncio.to_thread(
-            adp.aggregate_adp_data,
-            account_identifier=cogConstants.FTAFFL_USER,
-            league_size=14,
-            position=adp.INCLUDE_ALL,
-            league_regex_string=cogConstants.FTAFFL_LEAGUE_REGEX,
-            output_format=adp.OutputFormat.CSV)
+    async def _post_fta_raw_csv_data(self,
+                                     channel: discord.TextChannel,
+                                     fta_adp_data: adp.ADPData = None):
+        if fta_adp_data is None:
+            fta_adp_data = await self._collect_fta_adp_data()
+
+        adp_data = adp.format_adp_data(fta_adp_data,
+                                       league_size=14,
+                                       position=adp.INCLUDE_ALL,
+                                       output_format=adp.OutputFormat.CSV)
 
         await self._post_raw_adp_data(channel, adp_data)
 
@@ -202,8 +202,7 @@ class InactivesCog(commands.Cog):
         cogCommon.print_descriptive_log("list_inactives_for_sleeper_user")
         await interaction.response.defer()
 
-        inactive_leagues = await asyncio.to_thread(
-            inactives.get_all_league_inactivity,
+        inactive_leagues = await inactives.get_all_league_inactivity_async(
             account_identifier=username,
             week=week,
             include_transactions=False,
@@ -236,8 +235,7 @@ class InactivesCog(commands.Cog):
         sleeper_username_to_discord_id_mapping = self._create_username_to_discord_id_map(
             SLEEPER_USERNAME_TO_DISCORD_ID_PATH)
 
-        inactive_leagues = await asyncio.to_thread(
-            inactives.get_all_league_inactivity,
+        inactive_leagues = await inactives.get_all_league_inactivity_async(
             account_identifier=cogConstants.FTAFFL_USER,
             week=week,
             include_transactions=False,
@@ -285,8 +283,7 @@ class InactivesCog(commands.Cog):
         sleeper_username_to_discord_id_mapping = self._create_username_to_discord_id_map(
             SLEEPER_USERNAME_TO_DISCORD_ID_PATH)
 
-        inactive_leagues = await asyncio.to_thread(
-            inactives.get_all_league_inactivity,
+        inactive_leagues = await inactives.get_all_league_inactivity_async(
             account_identifier=cogConstants.FTAFFL_USER,
             week=week,
             include_transactions=False,
@@ -335,8 +332,7 @@ class InactivesCog(commands.Cog):
         if player_names_to_ignore_list[0] == '':
             player_names_to_ignore_list = []
 
-        inactive_leagues = await asyncio.to_thread(
-            inactives.get_all_league_inactivity,
+        inactive_leagues = await inactives.get_all_league_inactivity_async(
             account_identifier=cogConstants.FTAFFL_USER,
             league_regex_string=cogConstants.FTAFFL_LEAGUE_REGEX,
             week=week,
@@ -398,8 +394,7 @@ class InactivesCog(commands.Cog):
         fleaflicker_username_to_discord_id_mapping = self._create_username_to_discord_id_map(
             FLEAFLICKER_USERNAME_TO_DISCORD_ID_PATH)
 
-        inactive_leagues = await asyncio.to_thread(
-            inactives.get_all_league_inactivity,
+        inactive_leagues = await inactives.get_all_league_inactivity_async(
             account_identifier=cogConstants.NARFFL_USER,
             week=week,
             include_transactions=False,
@@ -451,8 +446,7 @@ class InactivesCog(commands.Cog):
         fleaflicker_username_to_discord_id_mapping = self._create_username_to_discord_id_map(
             FLEAFLICKER_USERNAME_TO_DISCORD_ID_PATH)
 
-        inactive_leagues = await asyncio.to_thread(
-            inactives.get_all_league_inactivity,
+        inactive_leagues = await inactives.get_all_league_inactivity_async(
             account_identifier=cogConstants.NARFFL_USER,
             week=week,
             include_transactions=False,
@@ -523,8 +517,7 @@ class InactivesCog(commands.Cog):
         sleeper_username_to_discord_id_mapping = self._create_username_to_discord_id_map(
             SLEEPER_USERNAME_TO_DISCORD_ID_PATH)
 
-        inactive_leagues = await asyncio.to_thread(
-            inactives.get_all_league_inactivity,
+        inactive_leagues = await inactives.get_all_league_inactivity_async(
             account_identifier=cogConstants.FF_DISCORD_USER,
             week=week,
             include_transactions=False,
@@ -575,8 +568,7 @@ class InactivesCog(commands.Cog):
         sleeper_username_to_discord_id_mapping = self._create_username_to_discord_id_map(
             SLEEPER_USERNAME_TO_DISCORD_ID_PATH)
 
-        inactive_leagues = await asyncio.to_thread(
-            inactives.get_all_league_inactivity,
+        inactive_leagues = await inactives.get_all_league_inactivity_async(
             account_identifier=cogConstants.FF_DISCORD_USER,
             week=week,
             include_transactions=False,
@@ -628,8 +620,7 @@ class InactivesCog(commands.Cog):
         if player_names_to_ignore_list[0] == '':
             player_names_to_ignore_list = []
 
-        inactive_leagues = await asyncio.to_thread(
-            inactives.get_all_league_inactivity,
+        inactive_leagues = await inactives.get_all_league_inactivity_async(
             account_identifier=cogConstants.FF_DISCORD_USER,
             week=week,
             include_transactions=True,
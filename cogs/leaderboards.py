@@ -31,6 +31,17 @@ from typing import List
 from library.model.seasonscore import SeasonScore
 from library.model.weeklyscore import WeeklyScore
 
+NARFFL_LEAGUE_LEVEL_REGEXES = {
+    "Farm": cogConstants.NARFFL_FARM_LEAGUE_REGEX,
+    "Minors": cogConstants.NARFFL_MINORS_LEAGUE_REGEX,
+    "Majors": cogConstants.NARFFL_MAJORS_LEAGUE_REGEX,
+    "Premier": cogConstants.NARFFL_PREMIER_LEAGUE_REGEX
+}
+
+NARFFL_LEVEL_SEASON_LEADERBOARD_LENGTH = 15
+NARFFL_LEVEL_WEEKLY_LEADERBOARD_LENGTH = 10
+NARFFL_OVERALL_LEADERBOARD_LENGTH = 10
+
 
 class LeaderboardsCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -51,8 +62,7 @@ class LeaderboardsCog(commands.Cog):
 
         main_leaderboard_length = 5
         expanded_leaderboard_length = 15
-        scoring_results = await asyncio.to_thread(
-            leaguescoring.get_scoring_results,
+        scoring_results = await leaguescoring.get_scoring_results_async(
             account_identifier=cogConstants.FTAFFL_USER,
             starting_week=1,
             ending_week=end_week,
@@ -61,7 +71,9 @@ class LeaderboardsCog(commands.Cog):
             get_season_results=True,
             get_max_scores=True,
             get_min_scores=False,
-            league_regex_string=cogConstants.FTAFFL_LEAGUE_REGEX)
+            league_regex_string=cogConstants.FTAFFL_LEAGUE_REGEX,
+            weekly_count=expanded_leaderboard_length,
+            season_count=expanded_leaderboard_length)
 
         # Build the main leaderboard for the thread content
         thread_title = "Week {week} Leaderboard".format(week=end_week)
@@ -114,25 +126,43 @@ class LeaderboardsCog(commands.Cog):
             "Posting to {forum}".format(forum=forum.name))
         await interaction.response.defer()
 
+        # Every post is cut from one pull across all of the NarFFL leagues
+        scoring_results = await leaguescoring.get_partitioned_scoring_results_async(
+            account_identifier=cogConstants.NARFFL_USER,
+            starting_week=1,
+            ending_week=end_week,
+            partition_regex_strings=NARFFL_LEAGUE_LEVEL_REGEXES,
+            platform_selection=common.PlatformSelection.FLEAFLICKER,
+            get_weekly_results=True,
+            get_current_weeks_results=True,
+            get_season_results=True,
+            get_max_scores=True,
+            get_min_scores=False,
+            weekly_count=max(NARFFL_LEVEL_WEEKLY_LEADERBOARD_LENGTH,
+                             NARFFL_OVERALL_LEADERBOARD_LENGTH),
+            season_count=max(NARFFL_LEVEL_SEASON_LEADERBOARD_LENGTH,
+                             NARFFL_OVERALL_LEADERBOARD_LENGTH),
+            get_top_score_per_league=True)
+        level_results = scoring_results.partitions
+
         await asyncio.gather(
-            await asyncio.to_thread(self._post_specific_narffl_leaderboard,
-                                    "Farm",
-                                    cogConstants.NARFFL_FARM_LEAGUE_REGEX,
-                                    end_week, forum), await
-            asyncio.to_thread(self._post_narffl_top_farm_scores_leaderboard,
-                              end_week, forum), await
-            asyncio.to_thread(self._post_specific_narffl_leaderboard, "Minors",
-                              cogConstants.NARFFL_MINORS_LEAGUE_REGEX,
-                              end_week, forum), await
-            asyncio.to_thread(self._post_specific_narffl_leaderboard, "Majors",
-                              cogConstants.NARFFL_MAJORS_LEAGUE_REGEX,
-                              end_week, forum), await
-            asyncio.to_thread(self._post_specific_narffl_leaderboard,
-                              "Premier",
-                              cogConstants.NARFFL_PREMIER_LEAGUE_REGEX,
-                              end_week, forum), await
-            asyncio.to_thread(self._post_narffl_overall_leaderboard, end_week,
-                              forum))
+            self._send_specific_narffl_leaderboard("Farm",
+                                                   level_results["Farm"],
+                                                   end_week, forum),
+            self._send_narffl_top_farm_scores_leaderboard(
+                level_results["Farm"].top_weekly_score_per_league, end_week,
+                forum),
+            self._send_specific_narffl_leaderboard("Minors",
+                                                   level_results["Minors"],
+                                                   end_week, forum),
+            self._send_specific_narffl_leaderboard("Majors",
+                                                   level_results["Majors"],
+                                                   end_week, forum),
+            self._send_specific_narffl_leaderboard("Premier",
+                                                   level_results["Premier"],
+                                                   end_week, forum),
+            self._send_narffl_overall_leaderboard(scoring_results.overall,
+                                                  end_week, forum))
 
         cogCommon.print_descriptive_log("send_all_narffl_leaderboards", "Done")
         await interaction.followup.send(
@@ -285,8 +315,7 @@ class LeaderboardsCog(commands.Cog):
         await interaction.response.defer()
 
         leaderboard_length = 5
-        scoring_results = await asyncio.to_thread(
-            leaguescoring.get_scoring_results,
+        scoring_results = await leaguescoring.get_scoring_results_async(
             account_identifier=cogConstants.FF_DISCORD_USER,
             starting_week=1,
             ending_week=end_week,
@@ -294,7 +323,9 @@ class LeaderboardsCog(commands.Cog):
             get_current_weeks_results=True,
             get_season_results=True,
             get_max_scores=True,
-            get_min_scores=False)
+            get_min_scores=False,
+            weekly_count=leaderboard_length,
+            season_count=leaderboard_length)
 
         post_content = "## Week {week} Leaderboard\n\n\n".format(week=end_week)
 
@@ -384,11 +415,7 @@ class LeaderboardsCog(commands.Cog):
                                                 league_regex_string: str,
                                                 end_week: int,
                                                 forum: discord.ForumChannel):
-        season_leaderboard_length = 15
-        weekly_leaderboard_length = 10
-
-        scoring_results = await asyncio.to_thread(
-            leaguescoring.get_scoring_results,
+        scoring_results = await leaguescoring.get_scoring_results_async(
             account_identifier=cogConstants.NARFFL_USER,
             starting_week=1,
             ending_week=end_week,
@@ -398,7 +425,20 @@ class LeaderboardsCog(commands.Cog):
             get_season_results=True,
             get_max_scores=True,
             get_min_scores=False,
-            league_regex_string=league_regex_string)
+            league_regex_string=league_regex_string,
+            weekly_count=NARFFL_LEVEL_WEEKLY_LEADERBOARD_LENGTH,
+            season_count=NARFFL_LEVEL_SEASON_LEADERBOARD_LENGTH)
+
+        await self._send_specific_narffl_leaderboard(league_level,
+                                                     scoring_results,
+                                                     end_week, forum)
+
+    async def _send_specific_narffl_leaderboard(
+            self, league_level: str,
+            scoring_results: leaguescoring.ScoringResults, end_week: int,
+            forum: discord.ForumChannel):
+        season_leaderboard_length = NARFFL_LEVEL_SEASON_LEADERBOARD_LENGTH
+        weekly_leaderboard_length = NARFFL_LEVEL_WEEKLY_LEADERBOARD_LENGTH
 
         # Create the forum post
         thread_title = "Week {week} {level} Leaderboard".format(
@@ -432,17 +472,22 @@ class LeaderboardsCog(commands.Cog):
 
     async def _post_narffl_top_farm_scores_leaderboard(
             self, end_week: int, forum: discord.ForumChannel):
-        leagues_posted = 0
-        batch_size = 4
-
-        top_scores = await asyncio.to_thread(
-            topleaguescore.get_top_weekly_score_for_each_league,
+        top_scores = await topleaguescore.get_top_weekly_score_for_each_league_async(
             account_identifier=cogConstants.NARFFL_USER,
             league_regex_string=cogConstants.NARFFL_FARM_LEAGUE_REGEX,
             starting_week=1,
             ending_week=end_week,
             platform_selection=common.PlatformSelection.FLEAFLICKER)
 
+        await self._send_narffl_top_farm_scores_leaderboard(
+            top_scores, end_week, forum)
+
+    async def _send_narffl_top_farm_scores_leaderboard(
+            self, top_scores: List[WeeklyScore], end_week: int,
+            forum: discord.ForumChannel):
+        leagues_posted = 0
+        batch_size = 4
+
         # Create the forum post
         thread_title = "Week {week} Farm Top Scores".format(week=end_week)
         thread_content = strings.NARFFL_TOP_FARM_LEAGUE_SCORES_CONTENT
@@ -464,10 +509,7 @@ class LeaderboardsCog(commands.Cog):
 
     async def _post_narffl_overall_leaderboard(self, end_week: int,
                                                forum: discord.ForumChannel):
-        leaderboard_length = 10
-
-        scoring_results = await asyncio.to_thread(
-            leaguescoring.get_scoring_results,
+        scoring_results = await leaguescoring.get_scoring_results_async(
             account_identifier=cogConstants.NARFFL_USER,
             starting_week=1,
             ending_week=end_week,
@@ -476,7 +518,17 @@ class LeaderboardsCog(commands.Cog):
             get_current_weeks_results=True,
             get_season_results=True,
             get_max_scores=True,
-            get_min_scores=False)
+            get_min_scores=False,
+            weekly_count=NARFFL_OVERALL_LEADERBOARD_LENGTH,
+            season_count=NARFFL_OVERALL_LEADERBOARD_LENGTH)
+
+        await self._send_narffl_overall_leaderboard(scoring_results, end_week,
+                                                    forum)
+
+    async def _send_narffl_overall_leaderboard(
+            self, scoring_results: leaguescoring.ScoringResults,
+            end_week: int, forum: discord.ForumChannel):
+        leaderboard_length = NARFFL_OVERALL_LEADERBOARD_LENGTH
 
         # Create the forum post
         thread_title = "Week {week} Overall Leaderboard".format(week=end_week)
@@ -48,6 +48,17 @@ FOUR_TEAM_TRADE_REACTIONS = ['1️⃣', '2️⃣', '3️⃣', '4️⃣', '🤷']
 class TradesCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+
+        # Each feed remembers the newest trade in every league, so a poll only
+        # has to look at the latest transactions
+        self._fta_trade_feed = trades.AsyncTradeFeed(
+            account_identifier=cogConstants.FTAFFL_USER)
+        self._narffl_trade_feed = trades.AsyncTradeFeed(
+            account_identifier=cogConstants.NARFFL_USER,
+            platform_selection=common.PlatformSelection.FLEAFLICKER)
+        self._ff_discord_trade_feed = trades.AsyncTradeFeed(
+            account_identifier=cogConstants.FF_DISCORD_USER)
+
         if self._get_trade_posting_status_from_file(
                 FTA_TRADE_POSTING_STATUS_PATH):
             self.post_fta_trades.start()
@@ -176,9 +187,7 @@ class TradesCog(commands.Cog):
 
         if trade_channel is not None:
             try:
-                all_trades = await asyncio.to_thread(
-                    trades.fetch_and_filter_trades,
-                    account_identifier=cogConstants.FTAFFL_USER)
+                all_trades = await self._fta_trade_feed.get_new_trades()
             except:
                 # Because this is a periodic task, if there's an intermittent error we can just rely on the
                 # next task loop. But to make sure, let's log
@@ -187,7 +196,9 @@ class TradesCog(commands.Cog):
                     "Exception while retrieving trades, ending task run")
                 return
 
-            await self._post_all_unposted_trades(trade_channel, all_trades,
+            await self._post_all_unposted_trades(trade_channel,
+                                                 self._fta_trade_feed,
+                                                 all_trades,
                                                  FTA_POSTED_TRADES_PATH)
         else:
             cogCommon.print_descriptive_log("post_fta_trades",
@@ -249,10 +260,7 @@ class TradesCog(commands.Cog):
 
         if trade_channel is not None:
             try:
-                all_trades = await asyncio.to_thread(
-                    trades.fetch_and_filter_trades,
-                    account_identifier=cogConstants.NARFFL_USER,
-                    platform_selection=common.PlatformSelection.FLEAFLICKER)
+                all_trades = await self._narffl_trade_feed.get_new_trades()
             except Exception as error:
                 # Because this is a periodic task, if there's an intermittent error we can just rely on the
                 # next task loop. But to make sure, let's log
@@ -262,7 +270,9 @@ class TradesCog(commands.Cog):
                     str(error))
                 return
 
-            await self._post_all_unposted_trades(trade_channel, all_trades,
+            await self._post_all_unposted_trades(trade_channel,
+                                                 self._narffl_trade_feed,
+                                                 all_trades,
                                                  NARFFL_POSTED_TRADES_PATH)
         else:
             cogCommon.print_descriptive_log("post_narffl_trades",
@@ -326,9 +336,7 @@ class TradesCog(commands.Cog):
 
         if trade_channel is not None:
             try:
-                all_trades = await asyncio.to_thread(
-                    trades.fetch_and_filter_trades,
-                    account_identifier=cogConstants.FF_DISCORD_USER)
+                all_trades = await self._ff_discord_trade_feed.get_new_trades()
             except:
                 # Because this is a periodic task, if there's an intermittent error we can just rely on the
                 # next task loop. But to make sure, let's log
@@ -338,8 +346,8 @@ class TradesCog(commands.Cog):
                 return
 
             await self._post_all_unposted_trades(
-                trade_channel, all_trades, FF_DISCORD_POSTED_TRADES_PATH,
-                False)
+                trade_channel, self._ff_discord_trade_feed, all_trades,
+                FF_DISCORD_POSTED_TRADES_PATH, False)
         else:
             cogCommon.print_descriptive_log("post_ff_discord_trades",
                                             "No trade channel avaialble")
@@ -436,19 +444,28 @@ class TradesCog(commands.Cog):
 
     async def _post_all_unposted_trades(self,
                                         trade_channel: discord.TextChannel,
+                                        trade_feed: trades.AsyncTradeFeed,
                                         all_trades: List[Trade],
                                         posted_trade_file_path: str,
                                         should_react: bool = True):
         posted_trade_ids = self._get_posted_trade_ids_from_file(
             posted_trade_file_path)
 
-        for trade in all_trades:
-            if str(trade.id) not in posted_trade_ids:
-                message = await trade_channel.send(
-                    content=trades.format_trades([trade]))
-                if should_react:
-                    await self._react_to_trade(message, len(trade.details))
-                self._write_trade_to_file(posted_trade_file_path, trade)
+        try:
+            for trade in all_trades:
+                if str(trade.id) not in posted_trade_ids:
+                    message = await trade_channel.send(
+                        content=trades.format_trades([trade]))
+                    if should_react:
+                        await self._react_to_trade(message,
+                                                   len(trade.details))
+                    self._write_trade_to_file(posted_trade_file_path, trade)
+        except:
+            # The feed won't hand these trades out again, so have it go back
+            # through every season next run and let the posted trades file
+            # sort out what's already up
+            trade_feed.reset()
+            raise
 
     async def _react_to_trade(self, message: discord.Message, trade_size: int):
         if trade_size == 2:
@@ -14,6 +14,8 @@
    limitations under the License.
 """
 
+import asyncio
+
 from enum import Enum
 from typing import List
 
@@ -26,6 +28,23 @@ class PlatformSelection(Enum):
     FLEAFLICKER = 2
 
 
+async def create_async_platform(platform_selection: PlatformSelection,
+                                force_player_data_refresh: bool = False,
+                                fresh_player_statuses: bool = False):
+    # Imported here so the command-line scripts don't need aiohttp installed
+    from library.platforms.fleaflicker.asyncfleaflicker import AsyncFleaflicker
+    from library.platforms.sleeper.asyncsleeper import AsyncSleeper
+
+    # Sleeper loads its player data from disk or the API on construction, so
+    # keep that off of the event loop
+    if platform_selection == PlatformSelection.SLEEPER:
+        return await asyncio.to_thread(AsyncSleeper,
+                                       force_player_data_refresh,
+                                       fresh_player_statuses)
+    elif platform_selection == PlatformSelection.FLEAFLICKER:
+        return AsyncFleaflicker()
+
+
 def print_weekly_scores_with_header(scores: List[WeeklyScore],
                                     header_text: str,
                                     count: int = 1000):
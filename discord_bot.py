@@ -19,6 +19,7 @@ import traceback
 
 import cogs.constants
 import cogs.common
+import library.asynccommon as libAsyncCommon
 
 from discord import app_commands
 from discord.ext import commands
@@ -58,6 +59,10 @@ class DiscordBot(commands.Bot):
             except Exception:
                 print("Couldn't sync to server " + str(guild_id))
 
+    async def close(self):
+        await libAsyncCommon.close_async_http_sessions()
+        await super().close()
+
     async def on_ready(self):
         print(f'Logged in as {self.user} (ID: {self.user.id})')
         print('------')
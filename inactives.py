@@ -15,15 +15,24 @@
 """
 
 import argparse
+import asyncio
 import re
 import sys
 
 import common
 import library.common as libCommon
+import library.fanout as fanout
 
-from typing import List
+from typing import Dict, List
 
+from library.model.inactiveroster import InactiveRoster
+from library.model.league import League
 from library.model.leagueinactivity import LeagueInactivity
+from library.model.team import Team
+from library.model.transaction import Transaction
+from library.model.user import User
+from library.platforms.asyncplatform import AsyncPlatform
+from library.platforms.platform import Platform
 
 from library.platforms.fleaflicker.fleaflicker import Fleaflicker
 from library.platforms.sleeper.sleeper import Sleeper
@@ -56,6 +65,79 @@ def print_league_inactivity(leagues_with_inactivity: List[LeagueInactivity]):
             print("")
 
 
+def _get_league_inactivity(platform: Platform, league: League,
+                           inactive_rosters: List[InactiveRoster], user: User,
+                           year: int, include_transactions: bool,
+                           user_only: bool) -> LeagueInactivity:
+    inactive_rosters = _filter_inactive_rosters(inactive_rosters, user,
+                                                user_only)
+    if not inactive_rosters:
+        return None
+
+    most_recent_transaction_per_roster = None
+    if include_transactions:
+        most_recent_transaction_per_roster = platform.get_last_transaction_for_teams_in_league(
+            league, year)
+
+    return _create_league_inactivity(league, inactive_rosters,
+                                     most_recent_transaction_per_roster)
+
+
+async def _get_league_inactivity_async(
+        platform: AsyncPlatform, league: League, user: User, week: int,
+        year: int, include_transactions: bool, user_only: bool,
+        teams_to_ignore: List[str], only_teams: List[str],
+        player_names_to_ignore: List[str]) -> LeagueInactivity:
+    inactive_rosters = await platform.get_inactive_rosters_for_league_and_week(
+        league, week, year, teams_to_ignore, only_teams, player_names_to_ignore)
+
+    inactive_rosters = _filter_inactive_rosters(inactive_rosters, user,
+                                                user_only)
+    if not inactive_rosters:
+        return None
+
+    most_recent_transaction_per_roster = None
+    if include_transactions:
+        most_recent_transaction_per_roster = await platform.get_last_transaction_for_teams_in_league(
+            league, year)
+
+    return _create_league_inactivity(league, inactive_rosters,
+                                     most_recent_transaction_per_roster)
+
+
+# Shared by the sync and async paths, which only differ in how they go to the
+# platform
+def _filter_inactive_rosters(inactive_rosters: List[InactiveRoster],
+                             user: User,
+                             user_only: bool) -> List[InactiveRoster]:
+    if not user_only:
+        return inactive_rosters
+
+    # Filter list by the identifier user
+    return [r for r in inactive_rosters if r.team.manager.name == user.name]
+
+
+def _create_league_inactivity(
+        league: League, inactive_rosters: List[InactiveRoster],
+        most_recent_transaction_per_roster: Dict[Team, Transaction]
+) -> LeagueInactivity:
+    if most_recent_transaction_per_roster is not None:
+        for roster in inactive_rosters:
+            roster.last_transaction = most_recent_transaction_per_roster[
+                roster.team]
+
+    return LeagueInactivity(league, inactive_rosters)
+
+
+def _remove_leagues_without_inactivity(
+    all_league_inactivity: List[LeagueInactivity]
+) -> List[LeagueInactivity]:
+    return [
+        league_inactivity for league_inactivity in all_league_inactivity
+        if league_inactivity is not None
+    ]
+
+
 def get_all_league_inactivity(
     account_identifier: str,
     week: int,
@@ -67,43 +149,65 @@ def get_all_league_inactivity(
     only_teams: List[str] = [],
     player_names_to_ignore: List[str] = [],
     platform_selection: common.PlatformSelection = DEFAULT_PLATFORM,
+    max_workers: int = fanout.DEFAULT_MAX_WORKERS,
 ) -> List[LeagueInactivity]:
 
     # Set platform based on user choice
     if platform_selection == common.PlatformSelection.SLEEPER:
-        platform = Sleeper(force_player_data_refresh=True)
+        platform = Sleeper(fresh_player_statuses=True)
     elif platform_selection == common.PlatformSelection.FLEAFLICKER:
         platform = Fleaflicker()
 
     league_regex = re.compile(league_regex_string)
 
-    leagues_with_inactivity = []
-
     user = platform.get_admin_user_by_identifier(account_identifier)
     leagues = platform.get_all_leagues_for_user(user, year, league_regex)
 
-    for league in leagues:
-        inactive_rosters = platform.get_inactive_rosters_for_league_and_week(
-            league, week, year, teams_to_ignore, only_teams, player_names_to_ignore)
+    # Rosters for every league come back from one pass, so the platform can
+    # fetch everything they need in a single pool
+    inactive_rosters_per_league = platform.get_inactive_rosters_for_leagues_and_week(
+        leagues, week, year, teams_to_ignore, only_teams,
+        player_names_to_ignore, max_workers)
+
+    all_league_inactivity = fanout.fan_out(
+        _get_league_inactivity,
+        [(platform, league, inactive_rosters, user, year, include_transactions,
+          user_only) for league, inactive_rosters in zip(
+              leagues, inactive_rosters_per_league)], max_workers)
+
+    return _remove_leagues_without_inactivity(all_league_inactivity)
 
-        if user_only:
-            # Filter list by the identifier user
-            inactive_rosters[:] = [r for r in inactive_rosters if r.team.manager.name == user.name]
-        
-        if not inactive_rosters:
-            continue
 
-        if include_transactions:
-            most_recent_transaction_per_roster = platform.get_last_transaction_for_teams_in_league(
-                league, year)
+async def get_all_league_inactivity_async(
+    account_identifier: str,
+    week: int,
+    year: int = libCommon.DEFAULT_YEAR,
+    league_regex_string: str = DEFAULT_LEAGUE_REGEX_STRING,
+    include_transactions: bool = True,
+    user_only: bool = False,
+    teams_to_ignore: List[str] = [],
+    only_teams: List[str] = [],
+    player_names_to_ignore: List[str] = [],
+    platform_selection: common.PlatformSelection = DEFAULT_PLATFORM,
+) -> List[LeagueInactivity]:
+
+    platform = await common.create_async_platform(
+        platform_selection, fresh_player_statuses=True)
+
+    league_regex = re.compile(league_regex_string)
 
-            for roster in inactive_rosters:
-                roster.last_transaction = most_recent_transaction_per_roster[
-                    roster.team]
+    user = await platform.get_admin_user_by_identifier(account_identifier)
+    leagues = await platform.get_all_leagues_for_user(user, year, league_regex)
 
-        leagues_with_inactivity.append(LeagueInactivity(league, inactive_rosters))
+    all_league_inactivity = await asyncio.gather(*[
+        _get_league_inactivity_async(platform, league, user, week, year,
+                                     include_transactions, user_only,
+                                     teams_to_ignore, only_teams,
+                                     player_names_to_ignore)
+        for league in leagues
+    ])
 
-    return leagues_with_inactivity
+    return _remove_leagues_without_inactivity(all_league_inactivity)
 
 
 def parse_user_provided_flags() -> argparse.Namespace:
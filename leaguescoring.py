@@ -15,24 +15,37 @@
 """
 
 import argparse
+import asyncio
 import re
 import sys
 
 import common
 import library.common as libCommon
+import library.fanout as fanout
+import library.responsecache as responsecache
+import library.scorestore as scorestore
 
-from typing import List
+from typing import Callable, Dict, List, Optional
+
+from library.leaderboard import Leaderboard
+from library.model.league import League
 
 from library.model.seasonscore import SeasonScore
 from library.model.weeklyscore import WeeklyScore
 
+from library.platforms.asyncplatform import AsyncPlatform
 from library.platforms.fleaflicker.fleaflicker import Fleaflicker
+from library.platforms.platform import Platform
 from library.platforms.sleeper.sleeper import Sleeper
 
 
 DEFAULT_LEAGUE_REGEX_STRING = ".*"
 DEFAULT_PLATFORM = common.PlatformSelection.SLEEPER
 
+# Rows printed for each leaderboard when -wc or -sc isn't given. Called as a
+# library, a count of None keeps every score.
+DEFAULT_RESULT_COUNT = 5
+
 
 class ScoringResults(object):
     def __init__(self):
@@ -43,6 +56,163 @@ class ScoringResults(object):
         self.max_season_scores: List[SeasonScore] = []
         self.min_season_scores: List[SeasonScore] = []
 
+        # Best single week in each league, sorted by league name
+        self.top_weekly_score_per_league: List[WeeklyScore] = []
+
+
+# The overall results for every league that was pulled, plus the results for
+# each named subset of those leagues
+class PartitionedScoringResults(object):
+    def __init__(self, overall: ScoringResults,
+                 partitions: Dict[str, ScoringResults]):
+        self.overall = overall
+        self.partitions = partitions
+
+
+# Folds scores in as each league and week comes back, keeping only the
+# leaderboards the flags ask for and only as many rows as will be shown.
+# Batches are numbered in league/week order, so ties come out the same as
+# sorting every score at once would have left them.
+class ScoringAggregator(object):
+    def __init__(self,
+                 ending_week: int,
+                 get_weekly_results: bool,
+                 get_current_weeks_results: bool,
+                 get_season_results: bool,
+                 get_max_scores: bool,
+                 get_min_scores: bool,
+                 weekly_count: Optional[int],
+                 season_count: Optional[int],
+                 get_top_score_per_league: bool = False):
+        self.ending_week = ending_week
+
+        def create_leaderboard(enabled: bool, count: Optional[int],
+                               highest_first: bool) -> Optional[Leaderboard]:
+            if not enabled:
+                return None
+            return Leaderboard(count, lambda score: score.score, highest_first)
+
+        self.max_weekly_scores = create_leaderboard(
+            get_weekly_results and get_max_scores, weekly_count, True)
+        self.min_weekly_scores = create_leaderboard(
+            get_weekly_results and get_min_scores, weekly_count, False)
+        self.max_scores_this_week = create_leaderboard(
+            get_current_weeks_results and get_max_scores, weekly_count, True)
+        self.min_scores_this_week = create_leaderboard(
+            get_current_weeks_results and get_min_scores, weekly_count, False)
+        self.max_season_scores = create_leaderboard(
+            get_season_results and get_max_scores, season_count, True)
+        self.min_season_scores = create_leaderboard(
+            get_season_results and get_min_scores, season_count, False)
+
+        # A one-row leaderboard per league, created as each league turns up
+        self.league_id_to_top_score: Optional[Dict[str, Leaderboard]] = (
+            {} if get_top_score_per_league else None)
+
+    def add_weekly_scores(self, weekly_scores: List[WeeklyScore],
+                          batch_index: int):
+        for position, weekly_score in enumerate(weekly_scores):
+            order = (batch_index, position)
+
+            for leaderboard in (self.max_weekly_scores,
+                                self.min_weekly_scores):
+                if leaderboard is not None:
+                    leaderboard.add(weekly_score, order)
+
+            if weekly_score.week == self.ending_week:
+                for leaderboard in (self.max_scores_this_week,
+                                    self.min_scores_this_week):
+                    if leaderboard is not None:
+                        leaderboard.add(weekly_score, order)
+
+            if self.league_id_to_top_score is not None:
+                league_id = weekly_score.league.league_id
+                if league_id not in self.league_id_to_top_score:
+                    self.league_id_to_top_score[league_id] = Leaderboard(
+                        1, lambda score: score.score)
+                self.league_id_to_top_score[league_id].add(weekly_score, order)
+
+    def add_season_scores(self, season_scores: List[SeasonScore],
+                          batch_index: int):
+        for position, season_score in enumerate(season_scores):
+            order = (batch_index, position)
+
+            for leaderboard in (self.max_season_scores,
+                                self.min_season_scores):
+                if leaderboard is not None:
+                    leaderboard.add(season_score, order)
+
+    def get_results(self) -> ScoringResults:
+        results = ScoringResults()
+
+        if self.max_weekly_scores is not None:
+            results.max_weekly_scores = self.max_weekly_scores.get_results()
+        if self.min_weekly_scores is not None:
+            results.min_weekly_scores = self.min_weekly_scores.get_results()
+        if self.max_scores_this_week is not None:
+            results.max_scores_this_week = (
+                self.max_scores_this_week.get_results())
+        if self.min_scores_this_week is not None:
+            results.min_scores_this_week = (
+                self.min_scores_this_week.get_results())
+        if self.max_season_scores is not None:
+            results.max_season_scores = self.max_season_scores.get_results()
+        if self.min_season_scores is not None:
+            results.min_season_scores = self.min_season_scores.get_results()
+        if self.league_id_to_top_score is not None:
+            results.top_weekly_score_per_league = sorted(
+                [
+                    leaderboard.get_results()[0]
+                    for leaderboard in self.league_id_to_top_score.values()
+                ],
+                key=lambda weekly_score: weekly_score.league.name)
+
+        return results
+
+
+# Hands each league's scores to the overall aggregator and to the aggregator
+# for every partition whose regex matches the league's name
+class PartitionedScoringAggregator(object):
+    def __init__(self, leagues: List[League],
+                 partition_regex_strings: Dict[str, str],
+                 create_aggregator: Callable[[], ScoringAggregator]):
+        self.overall = create_aggregator()
+        self.partitions = {
+            name: create_aggregator()
+            for name in partition_regex_strings
+        }
+
+        self.league_id_to_aggregators: Dict[str, List[ScoringAggregator]] = {}
+        partition_regexes = {
+            name: re.compile(regex_string)
+            for name, regex_string in partition_regex_strings.items()
+        }
+        for league in leagues:
+            self.league_id_to_aggregators[league.league_id] = [
+                self.overall
+            ] + [
+                self.partitions[name]
+                for name, regex in partition_regexes.items()
+                if regex.match(league.name)
+            ]
+
+    def add_weekly_scores(self, league: League,
+                          weekly_scores: List[WeeklyScore], batch_index: int):
+        for aggregator in self.league_id_to_aggregators[league.league_id]:
+            aggregator.add_weekly_scores(weekly_scores, batch_index)
+
+    def add_season_scores(self, league: League,
+                          season_scores: List[SeasonScore], batch_index: int):
+        for aggregator in self.league_id_to_aggregators[league.league_id]:
+            aggregator.add_season_scores(season_scores, batch_index)
+
+    def get_results(self) -> PartitionedScoringResults:
+        return PartitionedScoringResults(
+            self.overall.get_results(), {
+                name: aggregator.get_results()
+                for name, aggregator in self.partitions.items()
+            })
+
 
 def get_scoring_results(
     account_identifier: str,
@@ -56,80 +226,272 @@ def get_scoring_results(
     year: int = libCommon.DEFAULT_YEAR,
     league_regex_string: str = DEFAULT_LEAGUE_REGEX_STRING,
     platform_selection: common.PlatformSelection = DEFAULT_PLATFORM,
+    max_workers: int = fanout.DEFAULT_MAX_WORKERS,
+    weekly_count: Optional[int] = None,
+    season_count: Optional[int] = None
 ) -> ScoringResults:
+    return get_partitioned_scoring_results(
+        account_identifier, starting_week, ending_week, {},
+        get_weekly_results, get_current_weeks_results, get_season_results,
+        get_max_scores, get_min_scores, year, league_regex_string,
+        platform_selection, max_workers, weekly_count, season_count).overall
+
+
+async def get_scoring_results_async(
+    account_identifier: str,
+    starting_week: int,
+    ending_week: int,
+    get_weekly_results: bool,
+    get_current_weeks_results: bool,
+    get_season_results: bool,
+    get_max_scores: bool,
+    get_min_scores: bool,
+    year: int = libCommon.DEFAULT_YEAR,
+    league_regex_string: str = DEFAULT_LEAGUE_REGEX_STRING,
+    platform_selection: common.PlatformSelection = DEFAULT_PLATFORM,
+    weekly_count: Optional[int] = None,
+    season_count: Optional[int] = None
+) -> ScoringResults:
+    return (await get_partitioned_scoring_results_async(
+        account_identifier, starting_week, ending_week, {},
+        get_weekly_results, get_current_weeks_results, get_season_results,
+        get_max_scores, get_min_scores, year, league_regex_string,
+        platform_selection, weekly_count, season_count)).overall
+
+
+# Pulls every league matching league_regex_string once and builds results for
+# all of them together and for each named partition of them, so several
+# leaderboards can be cut from the same fetches
+def get_partitioned_scoring_results(
+    account_identifier: str,
+    starting_week: int,
+    ending_week: int,
+    partition_regex_strings: Dict[str, str],
+    get_weekly_results: bool,
+    get_current_weeks_results: bool,
+    get_season_results: bool,
+    get_max_scores: bool,
+    get_min_scores: bool,
+    year: int = libCommon.DEFAULT_YEAR,
+    league_regex_string: str = DEFAULT_LEAGUE_REGEX_STRING,
+    platform_selection: common.PlatformSelection = DEFAULT_PLATFORM,
+    max_workers: int = fanout.DEFAULT_MAX_WORKERS,
+    weekly_count: Optional[int] = None,
+    season_count: Optional[int] = None,
+    get_top_score_per_league: bool = False
+) -> PartitionedScoringResults:
 
-    # Lists containing the raw data from the backend
-    weekly_scores = []
-    season_scores = []
-    results = ScoringResults()
-    
     # Set platform based on user choice
     if platform_selection == common.PlatformSelection.SLEEPER:
         platform = Sleeper()
     elif platform_selection == common.PlatformSelection.FLEAFLICKER:
         platform = Fleaflicker()
 
-    find_weekly = get_weekly_results or get_current_weeks_results
-    find_max_this_week = get_max_scores and get_current_weeks_results
-    find_min_this_week = get_min_scores and get_current_weeks_results
-    find_max_weekly = get_weekly_results and get_max_scores
-    find_min_weekly = get_weekly_results and get_min_scores
+    find_weekly = (get_weekly_results or get_current_weeks_results
+                   or get_top_score_per_league)
     find_season = get_season_results
-    find_max_season = get_season_results and get_max_scores
-    find_min_season = get_season_results and get_min_scores
 
     user = platform.get_admin_user_by_identifier(account_identifier)
     leagues = platform.get_all_leagues_for_user(user, year, re.compile(league_regex_string))
 
-    for league in leagues:
-        # Iterate over each indiviudal week, since we need to grab the max weekly score for the league
-        if find_weekly:
-            for week_num in range(starting_week, ending_week + 1):
-                weekly_scores.extend(
-                    platform.get_weekly_scores_for_league_and_week(
-                        league, week_num, year))
+    aggregator = PartitionedScoringAggregator(
+        leagues, partition_regex_strings, lambda: ScoringAggregator(
+            ending_week, get_weekly_results, get_current_weeks_results,
+            get_season_results, get_max_scores, get_min_scores, weekly_count,
+            season_count, get_top_score_per_league))
+
+    # Closed weeks and finished seasons come out of the score store. Everything
+    # else is independent, so fetch it all concurrently and fold each one in
+    # as soon as it's back.
+    store_platform = platform_selection.name.lower()
 
-        if find_season:
-            # Grab the points-for in each league
-            season_scores.extend(
-                platform.get_season_scores_for_league(league, year))
+    if find_weekly:
+        league_weeks = [(league, week_num, year) for league in leagues
+                        for week_num in range(starting_week, ending_week + 1)]
+        stored_weekly_scores = scorestore.lookup_weekly_scores(
+            store_platform, leagues, year, starting_week, ending_week)
+
+        unstored_indexes = []
+        for index, (league, week_num, _) in enumerate(league_weeks):
+            league_week_scores = stored_weekly_scores.get(
+                (league.league_id, week_num))
+            if league_week_scores is None:
+                unstored_indexes.append(index)
+            else:
+                aggregator.add_weekly_scores(league, league_week_scores,
+                                             index)
+
+        for unstored_index, league_week_scores in fanout.fan_out_as_completed(
+                _get_and_store_weekly_scores,
+            [(platform, store_platform) + league_weeks[index]
+             for index in unstored_indexes], max_workers):
+            index = unstored_indexes[unstored_index]
+            aggregator.add_weekly_scores(league_weeks[index][0],
+                                         league_week_scores, index)
 
-    # Sort all of the lists
     if find_season:
-        max_season_scores = season_scores.copy()
-        max_season_scores.sort(
-            key=lambda annual_score: annual_score.score, reverse=True)
-        min_season_scores = season_scores.copy()
-        min_season_scores.sort(
-            key=lambda annual_score: annual_score.score)
+        # Grab the points-for in each league
+        stored_season_scores = scorestore.lookup_season_scores(
+            store_platform, leagues, year)
+
+        unstored_indexes = []
+        for index, league in enumerate(leagues):
+            league_season_scores = stored_season_scores.get(league.league_id)
+            if league_season_scores is None:
+                unstored_indexes.append(index)
+            else:
+                aggregator.add_season_scores(league, league_season_scores,
+                                             index)
+
+        for unstored_index, league_season_scores in fanout.fan_out_as_completed(
+                _get_and_store_season_scores,
+            [(platform, store_platform, leagues[index], year)
+             for index in unstored_indexes], max_workers):
+            index = unstored_indexes[unstored_index]
+            aggregator.add_season_scores(leagues[index], league_season_scores,
+                                         index)
+
+    return aggregator.get_results()
+
+
+async def get_partitioned_scoring_results_async(
+    account_identifier: str,
+    starting_week: int,
+    ending_week: int,
+    partition_regex_strings: Dict[str, str],
+    get_weekly_results: bool,
+    get_current_weeks_results: bool,
+    get_season_results: bool,
+    get_max_scores: bool,
+    get_min_scores: bool,
+    year: int = libCommon.DEFAULT_YEAR,
+    league_regex_string: str = DEFAULT_LEAGUE_REGEX_STRING,
+    platform_selection: common.PlatformSelection = DEFAULT_PLATFORM,
+    weekly_count: Optional[int] = None,
+    season_count: Optional[int] = None,
+    get_top_score_per_league: bool = False
+) -> PartitionedScoringResults:
+
+    platform = await common.create_async_platform(platform_selection)
+
+    find_weekly = (get_weekly_results or get_current_weeks_results
+                   or get_top_score_per_league)
+    find_season = get_season_results
+
+    user = await platform.get_admin_user_by_identifier(account_identifier)
+    leagues = await platform.get_all_leagues_for_user(user, year, re.compile(league_regex_string))
+
+    aggregator = PartitionedScoringAggregator(
+        leagues, partition_regex_strings, lambda: ScoringAggregator(
+            ending_week, get_weekly_results, get_current_weeks_results,
+            get_season_results, get_max_scores, get_min_scores, weekly_count,
+            season_count, get_top_score_per_league))
+
+    store_platform = platform_selection.name.lower()
+
+    async def add_weekly_scores(league: League, week_num: int, index: int):
+        aggregator.add_weekly_scores(
+            league, await _get_and_store_weekly_scores_async(
+                platform, store_platform, league, week_num, year), index)
+
+    async def add_season_scores(league: League, index: int):
+        aggregator.add_season_scores(
+            league, await _get_and_store_season_scores_async(
+                platform, store_platform, league, year), index)
+
     if find_weekly:
-        max_weekly_scores = weekly_scores.copy()
-        max_weekly_scores.sort(key=lambda weekly_score: weekly_score.score,
-                               reverse=True)
-        min_weekly_scores = weekly_scores.copy()
-        min_weekly_scores.sort(key=lambda weekly_score: weekly_score.score)
-        max_scores_this_week = list(
-            filter(lambda weekly_score: weekly_score.week == ending_week,
-                   max_weekly_scores.copy()))
-        min_scores_this_week = list(
-            filter(lambda weekly_score: weekly_score.week == ending_week,
-                   min_weekly_scores.copy()))
-
-    # Construct the results object based on the specified flags
-    if find_max_this_week:
-        results.max_scores_this_week = max_scores_this_week
-    if find_min_this_week:
-        results.min_scores_this_week = min_scores_this_week
-    if find_max_weekly:
-        results.max_weekly_scores = max_weekly_scores
-    if find_min_weekly:
-        results.min_weekly_scores = min_weekly_scores
-    if find_max_season:
-        results.max_season_scores = max_season_scores
-    if find_min_season:
-        results.min_season_scores = min_season_scores
-
-    return results
+        league_weeks = [(league, week_num) for league in leagues
+                        for week_num in range(starting_week, ending_week + 1)]
+        stored_weekly_scores = await asyncio.to_thread(
+            scorestore.lookup_weekly_scores, store_platform, leagues, year,
+            starting_week, ending_week)
+
+        unstored_league_weeks = []
+        for index, (league, week_num) in enumerate(league_weeks):
+            league_week_scores = stored_weekly_scores.get(
+                (league.league_id, week_num))
+            if league_week_scores is None:
+                unstored_league_weeks.append((league, week_num, index))
+            else:
+                aggregator.add_weekly_scores(league, league_week_scores,
+                                             index)
+
+        await asyncio.gather(*[
+            add_weekly_scores(league, week_num, index)
+            for league, week_num, index in unstored_league_weeks
+        ])
+
+    if find_season:
+        stored_season_scores = await asyncio.to_thread(
+            scorestore.lookup_season_scores, store_platform, leagues, year)
+
+        unstored_leagues = []
+        for index, league in enumerate(leagues):
+            league_season_scores = stored_season_scores.get(league.league_id)
+            if league_season_scores is None:
+                unstored_leagues.append((league, index))
+            else:
+                aggregator.add_season_scores(league, league_season_scores,
+                                             index)
+
+        await asyncio.gather(*[
+            add_season_scores(league, index)
+            for league, index in unstored_leagues
+        ])
+
+    return aggregator.get_results()
+
+
+def _get_and_store_weekly_scores(platform: Platform, store_platform: str,
+                                 league: League, week: int,
+                                 year: int) -> List[WeeklyScore]:
+    weekly_scores = platform.get_weekly_scores_for_league_and_week(
+        league, week, year)
+
+    if weekly_scores and platform.is_week_complete(league, week, year):
+        scorestore.store_weekly_scores(store_platform, league, year, week,
+                                       weekly_scores)
+
+    return weekly_scores
+
+
+def _get_and_store_season_scores(platform: Platform, store_platform: str,
+                                 league: League,
+                                 year: int) -> List[SeasonScore]:
+    season_scores = platform.get_season_scores_for_league(league, year)
+
+    if season_scores and platform.is_season_complete(league, year):
+        scorestore.store_season_scores(store_platform, league, year,
+                                       season_scores)
+
+    return season_scores
+
+
+async def _get_and_store_weekly_scores_async(platform: AsyncPlatform,
+                                             store_platform: str,
+                                             league: League, week: int,
+                                             year: int) -> List[WeeklyScore]:
+    weekly_scores = await platform.get_weekly_scores_for_league_and_week(
+        league, week, year)
+
+    if weekly_scores and await platform.is_week_complete(league, week, year):
+        await asyncio.to_thread(scorestore.store_weekly_scores, store_platform,
+                                league, year, week, weekly_scores)
+
+    return weekly_scores
+
+
+async def _get_and_store_season_scores_async(platform: AsyncPlatform,
+                                             store_platform: str,
+                                             league: League,
+                                             year: int) -> List[SeasonScore]:
+    season_scores = await platform.get_season_scores_for_league(league, year)
+
+    if season_scores and await platform.is_season_complete(league, year):
+        await asyncio.to_thread(scorestore.store_season_scores, store_platform,
+                                league, year, season_scores)
+
+    return season_scores
 
 
 def parse_user_provided_flags() -> argparse.Namespace:
@@ -140,13 +502,13 @@ def parse_user_provided_flags() -> argparse.Namespace:
         "--weekly_count",
         help="number of weekly data points to display (default: 5)",
         type=int,
-        default=5)
+        default=DEFAULT_RESULT_COUNT)
     parser.add_argument(
         "-sc",
         "--season_count",
         help="number of season data points to display (default: 5)",
         type=int,
-        default=5)
+        default=DEFAULT_RESULT_COUNT)
     parser.add_argument(
         "-y",
         "--year",
@@ -159,6 +521,11 @@ def parse_user_provided_flags() -> argparse.Namespace:
         help="Regular expression used to select which leagues to analyze",
         type=str,
         default=DEFAULT_LEAGUE_REGEX_STRING)
+    parser.add_argument(
+        "--refresh-stored-scores",
+        dest="refresh_stored_scores",
+        action="store_true",
+        help="Drop the stored scores for these weeks and season and fetch them again")
     group = parser.add_mutually_exclusive_group()
     group.add_argument("--max",
                        dest="max",
@@ -250,8 +617,14 @@ def main(argv):
     seasonal_score_output_count = args.season_count
     platform_selection = args.platform_selection
 
+    if args.refresh_stored_scores:
+        scorestore.delete_scores(platform_selection.name.lower(), year,
+                                 starting_week, ending_week)
+
     results = get_scoring_results(identifier, starting_week, ending_week, get_weekly,
-                                  get_current_week, get_season, get_max, get_min, year, league_regex_string, platform_selection)
+                                  get_current_week, get_season, get_max, get_min, year, league_regex_string, platform_selection,
+                                  weekly_count=weekly_score_output_count,
+                                  season_count=seasonal_score_output_count)
 
     # Print out the results
     this_week_template = "{main_header}, Week {week_num}"
@@ -284,6 +657,8 @@ def main(argv):
             results.min_season_scores, "LOWEST POINTS-FOR THIS SEASON",
             seasonal_score_output_count)
 
+    print(responsecache.format_cache_statistics())
+
 
 if __name__ == "__main__":
     main(sys.argv[1:])
@@ -0,0 +1,150 @@
+"""
+   Copyright 2026 Kevin Emery
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import aiohttp
+import asyncio
+import copy
+
+from typing import Dict, Tuple
+
+from . import common
+from . import ratelimiter
+from . import responsecache
+
+# The async client can have far more requests in flight than the thread pools,
+# since an outstanding request only costs a socket and not a thread.
+DEFAULT_ASYNC_POOL_SIZE = 32
+
+_async_pool_size = DEFAULT_ASYNC_POOL_SIZE
+
+# aiohttp sessions are bound to the event loop they were created on
+_loop_to_session: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+# Requests currently on the wire, keyed by loop and URL
+_in_flight_requests: Dict[Tuple[asyncio.AbstractEventLoop, str],
+                          asyncio.Task] = {}
+
+
+def configure_async_http_sessions(pool_size: int = DEFAULT_ASYNC_POOL_SIZE):
+    global _async_pool_size
+    _async_pool_size = pool_size
+
+
+async def close_async_http_sessions():
+    session = _loop_to_session.pop(asyncio.get_running_loop(), None)
+
+    if session is not None:
+        await session.close()
+
+
+def _get_session_for_running_loop() -> aiohttp.ClientSession:
+    loop = asyncio.get_running_loop()
+    session = _loop_to_session.get(loop)
+
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit_per_host=_async_pool_size)
+        timeout = aiohttp.ClientTimeout(total=common.REQUEST_TIMEOUT_SECONDS)
+        session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        _loop_to_session[loop] = session
+
+    return session
+
+
+async def _make_get_request_with_logging(
+        request_url: str,
+        should_retry: bool = True,
+        ttl: responsecache.TTLPolicy = responsecache.BYPASS):
+    # Cache entries live on disk, so read them on a thread to keep the loop free
+    cached_response = await asyncio.to_thread(responsecache.lookup,
+                                              request_url, ttl)
+    if cached_response is not None:
+        return cached_response
+
+    # Concurrent callers for the same URL on this loop share a single request.
+    # Shielding keeps one caller being cancelled from cancelling it for the rest.
+    loop = asyncio.get_running_loop()
+    in_flight_key = (loop, request_url)
+    in_flight_task = _in_flight_requests.get(in_flight_key)
+
+    if in_flight_task is None:
+        in_flight_task = loop.create_task(
+            _make_cached_request(request_url, should_retry, ttl))
+        _in_flight_requests[in_flight_key] = in_flight_task
+        in_flight_task.add_done_callback(
+            lambda _: _in_flight_requests.pop(in_flight_key, None))
+
+    # Callers are free to modify what they get back, so each one gets its own
+    # copy of the shared response
+    return copy.deepcopy(await asyncio.shield(in_flight_task))
+
+
+async def _make_cached_request(request_url: str, should_retry: bool,
+                               ttl: responsecache.TTLPolicy):
+    response_json = await _make_uncached_get_request_with_logging(
+        request_url, should_retry)
+    await asyncio.to_thread(responsecache.store, request_url, ttl,
+                            response_json)
+
+    return response_json
+
+
+async def _make_uncached_get_request_with_logging(request_url: str,
+                                                  should_retry: bool = True):
+    # The rate limiter is shared with the synchronous client, so the bot and any
+    # scripts running in the same process draw from one budget per host
+    rate_limiter = ratelimiter.get_rate_limiter_for_url(request_url)
+
+    for attempt in range(ratelimiter.MAX_ATTEMPTS):
+        retry_after_seconds = None
+        throttled = False
+
+        try:
+            await rate_limiter.acquire_async()
+
+            congested = True
+            try:
+                session = _get_session_for_running_loop()
+                async with session.get(request_url) as response:
+                    status = response.status
+                    throttled = ratelimiter.is_throttled_status(status)
+                    congested = throttled
+                    if throttled:
+                        retry_after_seconds = ratelimiter.parse_retry_after(
+                            response.headers.get("Retry-After"))
+                    else:
+                        # Don't trust the content type header, parse whatever comes back
+                        response_json = await response.json(content_type=None)
+            finally:
+                rate_limiter.release(congested, retry_after_seconds)
+
+            if throttled:
+                raise Exception("Request to {url} failed with status {status}".format(url=request_url, status=status))
+            if response_json is None:
+                raise Exception("Request to {url} came back with an empty response. Failing".format(url=request_url))
+            return response_json
+        except Exception as e:
+            print("Request URL: {url}".format(url=request_url))
+            print("Exception: {e}".format(e=e))
+
+            # Give another go for the failed request, in hopes that it's transient.
+            # A host telling us to slow down always gets retried once we have.
+            if attempt + 1 < ratelimiter.MAX_ATTEMPTS and (should_retry
+                                                           or throttled):
+                delay = ratelimiter.get_backoff_delay(attempt,
+                                                      retry_after_seconds)
+                print("Retrying failed request in {delay:.1f} seconds".format(
+                    delay=delay))
+                await asyncio.sleep(delay)
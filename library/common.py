@@ -14,9 +14,19 @@
    limitations under the License.
 """
 
+import copy
 import requests
+import threading
 import time
 
+from requests.adapters import HTTPAdapter
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+from . import jsonstream
+from . import ratelimiter
+from . import responsecache
+
 DEC_31_1999_SECONDS = 946684800
 DEFAULT_YEAR = 2026
 
@@ -43,18 +53,249 @@ TEAMS_ON_BYE = {
 }
 
 
-def _make_get_request_with_logging(request_url: str, should_retry: bool = True):
+# Connection pooling settings. Each host gets its own session, and the pool size
+# is the number of keep-alive connections held open to that host. Keep this at or
+# above the number of threads making requests concurrently.
+DEFAULT_POOL_SIZE = 16
+REQUEST_TIMEOUT_SECONDS = 30
+
+# How much of a streamed response body is read at a time
+STREAM_CHUNK_SIZE_BYTES = 64 * 1024
+
+_pool_size = DEFAULT_POOL_SIZE
+_keep_alive = True
+_host_to_session: Dict[str, requests.Session] = {}
+_session_lock = threading.Lock()
+
+
+def configure_http_sessions(pool_size: int = DEFAULT_POOL_SIZE,
+                            keep_alive: bool = True):
+    global _pool_size, _keep_alive
+
+    with _session_lock:
+        _pool_size = pool_size
+        _keep_alive = keep_alive
+
+        # Existing sessions were built with the old settings, drop them so the
+        # next request for each host picks up the new ones
+        for session in _host_to_session.values():
+            session.close()
+        _host_to_session.clear()
+
+
+def close_http_sessions():
+    with _session_lock:
+        for session in _host_to_session.values():
+            session.close()
+        _host_to_session.clear()
+
+
+def _get_session_for_url(request_url: str) -> requests.Session:
+    host = urlsplit(request_url).netloc
+
+    with _session_lock:
+        if host not in _host_to_session:
+            _host_to_session[host] = _create_session()
+
+        return _host_to_session[host]
+
+
+def _create_session() -> requests.Session:
+    session = requests.Session()
+
+    # Sessions are already per-host, so a single pool with room for every
+    # concurrent caller is all we need
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    if not _keep_alive:
+        session.headers["Connection"] = "close"
+
+    return session
+
+
+class _InFlightRequest(object):
+    def __init__(self):
+        self.finished = threading.Event()
+        self.response_json = None
+        self.exception = None
+
+
+# Requests currently on the wire, keyed by URL. Concurrent callers asking for a
+# URL that's already in flight wait on that request instead of sending their own.
+_url_to_in_flight_request: Dict[str, _InFlightRequest] = {}
+_in_flight_lock = threading.Lock()
+
+
+def _make_get_request_with_logging(
+        request_url: str,
+        should_retry: bool = True,
+        ttl: responsecache.TTLPolicy = responsecache.BYPASS):
+    cached_response = responsecache.lookup(request_url, ttl)
+    if cached_response is not None:
+        return cached_response
+
+    with _in_flight_lock:
+        in_flight_request = _url_to_in_flight_request.get(request_url)
+        is_leader = in_flight_request is None
+
+        if is_leader:
+            in_flight_request = _InFlightRequest()
+            _url_to_in_flight_request[request_url] = in_flight_request
+
+    # Callers are free to modify what they get back, so each one waiting on the
+    # request gets its own copy of the response
+    if not is_leader:
+        in_flight_request.finished.wait()
+
+        if in_flight_request.exception is not None:
+            raise in_flight_request.exception
+        return copy.deepcopy(in_flight_request.response_json)
+
     try:
-        response = requests.get(request_url)
-        if response.json() is None:
-            raise Exception("Request to {url} came back with an empty response. Failing".format(url=request_url))
-        return response.json()
+        response_json = _make_uncached_get_request_with_logging(
+            request_url, should_retry)
+        responsecache.store(request_url, ttl, response_json)
+        in_flight_request.response_json = copy.deepcopy(response_json)
     except Exception as e:
-        print("Request URL: {url}".format(url=request_url))
-        print("Exception: {e}".format(e=e))
-
-        # Give another go for the failed request, in hopes that it's transient
-        if should_retry:
-            print("Retrying failed request")
-            time.sleep(15)
-            return _make_get_request_with_logging(request_url, False)
+        in_flight_request.exception = e
+        raise
+    finally:
+        with _in_flight_lock:
+            del _url_to_in_flight_request[request_url]
+        in_flight_request.finished.set()
+
+    return response_json
+
+
+def _make_uncached_get_request_with_logging(request_url: str,
+                                            should_retry: bool = True):
+    return _make_get_request_with_retries(request_url, should_retry,
+                                          _parse_json_response)
+
+
+# For responses too big to hold in memory at once. Yields the key and value of
+# each member of the top-level JSON object as it arrives, and skips the cache.
+def _make_streaming_get_request_with_logging(
+        request_url: str) -> Iterator[Tuple[str, Any]]:
+    response = _make_get_request_with_retries(request_url,
+                                              True,
+                                              lambda response: response,
+                                              stream=True)
+    if response is None:
+        raise Exception("Request to {url} failed, nothing to stream".format(
+            url=request_url))
+
+    yield from _iter_streamed_response(response)
+
+
+# Response headers that identify a version of a resource, and the request
+# headers that send each of them back to ask whether it's changed
+VALIDATOR_HEADER_TO_CONDITIONAL_HEADER = {
+    "ETag": "If-None-Match",
+    "Last-Modified": "If-Modified-Since"
+}
+NOT_MODIFIED_STATUS = 304
+
+
+# Same as above, but sends the validators from an earlier response so the host
+# can skip the body if nothing has changed. Returns None when it has skipped
+# it, otherwise the new validators and the streamed items. A host that ignores
+# the validators sends the full body every time.
+def _make_conditional_streaming_get_request_with_logging(
+    request_url: str, validators: Dict[str, str]
+) -> Optional[Tuple[Dict[str, str], Iterator[Tuple[str, Any]]]]:
+    headers = {
+        VALIDATOR_HEADER_TO_CONDITIONAL_HEADER[header]: value
+        for header, value in validators.items()
+        if header in VALIDATOR_HEADER_TO_CONDITIONAL_HEADER
+    }
+
+    response = _make_get_request_with_retries(request_url,
+                                              True,
+                                              lambda response: response,
+                                              stream=True,
+                                              headers=headers)
+    if response is None:
+        raise Exception("Request to {url} failed, nothing to stream".format(
+            url=request_url))
+
+    if response.status_code == NOT_MODIFIED_STATUS:
+        response.close()
+        return None
+
+    new_validators = {
+        header: response.headers[header]
+        for header in VALIDATOR_HEADER_TO_CONDITIONAL_HEADER
+        if header in response.headers
+    }
+
+    return new_validators, _iter_streamed_response(response)
+
+
+def _iter_streamed_response(
+        response: requests.Response) -> Iterator[Tuple[str, Any]]:
+    with response:
+        yield from jsonstream.iter_object_items(
+            response.iter_content(chunk_size=STREAM_CHUNK_SIZE_BYTES))
+
+
+def _parse_json_response(response: requests.Response):
+    response_json = response.json()
+    if response_json is None:
+        raise Exception("Request to {url} came back with an empty response. Failing".format(url=response.url))
+    return response_json
+
+
+def _make_get_request_with_retries(request_url: str,
+                                   should_retry: bool,
+                                   read_response: Callable[[requests.Response],
+                                                           Any],
+                                   stream: bool = False,
+                                   headers: Dict[str, str] = None):
+    rate_limiter = ratelimiter.get_rate_limiter_for_url(request_url)
+
+    for attempt in range(ratelimiter.MAX_ATTEMPTS):
+        retry_after_seconds = None
+        throttled = False
+
+        try:
+            rate_limiter.acquire()
+
+            # Anything that keeps us from getting a response counts as the host
+            # being overloaded for the limiter until we see otherwise
+            congested = True
+            try:
+                session = _get_session_for_url(request_url)
+                response = session.get(request_url,
+                                       timeout=REQUEST_TIMEOUT_SECONDS,
+                                       stream=stream,
+                                       headers=headers)
+                throttled = ratelimiter.is_throttled_status(
+                    response.status_code)
+                congested = throttled
+                if throttled:
+                    retry_after_seconds = ratelimiter.parse_retry_after(
+                        response.headers.get("Retry-After"))
+                    response.close()
+            finally:
+                rate_limiter.release(congested, retry_after_seconds)
+
+            if throttled:
+                raise Exception("Request to {url} failed with status {status}".format(url=request_url, status=response.status_code))
+
+            return read_response(response)
+        except Exception as e:
+            print("Request URL: {url}".format(url=request_url))
+            print("Exception: {e}".format(e=e))
+
+            # Give another go for the failed request, in hopes that it's transient.
+            # A host telling us to slow down always gets retried once we have.
+            if attempt + 1 < ratelimiter.MAX_ATTEMPTS and (should_retry
+                                                           or throttled):
+                delay = ratelimiter.get_backoff_delay(attempt,
+                                                      retry_after_seconds)
+                print("Retrying failed request in {delay:.1f} seconds".format(
+                    delay=delay))
+                time.sleep(delay)
@@ -0,0 +1,71 @@
+"""
+   Copyright 2026 Kevin Emery
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+from typing import List
+
+# Picks from drafts that have finished, which can never change. Each draft is
+# one small file of rows, so a rerun of something like ADP only goes to the
+# network for drafts that are new or still going. What goes in a row is up to
+# the platform, as long as it's plain JSON.
+
+# Directory is relative to the directory where script is run
+DRAFT_PICK_STORE_DIRECTORY_PATH = "./data/draft_picks"
+
+
+def lookup(draft_key: str) -> List[list]:
+    # Returns the stored rows, or None if the draft hasn't been stored
+    file_path = _get_file_path_for_draft_key(draft_key)
+
+    if not os.path.exists(file_path):
+        return None
+
+    try:
+        with open(file_path, "r") as file:
+            entry = json.load(file)
+    except (OSError, ValueError):
+        # Treat a corrupt or unreadable file as missing, it'll be overwritten
+        return None
+
+    # Guard against hash collisions, however unlikely
+    if entry.get("key") != draft_key:
+        return None
+
+    return entry["picks"]
+
+
+def store(draft_key: str, picks: List[list]):
+    os.makedirs(DRAFT_PICK_STORE_DIRECTORY_PATH, exist_ok=True)
+    file_path = _get_file_path_for_draft_key(draft_key)
+
+    # Write then rename, so concurrent readers never see a partial file. The
+    # bot and scripts can write it at once, hence the process and thread.
+    temporary_file_path = "{path}.{pid}.{thread}.tmp".format(
+        path=file_path, pid=os.getpid(), thread=threading.get_ident())
+    with open(temporary_file_path, "w") as file:
+        json.dump({"key": draft_key, "picks": picks},
+                  file,
+                  separators=(",", ":"))
+    os.replace(temporary_file_path, file_path)
+
+
+def _get_file_path_for_draft_key(draft_key: str) -> str:
+    file_name = hashlib.sha256(draft_key.encode()).hexdigest() + ".json"
+    return os.path.join(DRAFT_PICK_STORE_DIRECTORY_PATH, file_name)
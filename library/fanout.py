@@ -0,0 +1,70 @@
+"""
+   Copyright 2026 Kevin Emery
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterable, Iterator, List, Tuple
+
+# Nearly all of the per-league work is waiting on HTTP, so this can comfortably
+# exceed the core count. Keep it at or below common.DEFAULT_POOL_SIZE so every
+# worker can hold its own keep-alive connection.
+DEFAULT_MAX_WORKERS = 8
+
+
+def fan_out(function: Callable[..., Any],
+            argument_tuples: Iterable[Tuple],
+            max_workers: int = DEFAULT_MAX_WORKERS) -> List[Any]:
+    # Runs function(*arguments) for every entry, with at most max_workers running
+    # at once. Results come back in the same order as the arguments, so callers
+    # can merge them exactly as they would have from a sequential loop.
+    argument_tuples = list(argument_tuples)
+
+    if max_workers <= 1 or len(argument_tuples) <= 1:
+        return [function(*arguments) for arguments in argument_tuples]
+
+    with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(argument_tuples))) as executor:
+        futures = [
+            executor.submit(function, *arguments)
+            for arguments in argument_tuples
+        ]
+
+        # Surfaces the first failure, same as the sequential loop would have
+        return [future.result() for future in futures]
+
+
+def fan_out_as_completed(
+        function: Callable[..., Any],
+        argument_tuples: Iterable[Tuple],
+        max_workers: int = DEFAULT_MAX_WORKERS) -> Iterator[Tuple[int, Any]]:
+    # Same as fan_out, but yields (index, result) pairs as each call finishes so
+    # callers can fold results in without holding every one of them at once. The
+    # index is the entry's position in argument_tuples.
+    argument_tuples = list(argument_tuples)
+
+    if max_workers <= 1 or len(argument_tuples) <= 1:
+        for index, arguments in enumerate(argument_tuples):
+            yield index, function(*arguments)
+        return
+
+    with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(argument_tuples))) as executor:
+        future_to_index = {
+            executor.submit(function, *arguments): index
+            for index, arguments in enumerate(argument_tuples)
+        }
+
+        for future in as_completed(future_to_index):
+            yield future_to_index.pop(future), future.result()
@@ -0,0 +1,126 @@
+"""
+   Copyright 2026 Kevin Emery
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import codecs
+import json
+
+from typing import Any, Iterable, Iterator, Tuple
+
+# Incremental parsing for responses that are one big JSON object, like
+# Sleeper's player dump. Only the top level is streamed: each value is parsed
+# whole once all of its bytes have arrived, so memory use is bounded by the
+# largest single value rather than the whole body.
+
+_decoder = json.JSONDecoder()
+
+_WHITESPACE = " \t\n\r"
+
+_NUMBER_CHARACTERS = "0123456789+-.eE"
+
+
+class _Buffer(object):
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.position = 0
+        self.finished = False
+
+    def read_more(self) -> bool:
+        if self.finished:
+            return False
+
+        # Drop what's already been parsed so the buffer doesn't grow
+        self.text = self.text[self.position:]
+        self.position = 0
+
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self.finished = True
+            self.text += self._utf8_decoder.decode(b"", final=True)
+        else:
+            self.text += self._utf8_decoder.decode(chunk)
+
+        return True
+
+    def skip_whitespace(self):
+        while True:
+            while self.position < len(self.text) and self.text[
+                    self.position] in _WHITESPACE:
+                self.position += 1
+
+            if self.position < len(self.text) or not self.read_more():
+                return
+
+    def expect(self, characters: str) -> str:
+        self.skip_whitespace()
+
+        if self.position >= len(self.text):
+            raise ValueError("JSON stream ended early")
+
+        character = self.text[self.position]
+        if character not in characters:
+            raise ValueError(
+                "Expected one of '{expected}' in JSON stream, found '{found}'".
+                format(expected=characters, found=character))
+
+        self.position += 1
+        return character
+
+    def peek(self) -> str:
+        self.skip_whitespace()
+
+        if self.position >= len(self.text):
+            raise ValueError("JSON stream ended early")
+
+        return self.text[self.position]
+
+    def decode_value(self) -> Any:
+        self.skip_whitespace()
+
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.position)
+
+                # A number cut off mid-chunk still decodes, so only trust a
+                # value once something that can't continue it follows
+                if self.finished or (end < len(self.text) and
+                                     self.text[end] not in _NUMBER_CHARACTERS):
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.finished:
+                    raise
+
+            self.read_more()
+
+
+def iter_object_items(chunks: Iterable[bytes]) -> Iterator[Tuple[str, Any]]:
+    buffer = _Buffer(chunks)
+    buffer.expect("{")
+
+    if buffer.peek() == "}":
+        return
+
+    while True:
+        key = buffer.decode_value()
+        buffer.expect(":")
+        value = buffer.decode_value()
+
+        yield key, value
+
+        if buffer.expect(",}") == "}":
+            return
@@ -0,0 +1,59 @@
+"""
+   Copyright 2026 Kevin Emery
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import heapq
+
+from typing import Any, Callable, List, Optional, Tuple
+
+
+# Keeps only the best `count` entries seen so far, by `key`, in a heap whose root
+# is the entry that would be dropped next. Entries can arrive in any order as
+# long as each comes with its position in the original ordering, which breaks
+# ties the same way a stable sort of the full list would. A count of None keeps
+# every entry.
+class Leaderboard(object):
+    def __init__(self,
+                 count: Optional[int],
+                 key: Callable[[Any], float],
+                 highest_first: bool = True):
+        self.count = count
+        self.key = key
+        self.highest_first = highest_first
+
+        self._heap: List[Tuple[float, Tuple, Any]] = []
+
+    def add(self, entry: Any, order: Tuple):
+        if self.count is not None and self.count <= 0:
+            return
+
+        value = self.key(entry)
+        if not self.highest_first:
+            value = -value
+
+        # Negating the order makes the later of two tied entries sit closer to
+        # the root, so it's the one dropped
+        heap_entry = (value, tuple(-position for position in order), entry)
+
+        if self.count is None or len(self._heap) < self.count:
+            heapq.heappush(self._heap, heap_entry)
+        elif heap_entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, heap_entry)
+
+    def get_results(self) -> List[Any]:
+        return [
+            heap_entry[2] for heap_entry in sorted(
+                self._heap, key=lambda heap_entry: heap_entry[:2], reverse=True)
+        ]
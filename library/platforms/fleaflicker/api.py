@@ -14,13 +14,88 @@
    limitations under the License.
 """
 
+from typing import Any, Dict, Iterator
+
 from ... import common
+from ... import responsecache
 from ...model.user import User
 
 BASE_URL = "https://www.fleaflicker.com/api/"
 
+# Cache lifetimes for endpoints whose data changes on a fixed schedule. The
+# URLs, these and the get_ttl_* helpers below are shared with asyncapi.py, so
+# the two transports always request and cache the same things.
+USER_LEAGUES_TTL = responsecache.LEAGUE_DATA_TTL_SECONDS
+DRAFT_BOARD_TTL = responsecache.CURRENT_WEEK_TTL_SECONDS
+
 
 def fetch_user_leagues(user: User, year: int):
+    return common._make_get_request_with_logging(
+        build_user_leagues_url(user, year), ttl=USER_LEAGUES_TTL)["leagues"]
+
+
+def fetch_league_standings(league_id: str, year: int):
+    return common._make_get_request_with_logging(
+        build_league_standings_url(league_id, year),
+        ttl=get_ttl_for_standings)
+
+
+def fetch_league_draft_board(league_id: str, year: int):
+    return common._make_get_request_with_logging(
+        build_league_draft_board_url(league_id, year), ttl=DRAFT_BOARD_TTL)
+
+
+def fetch_trades(league_id: str):
+    return common._make_get_request_with_logging(
+        build_trades_url(league_id))["trades"]
+
+
+def fetch_league_transactions(league_id: str, result_offset: int = 0):
+    return common._make_get_request_with_logging(
+        build_league_transactions_url(league_id, result_offset))
+
+
+# Every transaction in the league, newest first, one page at a time. Stop
+# iterating as soon as you've seen enough and the later pages are never fetched.
+def iter_league_transactions(league_id: str) -> Iterator[Dict[str, Any]]:
+    result_offset = 0
+
+    while result_offset is not None:
+        raw_transactions = fetch_league_transactions(league_id, result_offset)
+
+        # Treat a failed page as the end of the list
+        if raw_transactions is None:
+            return
+
+        yield from raw_transactions.get("items", [])
+        result_offset = raw_transactions.get("resultOffsetNext")
+
+
+def fetch_league_transactions_for_team(league_id: str,
+                                       team_id: str,
+                                       result_offset: int = 0):
+    return common._make_get_request_with_logging(
+        build_league_transactions_for_team_url(league_id, team_id,
+                                               result_offset))
+
+
+def fetch_league_scoreboard(league_id: str,
+                            week: int,
+                            year: int,
+                            include_season_totals: bool = False):
+    return common._make_get_request_with_logging(
+        build_league_scoreboard_url(league_id, week, year),
+        ttl=get_ttl_for_league_scoreboard(include_season_totals))
+
+
+def fetch_league_box_score(league_id: str, week: int, game_id: str):
+    return common._make_get_request_with_logging(
+        build_league_box_score_url(league_id, week, game_id),
+        False,
+        ttl=get_ttl_for_box_score)
+
+
+def build_user_leagues_url(user: User, year: int) -> str:
     request_url = BASE_URL + "FetchUserLeagues?sport=NFL&season={year}".format(
         year=str(year))
 
@@ -30,57 +105,84 @@ def fetch_user_leagues(user: User, year: int):
         request_url += "&email={email}".format(email=user.email)
     else:
         raise Exception("User {user} must have either id or email set".format(
-            user.name))
+            user=user.name))
 
-    return common._make_get_request_with_logging(request_url)["leagues"]
+    return request_url
 
 
-def fetch_league_standings(league_id: str, year: int):
-    request_url = BASE_URL + "FetchLeagueStandings?sport=NFL&league_id={league_id}&season={year}".format(
+def build_league_standings_url(league_id: str, year: int) -> str:
+    return BASE_URL + "FetchLeagueStandings?sport=NFL&league_id={league_id}&season={year}".format(
         league_id=league_id, year=str(year))
 
-    return common._make_get_request_with_logging(request_url)
 
-
-def fetch_league_draft_board(league_id: str, year: int):
-    request_url = BASE_URL + "FetchLeagueDraftBoard?sport=NFL&season={year}&league_id={league_id}".format(
+def build_league_draft_board_url(league_id: str, year: int) -> str:
+    return BASE_URL + "FetchLeagueDraftBoard?sport=NFL&season={year}&league_id={league_id}".format(
         year=str(year), league_id=league_id)
 
-    return common._make_get_request_with_logging(request_url)
 
-
-def fetch_trades(league_id: str):
-    request_url = BASE_URL + "FetchTrades?sport=NFL&league_id={league_id}&filter=TRADES_COMPLETED".format(
+def build_trades_url(league_id: str) -> str:
+    return BASE_URL + "FetchTrades?sport=NFL&league_id={league_id}&filter=TRADES_COMPLETED".format(
         league_id=league_id)
 
-    return common._make_get_request_with_logging(request_url)["trades"]
 
-
-def fetch_league_transactions(league_id: str, result_offset: int = 0):
-    request_url = BASE_URL + "FetchLeagueTransactions?league_id={league_id}&result_offset={result_offset}".format(
+def build_league_transactions_url(league_id: str, result_offset: int) -> str:
+    return BASE_URL + "FetchLeagueTransactions?league_id={league_id}&result_offset={result_offset}".format(
         league_id=league_id, result_offset=result_offset)
 
-    return common._make_get_request_with_logging(request_url)
 
-
-def fetch_league_transactions_for_team(league_id: str,
-                                       team_id: str,
-                                       result_offset: int = 0):
-    request_url = BASE_URL + "FetchLeagueTransactions?league_id={league_id}&team_id={team_id}&result_offset={result_offset}".format(
+def build_league_transactions_for_team_url(league_id: str, team_id: str,
+                                           result_offset: int) -> str:
+    return BASE_URL + "FetchLeagueTransactions?league_id={league_id}&team_id={team_id}&result_offset={result_offset}".format(
         league_id=league_id, team_id=team_id, result_offset=result_offset)
 
-    return common._make_get_request_with_logging(request_url)
 
-
-def fetch_league_scoreboard(league_id: str, week: int, year: int):
-    request_url = BASE_URL + "FetchLeagueScoreboard?sport=NFL&league_id={league_id}&scoring_period={week}&season={year}".format(
+def build_league_scoreboard_url(league_id: str, week: int, year: int) -> str:
+    return BASE_URL + "FetchLeagueScoreboard?sport=NFL&league_id={league_id}&scoring_period={week}&season={year}".format(
         league_id=league_id, week=str(week), year=str(year))
 
-    return common._make_get_request_with_logging(request_url)
-
 
-def fetch_league_box_score(league_id: str, week: int, game_id: str):
-    request_url = BASE_URL + "FetchLeagueBoxscore?sport=NFL&league_id={league_id}&scoring_period={week}&fantasy_game_id={game_id}".format(
+def build_league_box_score_url(league_id: str, week: int, game_id: str) -> str:
+    return BASE_URL + "FetchLeagueBoxscore?sport=NFL&league_id={league_id}&scoring_period={week}&fantasy_game_id={game_id}".format(
         league_id=league_id, week=str(week), game_id=game_id)
 
-    return common._make_get_request_with_logging(request_url, False)
+
+def get_ttl_for_standings(raw_league_data) -> int:
+    # Standings occasionally come back without any divisions. Don't hold on to
+    # those, the caller retries them.
+    if "divisions" not in raw_league_data:
+        return responsecache.BYPASS
+
+    return responsecache.LEAGUE_DATA_TTL_SECONDS
+
+
+def get_ttl_for_league_scoreboard(
+        include_season_totals: bool) -> responsecache.TTLPolicy:
+    # Each team's season points-for comes back on every week's scoreboard, so
+    # it can't be treated as final even when that week's games are
+    if include_season_totals:
+        return responsecache.CURRENT_WEEK_TTL_SECONDS
+
+    return get_ttl_for_scoreboard
+
+
+def get_ttl_for_scoreboard(raw_league_scoreboard) -> int:
+    if is_scoreboard_final(raw_league_scoreboard):
+        return responsecache.IMMUTABLE
+
+    return responsecache.CURRENT_WEEK_TTL_SECONDS
+
+
+def is_scoreboard_final(raw_league_scoreboard) -> bool:
+    games = raw_league_scoreboard.get("games", [])
+
+    return bool(games) and all(
+        game.get("isFinalScore", False) for game in games)
+
+
+def get_ttl_for_box_score(raw_box_score) -> int:
+    if raw_box_score.get("game", {}).get("isFinalScore", False):
+        return responsecache.IMMUTABLE
+
+    # Box scores are only used for lineup checks, which get rerun right after
+    # managers fix their starters
+    return responsecache.BYPASS
@@ -0,0 +1,93 @@
+"""
+   Copyright 2026 Kevin Emery
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+# Non-blocking mirror of api.py. URLs and cache lifetimes all come from
+# there, so only the transport differs.
+
+from typing import Any, AsyncIterator, Dict
+
+from . import api
+
+from ... import asynccommon
+from ...model.user import User
+
+
+async def fetch_user_leagues(user: User, year: int):
+    return (await asynccommon._make_get_request_with_logging(
+        api.build_user_leagues_url(user, year),
+        ttl=api.USER_LEAGUES_TTL))["leagues"]
+
+
+async def fetch_league_standings(league_id: str, year: int):
+    return await asynccommon._make_get_request_with_logging(
+        api.build_league_standings_url(league_id, year),
+        ttl=api.get_ttl_for_standings)
+
+
+async def fetch_league_draft_board(league_id: str, year: int):
+    return await asynccommon._make_get_request_with_logging(
+        api.build_league_draft_board_url(league_id, year),
+        ttl=api.DRAFT_BOARD_TTL)
+
+
+async def fetch_trades(league_id: str):
+    return (await asynccommon._make_get_request_with_logging(
+        api.build_trades_url(league_id)))["trades"]
+
+
+async def fetch_league_transactions(league_id: str, result_offset: int = 0):
+    return await asynccommon._make_get_request_with_logging(
+        api.build_league_transactions_url(league_id, result_offset))
+
+
+async def iter_league_transactions(
+        league_id: str) -> AsyncIterator[Dict[str, Any]]:
+    result_offset = 0
+
+    while result_offset is not None:
+        raw_transactions = await fetch_league_transactions(
+            league_id, result_offset)
+
+        if raw_transactions is None:
+            return
+
+        for raw_transaction in raw_transactions.get("items", []):
+            yield raw_transaction
+        result_offset = raw_transactions.get("resultOffsetNext")
+
+
+async def fetch_league_transactions_for_team(league_id: str,
+                                             team_id: str,
+                                             result_offset: int = 0):
+    return await asynccommon._make_get_request_with_logging(
+        api.build_league_transactions_for_team_url(league_id, team_id,
+                                                   result_offset))
+
+
+async def fetch_league_scoreboard(league_id: str,
+                                  week: int,
+                                  year: int,
+                                  include_season_totals: bool = False):
+    return await asynccommon._make_get_request_with_logging(
+        api.build_league_scoreboard_url(league_id, week, year),
+        ttl=api.get_ttl_for_league_scoreboard(include_season_totals))
+
+
+async def fetch_league_box_score(league_id: str, week: int, game_id: str):
+    return await asynccommon._make_get_request_with_logging(
+        api.build_league_box_score_url(league_id, week, game_id),
+        False,
+        ttl=api.get_ttl_for_box_score)
@@ -0,0 +1,226 @@
+"""
+   Copyright 2026 Kevin Emery
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import asyncio
+import re
+
+from typing import Dict, List
+
+from . import api
+from . import asyncapi
+
+from .fleaflicker import Fleaflicker
+
+from ..asyncplatform import AsyncPlatform
+
+from ... import common
+from ...model.draftedplayer import DraftedPlayer
+from ...model.inactiveroster import InactiveRoster
+from ...model.league import League
+from ...model.seasonscore import SeasonScore
+from ...model.team import Team
+from ...model.trade import Trade
+from ...model.transaction import Transaction
+from ...model.user import User
+from ...model.weeklyscore import WeeklyScore
+
+
+# All of the response parsing is shared with Fleaflicker, only the network
+# calls differ.
+class AsyncFleaflicker(AsyncPlatform):
+    def __init__(self):
+        # Parses responses and holds the teams, scoreboards and requests kept
+        # between calls. Only its parsing and bookkeeping are used, never
+        # anything that goes to the network, and anything that touches disk is
+        # run on a thread.
+        self._parser = Fleaflicker()
+
+    async def get_admin_user_by_identifier(self, identifier: str) -> User:
+        return self._parser.get_admin_user_by_identifier(identifier)
+
+    async def get_all_leagues_for_user(
+            self,
+            user: User,
+            year: int = common.DEFAULT_YEAR,
+            name_regex: re.Pattern = re.compile(".*"),
+            name_substring: str = "",
+            store_user_info: bool = True,
+            include_pre_draft: bool = False) -> List[League]:
+        # Even when pulling past data, we can only check the current year's leagues.
+        raw_league_list = await self._parser._request_memo.get_async(
+            ("raw_leagues", user.email),
+            lambda: asyncapi.fetch_user_leagues(user, common.DEFAULT_YEAR))
+        leagues = self._parser._create_matching_leagues_from_raw_league_list(
+            raw_league_list, name_regex, name_substring)
+
+        if store_user_info:
+            await asyncio.gather(*[
+                self._store_team_and_user_data_for_league(
+                    league.league_id, year) for league in leagues
+            ])
+
+        return leagues
+
+    async def get_drafted_players_for_league(
+            self,
+            league: League,
+            year: int = common.DEFAULT_YEAR) -> List[DraftedPlayer]:
+        drafted_players = await asyncio.to_thread(
+            self._parser._get_stored_drafted_players, league, year)
+        if drafted_players is not None:
+            return drafted_players
+
+        raw_draft_board = await self._parser._request_memo.get_async(
+            ("raw_draft_board", league.league_id, year),
+            lambda: asyncapi.fetch_league_draft_board(league.league_id, year))
+        drafted_players = self._parser._create_drafted_players_from_raw_draft_board(
+            league, raw_draft_board)
+
+        if self._parser._is_draft_board_complete(raw_draft_board):
+            await asyncio.to_thread(self._parser._store_drafted_players,
+                                    league, year, drafted_players)
+
+        return drafted_players
+
+    async def get_all_trades_for_league(self,
+                                        league: League,
+                                        year: int,
+                                        strict: bool = False) -> List[Trade]:
+        raw_trades = await asyncapi.fetch_trades(league.league_id)
+
+        return self._parser._create_trades_from_raw_trades(
+            league, year, raw_trades)
+
+    async def get_newest_trades_for_league(self, league: League,
+                                           year: int) -> List[Trade]:
+        return await self.get_all_trades_for_league(league, year)
+
+    async def get_weekly_scores_for_league_and_week(
+            self, league: League, week: int, year: int) -> List[WeeklyScore]:
+        raw_league_scoreboard = await self._get_league_scoreboard(
+            league.league_id, week, year)
+
+        return self._parser._create_weekly_scores_from_raw_scoreboard(
+            league, week, raw_league_scoreboard)
+
+    async def is_week_complete(self, league: League, week: int,
+                               year: int) -> bool:
+        raw_league_scoreboard = await self._get_league_scoreboard(
+            league.league_id, week, year)
+
+        return raw_league_scoreboard is not None and api.is_scoreboard_final(
+            raw_league_scoreboard)
+
+    async def is_season_complete(self, league: League, year: int) -> bool:
+        return self._parser.is_season_complete(league, year)
+
+    async def get_season_scores_for_league(self, league: League,
+                                           year: int) -> List[SeasonScore]:
+        # The scoreboard returns season-long information regardless of the week
+        raw_league_scoreboard = self._parser._get_cached_scoreboard_with_season_totals(
+            league.league_id, year)
+
+        if raw_league_scoreboard is None:
+            raw_league_scoreboard = await asyncapi.fetch_league_scoreboard(
+                league.league_id, 1, year, include_season_totals=True)
+            self._parser._cache_scoreboard(league.league_id, 1, year,
+                                           raw_league_scoreboard)
+
+        return self._parser._create_season_scores_from_raw_scoreboard(
+            league, raw_league_scoreboard)
+
+    async def get_last_transaction_for_teams_in_league(
+            self, league: League, year: int) -> Dict[Team, Transaction]:
+        team_id_to_raw_transaction = {}
+
+        async for raw_transaction in asyncapi.iter_league_transactions(
+                league.league_id):
+            if self._parser._record_newest_raw_transaction_per_team(
+                    league, year, team_id_to_raw_transaction,
+                    raw_transaction):
+                break
+
+        return self._parser._create_last_transaction_per_team(
+            league, year, team_id_to_raw_transaction)
+
+    async def get_inactive_rosters_for_league_and_week(
+            self,
+            league: League,
+            week: int,
+            year: int,
+            teams_to_ignore: List[str] = [],
+            only_teams: List[str] = [],
+            player_names_to_ignore: List[str] = []) -> List[InactiveRoster]:
+        inactive_rosters = []
+
+        # In order to pull lineups, we have to pull game ids from the scoreboard
+        raw_league_scoreboard = await self._get_league_scoreboard(
+            league.league_id, week, year)
+
+        raw_box_scores = await asyncio.gather(*[
+            asyncapi.fetch_league_box_score(league.league_id, week,
+                                            game["id"])
+            for game in raw_league_scoreboard["games"]
+        ])
+
+        for raw_box_score in raw_box_scores:
+            inactive_rosters.extend(
+                self._parser._create_inactive_rosters_from_raw_box_score(
+                    league, week, raw_box_score, teams_to_ignore, only_teams,
+                    player_names_to_ignore))
+
+        return inactive_rosters
+
+    async def get_team_for_user(self, league: League, user: User) -> Team:
+        return self._parser.get_team_for_user(league, user)
+
+    async def _get_league_scoreboard(self, league_id: str, week: int,
+                                     year: int):
+        raw_league_scoreboard = self._parser._get_cached_scoreboard(
+            league_id, week, year)
+
+        if raw_league_scoreboard is None:
+            raw_league_scoreboard = await asyncapi.fetch_league_scoreboard(
+                league_id, week, year)
+            self._parser._cache_scoreboard(league_id, week, year,
+                                           raw_league_scoreboard)
+
+        return raw_league_scoreboard
+
+    async def _store_team_and_user_data_for_league(self, league_id: str,
+                                                   year: int):
+        await self._parser._request_memo.get_async(
+            ("raw_standings", league_id, year),
+            lambda: self._fetch_and_store_team_and_user_data_for_league(
+                league_id, year))
+
+    async def _fetch_and_store_team_and_user_data_for_league(
+            self, league_id: str, year: int):
+        raw_league_data = await asyncapi.fetch_league_standings(
+            league_id, year)
+
+        # Sometimes the API returns bad data. Attempt a retry here
+        if "divisions" not in raw_league_data:
+            print(
+                "Fleaflicker standings did not have divisions, retrying request"
+            )
+            raw_league_data = await asyncapi.fetch_league_standings(
+                league_id, year)
+
+        self._parser._store_team_and_user_data_from_raw_standings(
+            league_id, raw_league_data)
+
+        return raw_league_data
@@ -15,15 +15,19 @@
 """
 
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import re
+import threading
 
 from . import api
 
 from ..platform import Platform
+from ..requestmemo import RequestMemo
 
 from ... import common
+from ... import draftpickstore
+from ... import fanout
 from ...model.draftedplayer import DraftedPlayer
 from ...model.inactiveroster import InactiveRoster
 from ...model.league import League
@@ -41,6 +45,18 @@ class Fleaflicker(Platform):
     def __init__(self):
         self._league_id_to_team_id_to_user: Dict[str, Dict[int, User]] = {}
 
+        # Scoreboards already fetched by this instance, by league, week and
+        # year. Weekly scores, season scores and lineup checks all read the
+        # same scoreboard, so each one is only requested once.
+        self._scoreboard_key_to_raw_scoreboard: Dict[Tuple[str, int, int],
+                                                     Any] = {}
+        self._scoreboard_lock = threading.Lock()
+
+        # League lists, standings and draft boards already fetched by this
+        # instance, so each is only requested once per command. Entries
+        # expire, so long-lived instances pick up changes.
+        self._request_memo = RequestMemo()
+
     def get_admin_user_by_identifier(self, identifier: str) -> User:
         # Fleaflicker doesn't require you to query by Admin User Id, instead
         # making it available via email. Construct a dummy user object here solely
@@ -55,10 +71,23 @@ class Fleaflicker(Platform):
             name_substring: str = "",
             store_user_info: bool = True,
             include_pre_draft: bool = False) -> List[League]:
-        leagues = []
-
         # Even when pulling past data, we can only check the current year's leagues.
-        raw_league_list = api.fetch_user_leagues(user, common.DEFAULT_YEAR)
+        raw_league_list = self._request_memo.get(
+            ("raw_leagues", user.email),
+            lambda: api.fetch_user_leagues(user, common.DEFAULT_YEAR))
+        leagues = self._create_matching_leagues_from_raw_league_list(
+            raw_league_list, name_regex, name_substring)
+
+        if store_user_info:
+            fanout.fan_out(self._store_team_and_user_data_for_league,
+                           [(league.league_id, year) for league in leagues])
+
+        return leagues
+
+    def _create_matching_leagues_from_raw_league_list(
+            self, raw_league_list, name_regex: re.Pattern,
+            name_substring: str) -> List[League]:
+        leagues = []
 
         for raw_league in raw_league_list:
             roster_counts = {}
@@ -74,9 +103,6 @@ class Fleaflicker(Platform):
 
             if self._league_name_matches(league.name, name_substring,
                                          name_regex):
-                if store_user_info:
-                    self._store_team_and_user_data_for_league(
-                        league.league_id, year)
                 leagues.append(league)
 
         return leagues
@@ -90,9 +116,67 @@ class Fleaflicker(Platform):
             self,
             league: League,
             year: int = common.DEFAULT_YEAR) -> List[DraftedPlayer]:
-        drafted_players = []
+        drafted_players = self._get_stored_drafted_players(league, year)
+        if drafted_players is not None:
+            return drafted_players
+
+        raw_draft_board = self._request_memo.get(
+            ("raw_draft_board", league.league_id, year),
+            lambda: api.fetch_league_draft_board(league.league_id, year))
+        drafted_players = self._create_drafted_players_from_raw_draft_board(
+            league, raw_draft_board)
 
-        raw_draft_board = api.fetch_league_draft_board(league.league_id, year)
+        if self._is_draft_board_complete(raw_draft_board):
+            self._store_drafted_players(league, year, drafted_players)
+
+        return drafted_players
+
+    def _is_draft_board_complete(self, raw_draft_board) -> bool:
+        # Once the draft is over every slot on the board has a player in it
+        if "rosters" in raw_draft_board:
+            board_entries = [
+                lineup_entry for roster in raw_draft_board["rosters"]
+                for lineup_entry in roster["lineup"]
+            ]
+        elif "orderedSelections" in raw_draft_board:
+            board_entries = raw_draft_board["orderedSelections"]
+        else:
+            return False
+
+        return bool(board_entries) and all(
+            "player" in board_entry for board_entry in board_entries)
+
+    def _get_stored_drafted_players(self, league: League,
+                                    year: int) -> List[DraftedPlayer]:
+        stored_picks = draftpickstore.lookup(
+            self._get_draft_pick_store_key(league, year))
+
+        if stored_picks is None:
+            return None
+
+        return [
+            DraftedPlayer(Player(player_id, name, team, position, status),
+                          draft_position)
+            for player_id, name, team, position, status, draft_position in
+            stored_picks
+        ]
+
+    def _store_drafted_players(self, league: League, year: int,
+                               drafted_players: List[DraftedPlayer]):
+        draftpickstore.store(self._get_draft_pick_store_key(league, year), [[
+            drafted_player.player.player_id, drafted_player.player.name,
+            drafted_player.player.team, drafted_player.player.position,
+            drafted_player.player.status, drafted_player.draft_position
+        ] for drafted_player in drafted_players])
+
+    def _get_draft_pick_store_key(self, league: League, year: int) -> str:
+        # Fleaflicker doesn't expose a draft ID, but there's one per season
+        return "fleaflicker:{league_id}:{year}".format(
+            league_id=league.league_id, year=year)
+
+    def _create_drafted_players_from_raw_draft_board(
+            self, league: League, raw_draft_board) -> List[DraftedPlayer]:
+        drafted_players = []
 
         # Most drafts look like this
         if "rosters" in raw_draft_board:
@@ -138,12 +222,26 @@ class Fleaflicker(Platform):
 
         return None
 
-    def get_all_trades_for_league(self, league: League,
-                                  year: int) -> List[Trade]:
-        all_trades = []
+    def get_all_trades_for_league(self,
+                                  league: League,
+                                  year: int,
+                                  strict: bool = False) -> List[Trade]:
+        # Trades come back in a single request, and a failed one already
+        # raises, so there's nothing for strict to change
+        raw_trades = api.fetch_trades(league.league_id)
 
+        return self._create_trades_from_raw_trades(league, year, raw_trades)
+
+    def get_newest_trades_for_league(self, league: League,
+                                     year: int) -> List[Trade]:
+        # FetchTrades lists the newest trades first, and only its first page
+        # is ever requested, so that's already just the newest
+        return self.get_all_trades_for_league(league, year)
+
+    def _create_trades_from_raw_trades(self, league: League, year: int,
+                                       raw_trades) -> List[Trade]:
+        all_trades = []
         team_id_to_user = self._league_id_to_team_id_to_user[league.league_id]
-        raw_trades = api.fetch_trades(league.league_id)
 
         for trade_data in raw_trades:
             trade_time = datetime.fromtimestamp(
@@ -198,12 +296,18 @@ class Fleaflicker(Platform):
 
     def get_weekly_scores_for_league_and_week(self, league: League, week: int,
                                               year: int) -> List[WeeklyScore]:
+        raw_league_scoreboard = self._get_league_scoreboard(
+            league.league_id, week, year)
+
+        return self._create_weekly_scores_from_raw_scoreboard(
+            league, week, raw_league_scoreboard)
+
+    def _create_weekly_scores_from_raw_scoreboard(
+            self, league: League, week: int,
+            raw_league_scoreboard) -> List[WeeklyScore]:
         weekly_scores = []
         team_id_to_user = self._league_id_to_team_id_to_user[league.league_id]
 
-        raw_league_scoreboard = api.fetch_league_scoreboard(
-            league.league_id, week, year)
-
         for game in raw_league_scoreboard["games"]:
             raw_home = game["home"]
             raw_away = game["away"]
@@ -228,13 +332,38 @@ class Fleaflicker(Platform):
 
     def get_season_scores_for_league(self, league: League,
                                      year: int) -> List[SeasonScore]:
+        # The scoreboard returns season-long information regardless of the week
+        raw_league_scoreboard = self._get_cached_scoreboard_with_season_totals(
+            league.league_id, year)
+
+        if raw_league_scoreboard is None:
+            raw_league_scoreboard = api.fetch_league_scoreboard(
+                league.league_id, 1, year, include_season_totals=True)
+            self._cache_scoreboard(league.league_id, 1, year,
+                                   raw_league_scoreboard)
+
+        return self._create_season_scores_from_raw_scoreboard(
+            league, raw_league_scoreboard)
+
+    def is_week_complete(self, league: League, week: int, year: int) -> bool:
+        # Weekly scores were just read from this same scoreboard, so this
+        # doesn't go back to the network
+        raw_league_scoreboard = self._get_league_scoreboard(
+            league.league_id, week, year)
+
+        return raw_league_scoreboard is not None and api.is_scoreboard_final(
+            raw_league_scoreboard)
+
+    def is_season_complete(self, league: League, year: int) -> bool:
+        # Leagues can only be listed for the current season, so anything
+        # earlier has been over for a while
+        return year < common.DEFAULT_YEAR
+
+    def _create_season_scores_from_raw_scoreboard(
+            self, league: League, raw_league_scoreboard) -> List[SeasonScore]:
         season_scores = []
         team_id_to_user = self._league_id_to_team_id_to_user[league.league_id]
 
-        # The scoreboard returns season-long information regardless of the week
-        raw_league_scoreboard = api.fetch_league_scoreboard(
-            league.league_id, 1, year)
-
         for game in raw_league_scoreboard["games"]:
             raw_home = game["home"]
             raw_away = game["away"]
@@ -261,45 +390,143 @@ class Fleaflicker(Platform):
 
         return season_scores
 
+    def _get_league_scoreboard(self, league_id: str, week: int, year: int):
+        raw_league_scoreboard = self._get_cached_scoreboard(
+            league_id, week, year)
+
+        if raw_league_scoreboard is None:
+            raw_league_scoreboard = api.fetch_league_scoreboard(
+                league_id, week, year)
+            self._cache_scoreboard(league_id, week, year,
+                                   raw_league_scoreboard)
+
+        return raw_league_scoreboard
+
+    def _get_cached_scoreboard(self, league_id: str, week: int, year: int):
+        with self._scoreboard_lock:
+            return self._scoreboard_key_to_raw_scoreboard.get(
+                (league_id, week, year))
+
+    def _get_cached_scoreboard_with_season_totals(self, league_id: str,
+                                                  year: int):
+        # Any week carries the season totals, but a finished week may have
+        # come out of the response cache long after it closed. A week that's
+        # still being played is never older than the current week TTL, which
+        # is as fresh as asking for the totals directly.
+        with self._scoreboard_lock:
+            scoreboards = list(self._scoreboard_key_to_raw_scoreboard.items())
+
+        for (cached_league_id, _, cached_year), raw_league_scoreboard in scoreboards:
+            if cached_league_id == league_id and cached_year == year:
+                if not api.is_scoreboard_final(raw_league_scoreboard):
+                    return raw_league_scoreboard
+
+        return None
+
+    def _cache_scoreboard(self, league_id: str, week: int, year: int,
+                          raw_league_scoreboard):
+        # Leave failed requests for the next caller to retry
+        if raw_league_scoreboard is None or "games" not in raw_league_scoreboard:
+            return
+
+        with self._scoreboard_lock:
+            self._scoreboard_key_to_raw_scoreboard[(
+                league_id, week, year)] = raw_league_scoreboard
+
     def get_last_transaction_for_teams_in_league(
             self, league: League, year: int) -> Dict[Team, Transaction]:
+        team_id_to_raw_transaction = {}
+
+        # One pass over the league's transactions rather than a request per
+        # team, stopping once every team's newest one has turned up
+        for raw_transaction in api.iter_league_transactions(league.league_id):
+            if self._record_newest_raw_transaction_per_team(
+                    league, year, team_id_to_raw_transaction,
+                    raw_transaction):
+                break
+
+        return self._create_last_transaction_per_team(
+            league, year, team_id_to_raw_transaction)
+
+    def _record_newest_raw_transaction_per_team(
+            self, league: League, year: int,
+            team_id_to_raw_transaction: Dict[str, Any],
+            raw_transaction) -> bool:
+        team_id_to_user = self._league_id_to_team_id_to_user[league.league_id]
+        transaction_object = raw_transaction["transaction"]
+
+        if "team" in transaction_object:
+            team_id = str(transaction_object["team"]["id"])
+
+            # Transactions come newest first, so the first one seen is the
+            # team's newest
+            if team_id not in team_id_to_raw_transaction:
+                team_id_to_raw_transaction[team_id] = raw_transaction
+
+        # Anything past here is from an earlier year, and teams without a
+        # transaction yet get the default whichever one comes up
+        transaction_time = datetime.fromtimestamp(
+            int(raw_transaction["timeEpochMilli"]) / 1000)
+        if transaction_time.year < year:
+            return True
+
+        return all(team_id in team_id_to_raw_transaction
+                   for team_id in team_id_to_user)
+
+    def _create_last_transaction_per_team(
+            self, league: League, year: int,
+            team_id_to_raw_transaction: Dict[str, Any]
+    ) -> Dict[Team, Transaction]:
         transactions = {}
         team_id_to_user = self._league_id_to_team_id_to_user[league.league_id]
 
         for team_id in team_id_to_user:
-            raw_transactions = api.fetch_league_transactions_for_team(
-                league.league_id, team_id)
-            most_recent_raw_transaction = raw_transactions["items"][0]
-            transaction_object = most_recent_raw_transaction["transaction"]
-
-            transaction_time = datetime.fromtimestamp(
-                int(most_recent_raw_transaction["timeEpochMilli"]) / 1000)
-
-            team = Team(team_id, team_id_to_user[team_id],
-                        self._build_roster_link(league.league_id, team_id))
-
-            # If the year isn't the current year then just return a default transaction,
-            # the team doesn't have one this year
-            if transaction_time.year != year:
-                transaction = Transaction(
-                    datetime.fromtimestamp(common.DEC_31_1999_SECONDS), "NONE",
-                    team)
-            else:
-                # This is the default, and if it's not set in the response then we assume
-                # that the transaction is an add
-                transaction_type = "TRANSACTION_ADD"
-                if "type" in transaction_object:
-                    transaction_type = transaction_object["type"]
+            transaction = self._create_last_transaction_from_raw_transaction(
+                league, year, team_id,
+                team_id_to_raw_transaction.get(team_id))
+            transactions[transaction.team] = transaction
 
-                if transaction_type.startswith("TRANSACTION_"):
-                    transaction_type = transaction_type[12:]
+        return transactions
 
-                transaction = Transaction(transaction_time, transaction_type,
-                                          team)
+    def _create_last_transaction_from_raw_transaction(
+            self, league: League, year: int, team_id: str,
+            most_recent_raw_transaction) -> Transaction:
+        team_id_to_user = self._league_id_to_team_id_to_user[league.league_id]
 
-            transactions[team] = transaction
+        team = Team(team_id, team_id_to_user[team_id],
+                    self._build_roster_link(league.league_id, team_id))
 
-        return transactions
+        # Teams that haven't made a transaction at all get the default too
+        if most_recent_raw_transaction is None:
+            return Transaction(
+                datetime.fromtimestamp(common.DEC_31_1999_SECONDS), "NONE",
+                team)
+
+        transaction_object = most_recent_raw_transaction["transaction"]
+
+        transaction_time = datetime.fromtimestamp(
+            int(most_recent_raw_transaction["timeEpochMilli"]) / 1000)
+
+        # If the year isn't the current year then just return a default transaction,
+        # the team doesn't have one this year
+        if transaction_time.year != year:
+            transaction = Transaction(
+                datetime.fromtimestamp(common.DEC_31_1999_SECONDS), "NONE",
+                team)
+        else:
+            # This is the default, and if it's not set in the response then we assume
+            # that the transaction is an add
+            transaction_type = "TRANSACTION_ADD"
+            if "type" in transaction_object:
+                transaction_type = transaction_object["type"]
+
+            if transaction_type.startswith("TRANSACTION_"):
+                transaction_type = transaction_type[12:]
+
+            transaction = Transaction(transaction_time, transaction_type,
+                                      team)
+
+        return transaction
 
     def get_inactive_rosters_for_league_and_week(
             self,
@@ -309,81 +536,115 @@ class Fleaflicker(Platform):
             teams_to_ignore: List[str] = [],
             only_teams: List[str] = [],
             player_names_to_ignore: List[str] = []) -> List[InactiveRoster]:
+        return self.get_inactive_rosters_for_leagues_and_week(
+            [league], week, year, teams_to_ignore, only_teams,
+            player_names_to_ignore)[0]
 
+    def get_inactive_rosters_for_leagues_and_week(
+            self,
+            leagues: List[League],
+            week: int,
+            year: int,
+            teams_to_ignore: List[str] = [],
+            only_teams: List[str] = [],
+            player_names_to_ignore: List[str] = [],
+            max_workers: int = fanout.DEFAULT_MAX_WORKERS
+    ) -> List[List[InactiveRoster]]:
+        # In order to pull lineups, we have to pull game ids from the scoreboard
+        raw_league_scoreboards = fanout.fan_out(
+            self._get_league_scoreboard,
+            [(league.league_id, week, year) for league in leagues],
+            max_workers)
+
+        # Each game is a matchup home/away. The box scores for every game in
+        # every league go through one pool, rather than a pool per league.
+        league_index_and_game_ids = []
+        for league_index, raw_league_scoreboard in enumerate(
+                raw_league_scoreboards):
+            for game in raw_league_scoreboard["games"]:
+                league_index_and_game_ids.append((league_index, game["id"]))
+
+        raw_box_scores = fanout.fan_out(
+            api.fetch_league_box_score,
+            [(leagues[league_index].league_id, week, game_id)
+             for league_index, game_id in league_index_and_game_ids],
+            max_workers)
+
+        inactive_rosters_per_league = [[] for _ in leagues]
+        for (league_index, _), raw_box_score in zip(league_index_and_game_ids,
+                                                    raw_box_scores):
+            inactive_rosters_per_league[league_index].extend(
+                self._create_inactive_rosters_from_raw_box_score(
+                    leagues[league_index], week, raw_box_score,
+                    teams_to_ignore, only_teams, player_names_to_ignore))
+
+        return inactive_rosters_per_league
+
+    def _create_inactive_rosters_from_raw_box_score(
+            self, league: League, week: int, raw_box_score,
+            teams_to_ignore: List[str], only_teams: List[str],
+            player_names_to_ignore: List[str]) -> List[InactiveRoster]:
         inactive_rosters = []
         team_id_to_user = self._league_id_to_team_id_to_user[league.league_id]
         teams_on_bye = common.TEAMS_ON_BYE[week]
 
-        # In order to pull lineups, we have to pull game ids from the scoreboard
-        raw_league_scoreboard = api.fetch_league_scoreboard(
-            league.league_id, week, year)
-
-        game_ids = []
-        for game in raw_league_scoreboard["games"]:
-            game_ids.append(game["id"])
-
-        # Each game is a matchup home/away.
-        for game_id in game_ids:
-            raw_box_score = api.fetch_league_box_score(league.league_id, week,
-                                                       game_id)
-
-            game = raw_box_score["game"]
-
-            home_id = str(game["home"]["id"])
-            home_inactives = []
-            home_team = Team(
-                home_id, team_id_to_user[home_id],
-                self._build_roster_link(league.league_id, home_id))
-
-            away_id = str(game["away"]["id"])
-            away_inactives = []
-            away_team = Team(
-                away_id, team_id_to_user[away_id],
-                self._build_roster_link(league.league_id, away_id))
-
-            for grouping in raw_box_score["lineups"]:
-                # Starters has a definite group, assume all else is just... not starters.
-                try:
-                    group = grouping["group"]
-                except Exception as e:
-                    group = "NOT_START"
-
-                # Within the list of starters, it's split into a "slot" and each team has a player under that slot
-                for slot in grouping["slots"]:
-                    if group == "START":
-                        # If there isn't a starter in the spot, then "home"/"away" just aren't there
-                        if "home" in slot:
-                            home_player = self._build_player_from_pro_player(
-                                slot["home"]["proPlayer"])
-                        else:
-                            home_player = Player("0", "Missing", "None",
-                                                 slot["position"]["label"],
-                                                 "Missing")
-
-                        if "away" in slot:
-                            away_player = self._build_player_from_pro_player(
-                                slot["away"]["proPlayer"])
-                        else:
-                            away_player = Player("0", "Missing", "None",
-                                                 slot["position"]["label"],
-                                                 "Missing")
-
-                        if self._should_player_be_reported_as_inactive(
-                                home_player, teams_to_ignore, only_teams,
-                                player_names_to_ignore, teams_on_bye):
-                            home_inactives.append(home_player)
-
-                        if self._should_player_be_reported_as_inactive(
-                                away_player, teams_to_ignore, only_teams,
-                                player_names_to_ignore, teams_on_bye):
-                            away_inactives.append(away_player)
-
-            if home_inactives:
-                inactive_rosters.append(
-                    InactiveRoster(home_team, home_inactives))
-            if away_inactives:
-                inactive_rosters.append(
-                    InactiveRoster(away_team, away_inactives))
+        game = raw_box_score["game"]
+
+        home_id = str(game["home"]["id"])
+        home_inactives = []
+        home_team = Team(
+            home_id, team_id_to_user[home_id],
+            self._build_roster_link(league.league_id, home_id))
+
+        away_id = str(game["away"]["id"])
+        away_inactives = []
+        away_team = Team(
+            away_id, team_id_to_user[away_id],
+            self._build_roster_link(league.league_id, away_id))
+
+        for grouping in raw_box_score["lineups"]:
+            # Starters has a definite group, assume all else is just... not starters.
+            try:
+                group = grouping["group"]
+            except Exception as e:
+                group = "NOT_START"
+
+            # Within the list of starters, it's split into a "slot" and each team has a player under that slot
+            for slot in grouping["slots"]:
+                if group == "START":
+                    # If there isn't a starter in the spot, then "home"/"away" just aren't there
+                    if "home" in slot:
+                        home_player = self._build_player_from_pro_player(
+                            slot["home"]["proPlayer"])
+                    else:
+                        home_player = Player("0", "Missing", "None",
+                                             slot["position"]["label"],
+                                             "Missing")
+
+                    if "away" in slot:
+                        away_player = self._build_player_from_pro_player(
+                            slot["away"]["proPlayer"])
+                    else:
+                        away_player = Player("0", "Missing", "None",
+                                             slot["position"]["label"],
+                                             "Missing")
+
+                    if self._should_player_be_reported_as_inactive(
+                            home_player, teams_to_ignore, only_teams,
+                            player_names_to_ignore, teams_on_bye):
+                        home_inactives.append(home_player)
+
+                    if self._should_player_be_reported_as_inactive(
+                            away_player, teams_to_ignore, only_teams,
+                            player_names_to_ignore, teams_on_bye):
+                        away_inactives.append(away_player)
+
+        if home_inactives:
+            inactive_rosters.append(
+                InactiveRoster(home_team, home_inactives))
+        if away_inactives:
+            inactive_rosters.append(
+                InactiveRoster(away_team, away_inactives))
 
         return inactive_rosters
 
@@ -431,6 +692,10 @@ class Fleaflicker(Platform):
         return template.format(league_id=league_id, team_id=team_id)
 
     def _store_team_and_user_data_for_league(self, league_id: str, year: int):
+        if self._request_memo.lookup(("raw_standings", league_id,
+                                      year)) is not None:
+            return
+
         raw_league_data = api.fetch_league_standings(league_id, year)
 
         # Sometimes the API returns bad data. Attempt a retry here
@@ -440,6 +705,13 @@ class Fleaflicker(Platform):
             )
             raw_league_data = api.fetch_league_standings(league_id, year)
 
+        self._store_team_and_user_data_from_raw_standings(
+            league_id, raw_league_data)
+        self._request_memo.store(("raw_standings", league_id, year),
+                                 raw_league_data)
+
+    def _store_team_and_user_data_from_raw_standings(self, league_id: str,
+                                                     raw_league_data):
         team_id_to_user = {}
 
         for division in raw_league_data["divisions"]:
@@ -19,6 +19,7 @@ import re
 from typing import Dict, List
 
 from .. import common
+from .. import fanout
 from ..model.draftedplayer import DraftedPlayer
 from ..model.inactiveroster import InactiveRoster
 from ..model.league import League
@@ -50,8 +51,18 @@ class Platform:
             year: int = common.DEFAULT_YEAR) -> List[DraftedPlayer]:
         pass
 
-    def get_all_trades_for_league(self, League: League,
-                                  year: int) -> List[Trade]:
+    # Anything that fails to come back is normally skipped. With strict set it
+    # raises instead, for callers that can't tell a gap from no trades.
+    def get_all_trades_for_league(self,
+                                  League: League,
+                                  year: int,
+                                  strict: bool = False) -> List[Trade]:
+        pass
+
+    # Only the most recent trades, for polling. Anything this doesn't return is
+    # older than everything it does. Always strict.
+    def get_newest_trades_for_league(self, league: League,
+                                     year: int) -> List[Trade]:
         pass
 
     def get_weekly_scores_for_league_and_week(self, league: League, week: int,
@@ -62,6 +73,14 @@ class Platform:
                                      year: int) -> List[SeasonScore]:
         pass
 
+    # Closed weeks and finished seasons can never change, so their scores can
+    # be kept for good
+    def is_week_complete(self, league: League, week: int, year: int) -> bool:
+        pass
+
+    def is_season_complete(self, league: League, year: int) -> bool:
+        pass
+
     def get_last_transaction_for_teams_in_league(
             self, league: League, year: int) -> Dict[Team, Transaction]:
         pass
@@ -76,5 +95,19 @@ class Platform:
             player_names_to_ignore: List[str] = []) -> List[InactiveRoster]:
         pass
 
+    # Same as above for every league at once, in league order. Platforms that
+    # make several requests per league can run all of them in a single pool.
+    def get_inactive_rosters_for_leagues_and_week(
+            self,
+            leagues: List[League],
+            week: int,
+            year: int,
+            teams_to_ignore: List[str] = [],
+            only_teams: List[str] = [],
+            player_names_to_ignore: List[str] = [],
+            max_workers: int = fanout.DEFAULT_MAX_WORKERS
+    ) -> List[List[InactiveRoster]]:
+        pass
+
     def get_team_for_user(self, league: League, user: User) -> Team:
         pass
@@ -0,0 +1,117 @@
+"""
+   Copyright 2026 Kevin Emery
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import asyncio
+import threading
+import time
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from .. import responsecache
+
+# Rosters and standings change as games are played, and the bot and trade feed
+# keep their platforms around for days, so nothing is held longer than the
+# response cache holds the current week
+DEFAULT_MEMO_TTL_SECONDS = responsecache.CURRENT_WEEK_TTL_SECONDS
+
+
+# Leagues, drafts, rosters and the like that have already been fetched and
+# parsed by a platform instance. However many code paths ask for the same
+# resource within ttl_seconds of it being fetched, it's only fetched once.
+class RequestMemo(object):
+    def __init__(self, ttl_seconds: float = DEFAULT_MEMO_TTL_SECONDS):
+        self._ttl_seconds = ttl_seconds
+
+        # Key to when the value was stored and the value
+        self._key_to_entry: Dict[Hashable, Tuple[float, Any]] = {}
+        # Only held while a key is being created, so these don't pile up
+        self._key_to_lock: Dict[Hashable, threading.Lock] = {}
+        self._key_to_task: Dict[Hashable, asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        value = self.lookup(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            key_lock = self._key_to_lock.setdefault(key, threading.Lock())
+
+        # Threads asking for the same key at once wait on the first one, rather
+        # than each fetching it
+        with key_lock:
+            try:
+                value = self.lookup(key)
+                if value is not None:
+                    return value
+
+                value = create()
+                self.store(key, value)
+            finally:
+                # Anyone arriving from here on finds the value, or creates a
+                # new lock if the request failed
+                with self._lock:
+                    if self._key_to_lock.get(key) is key_lock:
+                        del self._key_to_lock[key]
+
+        return value
+
+    async def get_async(self, key: Hashable,
+                        create: Callable[[], Awaitable[Any]]) -> Any:
+        value = self.lookup(key)
+        if value is not None:
+            return value
+
+        # Coroutines asking for the same key at once all wait on the first
+        # one's task, rather than each fetching it
+        task = self._key_to_task.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._create_and_store(key, create))
+            self._key_to_task[key] = task
+            task.add_done_callback(
+                lambda _: self._key_to_task.pop(key, None))
+
+        # One caller being cancelled shouldn't cancel the fetch for the rest
+        return await asyncio.shield(task)
+
+    async def _create_and_store(self, key: Hashable,
+                                create: Callable[[], Awaitable[Any]]) -> Any:
+        value = await create()
+        self.store(key, value)
+
+        return value
+
+    def lookup(self, key: Hashable) -> Any:
+        # Returns None if nothing has been stored for the key, or it's expired
+        with self._lock:
+            entry = self._key_to_entry.get(key)
+            if entry is None:
+                return None
+
+            stored_at, value = entry
+            if time.time() - stored_at > self._ttl_seconds:
+                del self._key_to_entry[key]
+                return None
+
+            return value
+
+    def store(self, key: Hashable, value: Any):
+        # Failed requests come back as None, leave those to be retried
+        if value is None:
+            return
+
+        with self._lock:
+            self._key_to_entry[key] = (time.time(), value)
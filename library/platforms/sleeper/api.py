@@ -14,78 +14,242 @@
    limitations under the License.
 """
 
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
 from ... import common
+from ... import responsecache
 from ...model.user import User
 
 BASE_URL = "https://api.sleeper.app/v1/"
 
+# Cache lifetimes for endpoints whose data changes on a fixed schedule. The
+# URLs, these and the get_ttl_* helpers below are shared with asyncapi.py, so
+# the two transports always request and cache the same things.
+USER_TTL = responsecache.USER_DATA_TTL_SECONDS
+LEAGUE_TTL = responsecache.LEAGUE_DATA_TTL_SECONDS
+
+# Membership only changes when managers join or leave the league
+LEAGUE_USERS_TTL = responsecache.LEAGUE_DATA_TTL_SECONDS
+
+# Season points-for lives on the rosters, so this tracks the current week
+ROSTERS_TTL = responsecache.CURRENT_WEEK_TTL_SECONDS
+
+# The week only rolls over once a week. Being an hour late to notice just
+# means the week that closed is treated as current a little longer.
+NFL_STATE_TTL = responsecache.LEAGUE_DATA_TTL_SECONDS
+
+# Stat corrections land during the week after the games, so a week is only
+# final once the week after it has closed too. Until then it's rechecked
+# hourly.
+STAT_CORRECTION_GRACE_WEEKS = 1
+LAST_CLOSED_WEEK_TTL = responsecache.LEAGUE_DATA_TTL_SECONDS
+
 
 def get_user_from_identifier(identifier: str) -> User:
-    request_url = BASE_URL + "user/{identifier}".format(identifier=identifier)
+    response_json = common._make_get_request_with_logging(
+        build_user_url(identifier), ttl=USER_TTL)
 
-    response_json = common._make_get_request_with_logging(request_url)
+    return create_user_from_response(identifier, response_json)
 
-    # In the event of an error, this comes back as None. Doing this allows
-    # us to more gracefully fail down the line instead of throwing errors here.
-    if response_json is None:
-        print("Error retrieving sleeper user: " + identifier)
-        return User("Error", "Error")
 
-    return User(response_json["user_id"], response_json["username"])
+def get_users_for_league(league_id: str) -> List[User]:
+    response_json = common._make_get_request_with_logging(
+        build_league_users_url(league_id), ttl=LEAGUE_USERS_TTL)
+
+    return create_users_from_league_response(league_id, response_json)
 
 
 def get_all_leagues_for_user(user: User, year: int):
-    request_url = BASE_URL + "user/{user_id}/leagues/nfl/{year}".format(
-        user_id=user.user_id, year=str(year))
+    return common._make_get_request_with_logging(
+        build_user_leagues_url(user, year), ttl=LEAGUE_TTL)
 
-    return common._make_get_request_with_logging(request_url)
 
 def get_league(league_id: str):
-    request_url = request_url = BASE_URL + "league/{league_id}".format(league_id=league_id)
-
-    return common._make_get_request_with_logging(request_url)
+    return common._make_get_request_with_logging(build_league_url(league_id),
+                                                 ttl=LEAGUE_TTL)
 
-def get_all_picks_for_draft(draft_id: str):
-    request_url = BASE_URL + "draft/{draft_id}/picks".format(draft_id=draft_id)
 
-    return common._make_get_request_with_logging(request_url)
+def get_all_picks_for_draft(draft_id: str, draft_complete: bool = False):
+    return common._make_get_request_with_logging(
+        build_draft_picks_url(draft_id),
+        ttl=get_ttl_for_draft_picks(draft_complete))
 
 
 def get_draft(draft_id: str):
-    request_url = BASE_URL + "draft/{draft_id}".format(draft_id=draft_id)
+    return common._make_get_request_with_logging(build_draft_url(draft_id),
+                                                 ttl=get_ttl_for_draft)
+
+
+# The NFL state decides whether the week has closed. Callers fetch it once and
+# pass it in, rather than every request fetching it again.
+def get_league_transactions_for_week(league_id: str, week: str,
+                                     raw_nfl_state):
+    return common._make_get_request_with_logging(
+        build_league_transactions_url(league_id, week),
+        ttl=get_ttl_for_week(int(week), raw_nfl_state))
+
+
+def get_rosters_for_league(league_id: str):
+    return common._make_get_request_with_logging(
+        build_league_rosters_url(league_id), ttl=ROSTERS_TTL)
+
+
+# Live lineups never use the NFL state, so they can leave it out
+def get_matchups_for_league_and_week(league_id: str,
+                                     week: int,
+                                     raw_nfl_state=None,
+                                     live_lineups: bool = False):
+    return common._make_get_request_with_logging(
+        build_league_matchups_url(league_id, week),
+        ttl=get_ttl_for_matchups(int(week), live_lineups, raw_nfl_state))
+
+
+def get_traded_picks(league_id: str):
+    return common._make_get_request_with_logging(
+        build_traded_picks_url(league_id))
+
+
+def get_all_players():
+    return common._make_get_request_with_logging(build_players_url())
+
+
+def stream_all_players() -> Iterator[Tuple[str, Any]]:
+    # The dump is several megabytes, so hand back one player at a time as the
+    # response comes in rather than holding all of it
+    return common._make_streaming_get_request_with_logging(
+        build_players_url())
+
+
+def stream_all_players_if_changed(
+    validators: Dict[str, str]
+) -> Optional[Tuple[Dict[str, str], Iterator[Tuple[str, Any]]]]:
+    # None if the dump hasn't changed since the response the validators came
+    # from, otherwise the new validators and the players as they come in
+    return common._make_conditional_streaming_get_request_with_logging(
+        build_players_url(), validators)
+
+
+def get_nfl_state():
+    return common._make_get_request_with_logging(build_nfl_state_url(),
+                                                 ttl=NFL_STATE_TTL)
+
+
+def build_user_url(identifier: str) -> str:
+    return BASE_URL + "user/{identifier}".format(identifier=identifier)
+
+
+def build_league_users_url(league_id: str) -> str:
+    return BASE_URL + "league/{league_id}/users".format(league_id=league_id)
+
+
+def build_user_leagues_url(user: User, year: int) -> str:
+    return BASE_URL + "user/{user_id}/leagues/nfl/{year}".format(
+        user_id=user.user_id, year=str(year))
+
+
+def build_league_url(league_id: str) -> str:
+    return BASE_URL + "league/{league_id}".format(league_id=league_id)
+
+
+def build_draft_picks_url(draft_id: str) -> str:
+    return BASE_URL + "draft/{draft_id}/picks".format(draft_id=draft_id)
 
-    return common._make_get_request_with_logging(request_url)
 
+def build_draft_url(draft_id: str) -> str:
+    return BASE_URL + "draft/{draft_id}".format(draft_id=draft_id)
 
-def get_league_transactions_for_week(league_id: str, week: str):
-    request_url = BASE_URL + "league/{league_id}/transactions/{round}".format(
+
+def build_league_transactions_url(league_id: str, week: str) -> str:
+    return BASE_URL + "league/{league_id}/transactions/{round}".format(
         league_id=league_id, round=week)
 
-    return common._make_get_request_with_logging(request_url)
 
+def build_league_rosters_url(league_id: str) -> str:
+    return BASE_URL + "league/{league_id}/rosters".format(league_id=league_id)
 
-def get_rosters_for_league(league_id: str):
-    request_url = BASE_URL + "league/{league_id}/rosters".format(
+
+def build_league_matchups_url(league_id: str, week: int) -> str:
+    return BASE_URL + "league/{league_id}/matchups/{week}".format(
+        league_id=league_id, week=str(week))
+
+
+def build_traded_picks_url(league_id: str) -> str:
+    return BASE_URL + "league/{league_id}/traded_picks".format(
         league_id=league_id)
 
-    return common._make_get_request_with_logging(request_url)
 
+def build_players_url() -> str:
+    return BASE_URL + "players/nfl"
 
-def get_matchups_for_league_and_week(league_id: str, week: int):
-    request_url = BASE_URL + "league/{league_id}/matchups/{week}".format(
-        league_id=league_id, week=str(week))
 
-    return common._make_get_request_with_logging(request_url)
+def build_nfl_state_url() -> str:
+    return BASE_URL + "state/nfl"
 
 
-def get_traded_picks(league_id: str):
-    request_url = BASE_URL + "league/{league_id}/traded_picks".format(
-        league_id=league_id)
+def create_user_from_response(identifier: str, response_json) -> User:
+    # In the event of an error, this comes back as None. Doing this allows
+    # us to more gracefully fail down the line instead of throwing errors here.
+    if response_json is None:
+        print("Error retrieving sleeper user: " + identifier)
+        return User("Error", "Error")
+
+    return User(response_json["user_id"], response_json["username"])
 
-    return common._make_get_request_with_logging(request_url)
 
+def create_users_from_league_response(league_id: str,
+                                      response_json) -> List[User]:
+    if response_json is None:
+        print("Error retrieving sleeper users for league: " + league_id)
+        return []
 
-def get_all_players():
-    request_url = BASE_URL + "players/nfl"
+    return [
+        create_user_from_raw_league_user(raw_user)
+        for raw_user in response_json
+    ]
+
+
+def create_user_from_raw_league_user(raw_user) -> User:
+    # League members don't always come back with a username, in which case the
+    # display name is the closest thing we have
+    name = raw_user.get("username") or raw_user["display_name"]
+
+    return User(raw_user["user_id"], name)
+
+
+def get_ttl_for_week(week: int, raw_nfl_state) -> responsecache.TTLPolicy:
+    # If the state couldn't be retrieved, assume nothing is final
+    if raw_nfl_state is None or week >= raw_nfl_state["week"]:
+        return responsecache.CURRENT_WEEK_TTL_SECONDS
+
+    if is_week_final(week, raw_nfl_state):
+        return responsecache.IMMUTABLE
+
+    return LAST_CLOSED_WEEK_TTL
+
+
+def is_week_final(week: int, raw_nfl_state) -> bool:
+    return week < raw_nfl_state["week"] - STAT_CORRECTION_GRACE_WEEKS
+
+
+def get_ttl_for_matchups(week: int, live_lineups: bool,
+                         raw_nfl_state) -> responsecache.TTLPolicy:
+    # Lineup checks get rerun right after managers fix their starters
+    if live_lineups:
+        return responsecache.BYPASS
+
+    return get_ttl_for_week(week, raw_nfl_state)
+
+
+def get_ttl_for_draft_picks(draft_complete: bool) -> int:
+    # Picks in a live draft change by the minute
+    if draft_complete:
+        return responsecache.IMMUTABLE
+
+    return responsecache.BYPASS
+
+
+def get_ttl_for_draft(raw_draft) -> int:
+    if raw_draft["status"] == "complete":
+        return responsecache.IMMUTABLE
 
-    return common._make_get_request_with_logging(request_url)
+    return responsecache.BYPASS
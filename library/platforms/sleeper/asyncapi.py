@@ -0,0 +1,91 @@
+"""
+   Copyright 2026 Kevin Emery
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+# Non-blocking mirror of api.py. URLs, cache lifetimes and response handling
+# all come from there, so only the transport differs.
+
+from typing import List
+
+from . import api
+
+from ... import asynccommon
+from ...model.user import User
+
+
+async def get_user_from_identifier(identifier: str) -> User:
+    response_json = await asynccommon._make_get_request_with_logging(
+        api.build_user_url(identifier), ttl=api.USER_TTL)
+
+    return api.create_user_from_response(identifier, response_json)
+
+
+async def get_users_for_league(league_id: str) -> List[User]:
+    response_json = await asynccommon._make_get_request_with_logging(
+        api.build_league_users_url(league_id), ttl=api.LEAGUE_USERS_TTL)
+
+    return api.create_users_from_league_response(league_id, response_json)
+
+
+async def get_all_leagues_for_user(user: User, year: int):
+    return await asynccommon._make_get_request_with_logging(
+        api.build_user_leagues_url(user, year), ttl=api.LEAGUE_TTL)
+
+
+async def get_league(league_id: str):
+    return await asynccommon._make_get_request_with_logging(
+        api.build_league_url(league_id), ttl=api.LEAGUE_TTL)
+
+
+async def get_all_picks_for_draft(draft_id: str, draft_complete: bool = False):
+    return await asynccommon._make_get_request_with_logging(
+        api.build_draft_picks_url(draft_id),
+        ttl=api.get_ttl_for_draft_picks(draft_complete))
+
+
+async def get_draft(draft_id: str):
+    return await asynccommon._make_get_request_with_logging(
+        api.build_draft_url(draft_id), ttl=api.get_ttl_for_draft)
+
+
+async def get_league_transactions_for_week(league_id: str, week: str,
+                                           raw_nfl_state):
+    return await asynccommon._make_get_request_with_logging(
+        api.build_league_transactions_url(league_id, week),
+        ttl=api.get_ttl_for_week(int(week), raw_nfl_state))
+
+
+async def get_rosters_for_league(league_id: str):
+    return await asynccommon._make_get_request_with_logging(
+        api.build_league_rosters_url(league_id), ttl=api.ROSTERS_TTL)
+
+
+async def get_matchups_for_league_and_week(league_id: str,
+                                           week: int,
+                                           raw_nfl_state=None,
+                                           live_lineups: bool = False):
+    return await asynccommon._make_get_request_with_logging(
+        api.build_league_matchups_url(league_id, week),
+        ttl=api.get_ttl_for_matchups(int(week), live_lineups, raw_nfl_state))
+
+
+async def get_traded_picks(league_id: str):
+    return await asynccommon._make_get_request_with_logging(
+        api.build_traded_picks_url(league_id))
+
+
+async def get_nfl_state():
+    return await asynccommon._make_get_request_with_logging(
+        api.build_nfl_state_url(), ttl=api.NFL_STATE_TTL)
@@ -0,0 +1,293 @@
+"""
+   Copyright 2026 Kevin Emery
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import asyncio
+import re
+
+from typing import Dict, List
+
+from . import asyncapi
+from . import transactionindex
+
+from .sleeper import Sleeper
+
+from ..asyncplatform import AsyncPlatform
+
+from ... import common
+from ...model.draftedplayer import DraftedPlayer
+from ...model.inactiveroster import InactiveRoster
+from ...model.league import League
+from ...model.seasonscore import SeasonScore
+from ...model.team import Team
+from ...model.trade import Trade
+from ...model.transaction import Transaction
+from ...model.user import User
+from ...model.weeklyscore import WeeklyScore
+
+
+# Player data loading and all of the response parsing is shared with Sleeper,
+# only the network calls differ. Construct this off the event loop since the
+# player data load can block for a while.
+class AsyncSleeper(AsyncPlatform):
+    def __init__(self,
+                 force_player_data_refresh: bool = False,
+                 fresh_player_statuses: bool = False):
+        # Parses responses and holds the users, leagues and transactions kept
+        # between calls. Only its parsing and bookkeeping are used, never
+        # anything that goes to the network, and anything that touches disk is
+        # run on a thread.
+        self._parser = Sleeper(force_player_data_refresh,
+                               fresh_player_statuses)
+
+    async def get_admin_user_by_identifier(self, identifier: str) -> User:
+        return await asyncapi.get_user_from_identifier(identifier)
+
+    async def get_league(self, league_id: str) -> League:
+        return await self._parser._request_memo.get_async(
+            ("league", league_id), lambda: self._fetch_league(league_id))
+
+    async def _fetch_league(self, league_id: str) -> League:
+        raw_league = await asyncapi.get_league(league_id)
+        league = self._parser._create_league_from_raw_league(raw_league)
+        self._parser._remember_league(raw_league, league)
+
+        return league
+
+    async def get_all_leagues_for_user(
+            self,
+            user: User,
+            year: int = common.DEFAULT_YEAR,
+            name_regex: re.Pattern = re.compile(".*"),
+            name_substring: str = "",
+            store_user_info: bool = True,
+            include_pre_draft: bool = False) -> List[League]:
+        raw_response_json = await asyncapi.get_all_leagues_for_user(
+            user, str(year))
+        leagues = self._parser._create_matching_leagues_from_raw_response(
+            raw_response_json, name_regex, name_substring, include_pre_draft)
+
+        if store_user_info:
+            await self._store_roster_and_user_data_for_leagues(leagues)
+
+        return leagues
+
+    async def get_drafted_players_for_league(
+            self,
+            league: League,
+            year: int = common.DEFAULT_YEAR) -> List[DraftedPlayer]:
+        drafted_players = await asyncio.to_thread(
+            self._parser._get_stored_drafted_players, league)
+        if drafted_players is not None:
+            return drafted_players
+
+        raw_draft = await asyncapi.get_draft(league.draft_id)
+        draft_complete = raw_draft["status"] == "complete"
+        raw_draft_data = await asyncapi.get_all_picks_for_draft(
+            league.draft_id, draft_complete)
+        drafted_players = self._parser._create_drafted_players_from_raw_picks(
+            raw_draft_data)
+
+        if draft_complete:
+            await asyncio.to_thread(self._parser._store_drafted_players,
+                                    league, drafted_players)
+
+        return drafted_players
+
+    async def get_all_trades_for_league(self,
+                                        league: League,
+                                        year: int,
+                                        strict: bool = False) -> List[Trade]:
+        all_trades = []
+
+        raw_draft, raw_transaction_data_per_week = await asyncio.gather(
+            asyncapi.get_draft(league.draft_id),
+            self._get_transactions_for_every_week(league))
+        draft = self._parser._create_draft_from_response(raw_draft)
+
+        if strict:
+            self._parser._check_every_week_fetched(
+                league, transactionindex.TRANSACTION_WEEKS,
+                raw_transaction_data_per_week)
+
+        for raw_transaction_data in raw_transaction_data_per_week:
+            all_trades.extend(
+                self._parser._create_trades_from_raw_transactions(
+                    league, draft, raw_transaction_data))
+
+        return all_trades
+
+    async def get_newest_trades_for_league(self, league: League,
+                                           year: int) -> List[Trade]:
+        newest_trades = []
+
+        raw_draft, raw_nfl_state = await asyncio.gather(
+            asyncapi.get_draft(league.draft_id), self._get_raw_nfl_state())
+        draft = self._parser._create_draft_from_response(raw_draft)
+
+        weeks = self._parser._get_newest_transaction_weeks(raw_nfl_state)
+        raw_transaction_data_per_week = await asyncio.gather(*[
+            asyncapi.get_league_transactions_for_week(league.league_id, week,
+                                                      raw_nfl_state)
+            for week in weeks
+        ])
+        self._parser._check_every_week_fetched(league, weeks,
+                                               raw_transaction_data_per_week)
+
+        for raw_transaction_data in raw_transaction_data_per_week:
+            newest_trades.extend(
+                self._parser._create_trades_from_raw_transactions(
+                    league, draft, raw_transaction_data))
+
+        return newest_trades
+
+    async def get_weekly_scores_for_league_and_week(
+            self, league: League, week: int, year: int) -> List[WeeklyScore]:
+        weekly_matchups = await asyncapi.get_matchups_for_league_and_week(
+            league.league_id, week, await self._get_raw_nfl_state())
+
+        return self._parser._create_weekly_scores_from_raw_matchups(
+            league, week, weekly_matchups)
+
+    async def get_season_scores_for_league(self, league: League,
+                                           year: int) -> List[SeasonScore]:
+        raw_league_rosters = await self._get_raw_rosters(league.league_id)
+
+        return self._parser._create_season_scores_from_raw_rosters(
+            league, raw_league_rosters)
+
+    async def is_week_complete(self, league: League, week: int,
+                               year: int) -> bool:
+        return self._parser._is_week_complete(
+            await self._get_raw_nfl_state(), week, year)
+
+    async def is_season_complete(self, league: League, year: int) -> bool:
+        return self._parser._is_season_complete(
+            await self._get_raw_nfl_state(), year)
+
+    async def get_last_transaction_for_teams_in_league(
+            self, league: League, year: int) -> Dict[Team, Transaction]:
+        roster_id_to_last_transaction = {}
+
+        for week in self._parser._get_transaction_weeks_newest_first(
+                await self._get_raw_nfl_state(), year):
+            raw_transactions = await self._get_transactions_for_week(
+                league, week)
+            if self._parser._update_last_transaction_per_roster(
+                    league, roster_id_to_last_transaction, week,
+                    raw_transactions):
+                break
+
+        return self._parser._create_last_transaction_per_team(
+            league, roster_id_to_last_transaction)
+
+    async def get_inactive_rosters_for_league_and_week(
+            self,
+            league: League,
+            week: int,
+            year: int,
+            teams_to_ignore: List[str] = [],
+            only_teams: List[str] = [],
+            player_names_to_ignore: List[str] = []) -> List[InactiveRoster]:
+        raw_matchups = await asyncapi.get_matchups_for_league_and_week(
+            league.league_id, week, live_lineups=True)
+
+        return self._parser._create_inactive_rosters_from_raw_matchups(
+            league, week, raw_matchups, teams_to_ignore, only_teams,
+            player_names_to_ignore)
+
+    async def get_team_for_user(self, league: League, user: User) -> Team:
+        # Served entirely from the data stored when the leagues were fetched
+        return self._parser.get_team_for_user(league, user)
+
+    async def _get_transactions_for_every_week(self,
+                                               league: League) -> List[list]:
+        raw_transactions_per_week = self._parser._transaction_index.get_transactions_per_week(
+            league.league_id)
+
+        if raw_transactions_per_week is None:
+            raw_nfl_state = await self._get_raw_nfl_state()
+            raw_transactions_per_week = await asyncio.gather(*[
+                asyncapi.get_league_transactions_for_week(
+                    league.league_id, week, raw_nfl_state)
+                for week in transactionindex.TRANSACTION_WEEKS
+            ])
+            self._parser._transaction_index.store_transactions_per_week(
+                league.league_id, raw_transactions_per_week)
+
+        return raw_transactions_per_week
+
+    async def _get_transactions_for_week(self, league: League,
+                                         week: int) -> list:
+        raw_transactions_per_week = self._parser._transaction_index.get_transactions_per_week(
+            league.league_id)
+
+        if raw_transactions_per_week is not None:
+            return raw_transactions_per_week[
+                transactionindex.TRANSACTION_WEEKS.index(week)]
+
+        return await asyncapi.get_league_transactions_for_week(
+            league.league_id, week, await self._get_raw_nfl_state())
+
+    async def _get_raw_nfl_state(self):
+        return await self._parser._request_memo.get_async(
+            ("raw_nfl_state", ), asyncapi.get_nfl_state)
+
+    async def _get_raw_rosters(self, league_id: str):
+        return await self._parser._request_memo.get_async(
+            ("raw_rosters", league_id),
+            lambda: asyncapi.get_rosters_for_league(league_id))
+
+    async def _store_roster_and_user_data_for_leagues(
+            self, leagues: List[League]):
+        raw_rosters_per_league = await asyncio.gather(*[
+            self._get_raw_rosters(league.league_id)
+            for league in leagues
+        ])
+
+        # Pull the member list of every league with an owner we haven't seen
+        leagues_with_unknown_owners = [
+            league for league, raw_league_rosters in zip(
+                leagues, raw_rosters_per_league)
+            if self._parser._get_unknown_owner_ids(raw_league_rosters)
+        ]
+        users_per_league = await asyncio.gather(*[
+            asyncapi.get_users_for_league(league.league_id)
+            for league in leagues_with_unknown_owners
+        ])
+        for users in users_per_league:
+            self._parser._store_league_users(users)
+
+        # Anyone not in a member list gets looked up on their own. Managers are
+        # commonly in several of the same leagues, so only do that once each.
+        unknown_owner_ids = []
+        for raw_league_rosters in raw_rosters_per_league:
+            for owner_id in self._parser._get_unknown_owner_ids(
+                    raw_league_rosters):
+                if owner_id not in unknown_owner_ids:
+                    unknown_owner_ids.append(owner_id)
+
+        users = await asyncio.gather(*[
+            asyncapi.get_user_from_identifier(owner_id)
+            for owner_id in unknown_owner_ids
+        ])
+        for owner_id, user in zip(unknown_owner_ids, users):
+            self._parser._owner_id_to_user[owner_id] = user
+
+        for league, raw_league_rosters in zip(leagues, raw_rosters_per_league):
+            self._parser._store_roster_num_to_user_for_league(
+                league, raw_league_rosters)
+
+        await asyncio.to_thread(self._parser._write_user_data_to_file)
@@ -0,0 +1,356 @@
+"""
+   Copyright 2026 Kevin Emery
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import json
+import os
+import threading
+import time
+
+from collections.abc import Mapping as MappingBase
+from typing import Dict, Iterator, Mapping, Optional, Tuple
+
+from . import api
+from . import playerstore
+
+from ...model.player import Player
+
+# Binary store, see playerstore.py for the format
+PLAYER_DATA_FILE_PATH = "./data/sleeper_player_store"
+
+# Sleeper recommendation is a 24-hour refresh
+PLAYER_DATA_REFRESH_INTERVAL_SECONDS = 24 * 60 * 60
+
+# Injury statuses change through the week, so callers that care about them get
+# statuses at most this old, layered on top of the daily player data. Checking
+# them asks Sleeper for the player dump only if it has changed since the last
+# download, but if Sleeper ignores that the whole dump is downloaded again.
+PLAYER_STATUS_FILE_PATH = "./data/sleeper_player_statuses"
+PLAYER_STATUS_REFRESH_INTERVAL_SECONDS = 10 * 60
+
+
+# Player data shared by every Sleeper instance in the process. The first caller
+# loads it, and once it's a day old the next caller kicks off a refresh in the
+# background and keeps using the existing data until that finishes.
+#
+# A refresh swaps in a whole new map rather than editing the existing one, so
+# callers can hold on to the map they were handed. Nothing should modify the
+# players in it.
+class PlayerRegistry(object):
+    def __init__(self):
+        self._player_id_to_player: Mapping[str, Player] = None
+        self._static_player_id_to_player: Mapping[str, Player] = None
+        self._loaded_at = 0.0
+        self._statuses_refreshed_at = 0.0
+
+        # Identify the version of the player dump the data in use came from
+        self._validators: Dict[str, str] = {}
+        self._load_lock = threading.Lock()
+        self._refresh_thread_lock = threading.Lock()
+        self._refresh_thread: threading.Thread = None
+
+    def get_players(self,
+                    force_refresh: bool = False,
+                    fresh_statuses: bool = False) -> Mapping[str, Player]:
+        if force_refresh:
+            self._refresh_from_api(time.time())
+        elif self._player_id_to_player is None:
+            self._load()
+        elif self._is_stale():
+            self._start_background_refresh()
+
+        if fresh_statuses and self._are_statuses_stale():
+            self._refresh_statuses()
+
+        return self._player_id_to_player
+
+    def get_statuses_refreshed_at(self) -> float:
+        return self._statuses_refreshed_at
+
+    def _load(self):
+        with self._load_lock:
+            # Someone else may have finished loading while we waited
+            if self._player_id_to_player is not None:
+                return
+
+            player_id_to_player = None
+            if not _should_refresh_player_data_file():
+                player_id_to_player = _retrieve_player_data_from_file()
+                loaded_at = os.path.getmtime(PLAYER_DATA_FILE_PATH)
+
+                # The store doesn't keep which version of the dump it's from,
+                # so the first status check downloads it in full
+                validators = {}
+
+            if player_id_to_player is None:
+                player_id_to_player, validators = _retrieve_player_data_from_api(
+                )
+                loaded_at = time.time()
+
+            self._set_static_players(player_id_to_player, loaded_at,
+                                     validators)
+
+            # Statuses saved since the player data was written are newer
+            if os.path.exists(PLAYER_STATUS_FILE_PATH):
+                statuses_refreshed_at = os.path.getmtime(
+                    PLAYER_STATUS_FILE_PATH)
+                if statuses_refreshed_at > loaded_at:
+                    player_id_to_status, validators = _retrieve_player_statuses_from_file(
+                    )
+                    self._set_statuses(player_id_to_status,
+                                       statuses_refreshed_at, validators)
+
+    def _refresh_from_api(self, requested_at: float):
+        with self._load_lock:
+            # Callers that asked at the same time share a single download
+            if self._loaded_at >= requested_at:
+                return
+
+            player_id_to_player, validators = _retrieve_player_data_from_api()
+            self._set_static_players(player_id_to_player, time.time(),
+                                     validators)
+
+    def _refresh_statuses(self):
+        with self._load_lock:
+            if not self._are_statuses_stale():
+                return
+
+            response = _retrieve_player_statuses_from_api(self._validators)
+
+            # Nothing has changed since the data in use was downloaded, so the
+            # statuses we have are as fresh as a new download would be
+            if response is None:
+                self._statuses_refreshed_at = time.time()
+                return
+
+            player_id_to_status, validators = response
+            self._set_statuses(player_id_to_status, time.time(), validators)
+
+    def _set_static_players(self, player_id_to_player: Mapping[str, Player],
+                            loaded_at: float, validators: Dict[str, str]):
+        # Must hold _load_lock. The statuses in fresh player data are as new as
+        # any we have, so there's nothing to layer on top.
+        self._loaded_at = loaded_at
+        self._statuses_refreshed_at = loaded_at
+        self._validators = validators
+        self._static_player_id_to_player = player_id_to_player
+        self._player_id_to_player = player_id_to_player
+
+    def _set_statuses(self, player_id_to_status: Dict[str, str],
+                      refreshed_at: float, validators: Dict[str, str]):
+        # Must hold _load_lock
+        self._statuses_refreshed_at = refreshed_at
+        self._validators = validators
+        self._player_id_to_player = PlayerStatusOverlay(
+            self._static_player_id_to_player, player_id_to_status)
+
+    def _is_stale(self) -> bool:
+        return time.time(
+        ) - self._loaded_at > PLAYER_DATA_REFRESH_INTERVAL_SECONDS
+
+    def _are_statuses_stale(self) -> bool:
+        return time.time(
+        ) - self._statuses_refreshed_at > PLAYER_STATUS_REFRESH_INTERVAL_SECONDS
+
+    def _start_background_refresh(self):
+        # Separate from the load lock so callers never wait on a download here
+        with self._refresh_thread_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_in_background,
+                args=(time.time(), ),
+                daemon=True)
+            self._refresh_thread.start()
+
+    def _refresh_in_background(self, requested_at: float):
+        try:
+            self._refresh_from_api(requested_at)
+        except Exception as e:
+            # Keep serving the data we have, the next caller will try again
+            print("Background refresh of Sleeper player data failed")
+            print("Exception: {e}".format(e=e))
+
+
+# Player data with newer statuses swapped in. Players whose status hasn't
+# changed are handed back as-is, and players missing from the status list, like
+# the placeholder for an empty slot, keep the status they were stored with.
+class PlayerStatusOverlay(MappingBase):
+    def __init__(self, player_id_to_player: Mapping[str, Player],
+                 player_id_to_status: Dict[str, str]):
+        self._player_id_to_player = player_id_to_player
+        self._player_id_to_status = player_id_to_status
+        self._player_id_to_updated_player: Dict[str, Player] = {}
+
+    def __getitem__(self, player_id: str) -> Player:
+        player = self._player_id_to_updated_player.get(player_id)
+
+        if player is None:
+            player = self._player_id_to_player[player_id]
+
+            if player_id in self._player_id_to_status:
+                status = self._player_id_to_status[player_id]
+                if status != player.status:
+                    player = Player(player.player_id, player.name,
+                                    player.team, player.position, status)
+
+            self._player_id_to_updated_player[player_id] = player
+
+        return player
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._player_id_to_player)
+
+    def __len__(self) -> int:
+        return len(self._player_id_to_player)
+
+
+_player_registry = PlayerRegistry()
+
+
+def get_players(force_refresh: bool = False,
+                fresh_statuses: bool = False) -> Mapping[str, Player]:
+    return _player_registry.get_players(force_refresh, fresh_statuses)
+
+
+def get_statuses_refreshed_at() -> float:
+    return _player_registry.get_statuses_refreshed_at()
+
+
+def _should_refresh_player_data_file() -> bool:
+    if not os.path.exists(PLAYER_DATA_FILE_PATH):
+        return True
+
+    time_last_modified = int(os.path.getmtime(PLAYER_DATA_FILE_PATH))
+    time_now = int(time.time())
+
+    return time_now - time_last_modified > PLAYER_DATA_REFRESH_INTERVAL_SECONDS
+
+
+def _retrieve_player_data_from_api(
+) -> Tuple[Mapping[str, Player], Dict[str, str]]:
+    # This should be happening infrequently enough that we don't see this log often.
+    # If we see this more than expected, investigate
+    print("Retrieving player data from the Sleeper API")
+
+    # Without validators the dump always comes back
+    validators, raw_players = api.stream_all_players_if_changed({})
+    writer = playerstore.PlayerStoreWriter(PLAYER_DATA_FILE_PATH)
+
+    # Players are written to the store as they're parsed off the response, so
+    # neither the raw dump nor every Player object is held at once
+    try:
+        for player_id, raw_player in raw_players:
+            # The placeholder below takes this ID
+            if player_id == "0":
+                continue
+
+            writer.add(_create_player_from_raw_player(player_id, raw_player))
+
+        # Insert a dummy missing player at ID 0
+        writer.add(Player("0", "Missing", "None", "None", "None"))
+
+        # Every time we pull data from the API, write it out to the file. Serve
+        # from the file as well, rather than holding every decoded player.
+        writer.finish()
+    finally:
+        writer.close()
+
+    return playerstore.PlayerStore(PLAYER_DATA_FILE_PATH), validators
+
+
+def _create_player_from_raw_player(player_id: str, raw_player) -> Player:
+    player_name = "{first} {last}".format(first=raw_player["first_name"],
+                                          last=raw_player["last_name"])
+
+    # Most players have one position. Most common dual-position is LB/DL, who
+    # should really just all be treated as DL.
+    fantasy_positions = raw_player["fantasy_positions"]
+    position = None
+
+    if fantasy_positions is not None:
+        # If DL is in the list, treat them like a DL (as opposed to DT/Edge/DE or DL/LB)
+        if "DL" in fantasy_positions:
+            position = "DL"
+
+        # If WR is in the list, treat them like a WR (Travis Hunter)
+        if "WR" in fantasy_positions:
+            position = "WR"
+
+        # Otherwise grab the first, and likely only, position
+        else:
+            position = fantasy_positions[0]
+
+    return Player(player_id, player_name, raw_player["team"], position,
+                  raw_player["injury_status"])
+
+
+def _retrieve_player_data_from_file() -> Mapping[str, Player]:
+    # The assumption is made that if we get here, the file exists. A file
+    # from an older version of the format is treated like a missing one.
+    try:
+        return playerstore.PlayerStore(PLAYER_DATA_FILE_PATH)
+    except ValueError as e:
+        print("Exception: {e}".format(e=e))
+        return None
+
+
+def _retrieve_player_statuses_from_api(
+    validators: Dict[str, str]
+) -> Optional[Tuple[Dict[str, str], Dict[str, str]]]:
+    # There's no status-only endpoint. Sending the validators of the dump the
+    # data in use came from lets Sleeper skip the body when nothing's changed,
+    # in which case this returns None. Otherwise pulling out the one field is
+    # still far cheaper than rebuilding and rewriting the whole player store.
+    response = api.stream_all_players_if_changed(validators)
+    if response is None:
+        print("Sleeper player data unchanged, keeping current statuses")
+        return None
+
+    print("Retrieving player statuses from the Sleeper API")
+    validators, raw_players = response
+
+    player_id_to_status = {
+        player_id: raw_player["injury_status"]
+        for player_id, raw_player in raw_players
+    }
+
+    # Other processes may be reading the file, so never leave it half-written
+    temporary_file_path = "{path}.{pid}.tmp".format(
+        path=PLAYER_STATUS_FILE_PATH, pid=os.getpid())
+
+    with open(temporary_file_path, 'w') as file:
+        file.write(
+            json.dumps({
+                "validators": validators,
+                "statuses": player_id_to_status
+            }))
+
+    os.replace(temporary_file_path, PLAYER_STATUS_FILE_PATH)
+
+    return player_id_to_status, validators
+
+
+def _retrieve_player_statuses_from_file(
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    with open(PLAYER_STATUS_FILE_PATH, 'r') as file:
+        raw_data = json.load(file)
+
+    # Files written before validators were kept are just the statuses
+    if "statuses" not in raw_data:
+        return raw_data, {}
+
+    return raw_data["statuses"], raw_data["validators"]
@@ -0,0 +1,266 @@
+"""
+   Copyright 2026 Kevin Emery
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List
+
+from ...model.player import Player
+
+# Binary player store. Opening one only maps the file, and players are decoded
+# the first time they're looked up, so a command that touches a couple hundred
+# players doesn't pay to decode all of them.
+#
+# Layout, all little-endian:
+#   header
+#   string offsets   (string count + 1) u32 offsets into the shared strings
+#   shared strings   UTF-8 team, position and status values
+#   index            u32 record numbers, sorted by player ID
+#   records          one fixed-size record per player, in the order written
+#   text             UTF-8 player IDs and names
+#
+# Team, position and status repeat across thousands of players, so each is
+# stored once in the string table and records point at it by index. Records
+# stay in the order they were written so the store can be built as players
+# stream in, and the index puts them in order for lookups.
+MAGIC = b"SLPS"
+VERSION = 2
+
+# Magic, version, player count, string count, then the offsets of the string
+# table, index, records and text
+HEADER = struct.Struct("<4sHIIIIII")
+
+# ID offset and length, name offset and length, then team, position and status
+# indexes into the string table
+RECORD = struct.Struct("<IHIHHHH")
+
+INDEX_ENTRY = struct.Struct("<I")
+
+# Stands in for a None team, position or status
+NO_STRING = 0xFFFF
+
+
+class PlayerStore(Mapping):
+    def __init__(self, file_path: str):
+        with open(file_path, "rb") as file:
+            self._mapped_file = mmap.mmap(file.fileno(),
+                                          0,
+                                          access=mmap.ACCESS_READ)
+
+        (magic, version, self._player_count, string_count, strings_offset,
+         self._index_offset, self._records_offset,
+         self._text_offset) = HEADER.unpack_from(self._mapped_file, 0)
+
+        if magic != MAGIC or version != VERSION:
+            self._mapped_file.close()
+            raise ValueError(
+                "{path} is not a version {version} player store".format(
+                    path=file_path, version=VERSION))
+
+        # There are only a few dozen shared strings, decode them all up front
+        string_offsets = struct.unpack_from(
+            "<{count}I".format(count=string_count + 1), self._mapped_file,
+            strings_offset)
+        shared_strings_offset = strings_offset + 4 * (string_count + 1)
+        self._strings: List[str] = [
+            self._mapped_file[shared_strings_offset +
+                              string_offsets[i]:shared_strings_offset +
+                              string_offsets[i + 1]].decode("utf-8")
+            for i in range(string_count)
+        ]
+
+        # Players already decoded, so repeat lookups hand back the same object
+        self._player_id_to_player: Dict[str, Player] = {}
+
+    def __getitem__(self, player_id: str) -> Player:
+        player = self._player_id_to_player.get(player_id)
+
+        if player is None:
+            record_number = self._find_record_number(player_id)
+            if record_number is None:
+                raise KeyError(player_id)
+
+            player = self._decode_player(record_number)
+            self._player_id_to_player[player_id] = player
+
+        return player
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(self._player_count):
+            id_offset, id_length = self._read_record(
+                self._read_index(position))[:2]
+            yield self._read_text(id_offset, id_length)
+
+    def __len__(self) -> int:
+        return self._player_count
+
+    def close(self):
+        self._mapped_file.close()
+
+    def _find_record_number(self, player_id: str) -> int:
+        encoded_player_id = player_id.encode("utf-8")
+        low = 0
+        high = self._player_count - 1
+
+        while low <= high:
+            middle = (low + high) // 2
+            record_number = self._read_index(middle)
+            id_offset, id_length = self._read_record(record_number)[:2]
+            start = self._text_offset + id_offset
+            record_player_id = self._mapped_file[start:start + id_length]
+
+            if record_player_id == encoded_player_id:
+                return record_number
+            elif record_player_id < encoded_player_id:
+                low = middle + 1
+            else:
+                high = middle - 1
+
+        return None
+
+    def _decode_player(self, record_number: int) -> Player:
+        (id_offset, id_length, name_offset, name_length, team, position,
+         status) = self._read_record(record_number)
+
+        return Player(self._read_text(id_offset, id_length),
+                      self._read_text(name_offset, name_length),
+                      self._get_string(team), self._get_string(position),
+                      self._get_string(status))
+
+    def _read_index(self, position: int) -> int:
+        return INDEX_ENTRY.unpack_from(
+            self._mapped_file, self._index_offset + position * INDEX_ENTRY.size)[0]
+
+    def _read_record(self, record_number: int):
+        return RECORD.unpack_from(
+            self._mapped_file, self._records_offset + record_number * RECORD.size)
+
+    def _read_text(self, offset: int, length: int) -> str:
+        start = self._text_offset + offset
+        return self._mapped_file[start:start + length].decode("utf-8")
+
+    def _get_string(self, string_index: int) -> str:
+        if string_index == NO_STRING:
+            return None
+        return self._strings[string_index]
+
+
+# Builds a store one player at a time. Records and text go straight to scratch
+# files next to the store, so memory use doesn't grow with the player data
+# beyond the IDs kept for sorting.
+class PlayerStoreWriter(object):
+    def __init__(self, file_path: str):
+        self._file_path = file_path
+        directory = os.path.dirname(file_path) or "."
+        self._records_file = tempfile.TemporaryFile(dir=directory)
+        self._text_file = tempfile.TemporaryFile(dir=directory)
+        self._text_length = 0
+
+        self._shared_text = bytearray()
+        self._string_to_index: Dict[str, int] = {}
+        self._string_offsets: List[int] = []
+
+        # Encoded ID for each record, in record order
+        self._record_player_ids: List[bytes] = []
+
+    def add(self, player: Player):
+        encoded_player_id = player.player_id.encode("utf-8")
+
+        self._records_file.write(
+            RECORD.pack(*self._add_text(encoded_player_id),
+                        *self._add_text(player.name.encode("utf-8")),
+                        self._intern_string(player.team),
+                        self._intern_string(player.position),
+                        self._intern_string(player.status)))
+        self._record_player_ids.append(encoded_player_id)
+
+    def finish(self):
+        string_offsets = self._string_offsets + [len(self._shared_text)]
+        player_count = len(self._record_player_ids)
+
+        # Binary search compares the encoded IDs, so sort them the same way
+        index = sorted(range(player_count),
+                       key=self._record_player_ids.__getitem__)
+
+        strings_offset = HEADER.size
+        index_offset = strings_offset + 4 * len(string_offsets) + len(
+            self._shared_text)
+        records_offset = index_offset + INDEX_ENTRY.size * player_count
+        text_offset = records_offset + RECORD.size * player_count
+
+        # Other processes may have the store mapped, so never leave it half-written
+        temporary_file_path = "{path}.{pid}.tmp".format(path=self._file_path,
+                                                        pid=os.getpid())
+
+        with open(temporary_file_path, "wb") as file:
+            file.write(
+                HEADER.pack(MAGIC, VERSION, player_count,
+                            len(string_offsets) - 1, strings_offset,
+                            index_offset, records_offset, text_offset))
+            file.write(
+                struct.pack("<{count}I".format(count=len(string_offsets)),
+                            *string_offsets))
+            file.write(self._shared_text)
+            file.write(
+                struct.pack("<{count}I".format(count=player_count), *index))
+
+            for scratch_file in [self._records_file, self._text_file]:
+                scratch_file.seek(0)
+                shutil.copyfileobj(scratch_file, file)
+
+        self.close()
+        os.replace(temporary_file_path, self._file_path)
+
+    def close(self):
+        self._records_file.close()
+        self._text_file.close()
+
+    def _add_text(self, encoded_value: bytes):
+        offset = self._text_length
+        self._text_file.write(encoded_value)
+        self._text_length += len(encoded_value)
+        return offset, len(encoded_value)
+
+    def _intern_string(self, value: str) -> int:
+        if value is None:
+            return NO_STRING
+
+        if value not in self._string_to_index:
+            if len(self._string_offsets) >= NO_STRING:
+                raise ValueError(
+                    "Too many distinct team, position and status values")
+
+            self._string_to_index[value] = len(self._string_offsets)
+            self._string_offsets.append(len(self._shared_text))
+            self._shared_text.extend(value.encode("utf-8"))
+
+        return self._string_to_index[value]
+
+
+def write_player_store(file_path: str, players: Iterable[Player]):
+    writer = PlayerStoreWriter(file_path)
+
+    try:
+        for player in players:
+            writer.add(player)
+        writer.finish()
+    finally:
+        writer.close()
@@ -17,16 +17,22 @@
 import json
 import os
 import re
+import threading
 import time
 
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Mapping, Tuple
 
 from . import api
+from . import playerregistry
+from . import transactionindex
 
 from ..platform import Platform
+from ..requestmemo import RequestMemo
 
 from ... import common
+from ... import draftpickstore
+from ... import fanout
 from ...model.draft import Draft
 from ...model.draft import DraftType
 from ...model.draftedplayer import DraftedPlayer
@@ -35,7 +41,6 @@ from ...model.inactiveroster import InactiveRoster
 from ...model.league import League
 from ...model.league import LeagueType
 from ...model.player import Player
-from ...model.player import PlayerEncoder
 from ...model.roster import Roster
 from ...model.seasonscore import SeasonScore
 from ...model.team import Team
@@ -46,21 +51,28 @@ from ...model.user import User
 from ...model.weeklyscore import WeeklyScore
 
 # Directory is relative to the directory where script is run
-PLAYER_DATA_FILE_PATH = "./data/sleeper_player_data"
-
-# Sleeper recommendation is a 24-hour refresh
-PLAYER_DATA_REFRESH_INTERVAL_SECONDS = 24 * 60 * 60
+# Owner ID to user mapping saved from previous runs, with when each user was
+# fetched. Usernames can change, so each one is refetched after a day.
+USER_DATA_FILE_PATH = "./data/sleeper_user_data"
+USER_DATA_REFRESH_INTERVAL_SECONDS = 24 * 60 * 60
 
 
 class Sleeper(Platform):
-    def __init__(self, force_player_data_refresh: bool = False):
-        # Rather than do this lookup the first time we need it, just
-        # proactively retrieve all player data up front
-        self._player_id_to_player: Dict[str,
-                                        Player] = self._initialize_player_data(
-                                            force_player_data_refresh)
-        self._owner_id_to_user: Dict[str, User] = {}
+    def __init__(self,
+                 force_player_data_refresh: bool = False,
+                 fresh_player_statuses: bool = False):
+        # Player data is loaded once and shared by every instance in the
+        # process, so this is only slow for the first one. Asking for fresh
+        # statuses only refreshes injury statuses, and only every few minutes.
+        self._player_id_to_player: Mapping[
+            str, Player] = playerregistry.get_players(force_player_data_refresh,
+                                                      fresh_player_statuses)
+        self._owner_id_to_fetched_at: Dict[str, int] = {}
+        self._owner_id_to_user: Dict[str,
+                                     User] = self._initialize_user_data()
         self._league_id_to_roster_num_to_user: Dict[str, Dict[int, User]] = {}
+        self._transaction_index = transactionindex.TransactionIndex()
+        self._request_memo = RequestMemo()
 
     def get_admin_user_by_identifier(self, identifier: str) -> User:
         return api.get_user_from_identifier(identifier)
@@ -114,9 +126,19 @@ class Sleeper(Platform):
 
 
     def get_league(self, league_id: str) -> League:
-        raw_league = api.get_league(league_id)
+        return self._request_memo.get(
+            ("league", league_id), lambda: self._create_league_from_raw_league(
+                self._get_raw_league(league_id)))
+
+    def _get_raw_league(self, league_id: str):
+        return self._request_memo.get(("raw_league", league_id),
+                                      lambda: api.get_league(league_id))
 
-        return self._create_league_from_raw_league(raw_league)
+    def _remember_league(self, raw_league, league: League):
+        # The user's league list has every league in full, so anything that
+        # goes on to look one of them up doesn't have to fetch it again
+        self._request_memo.store(("raw_league", league.league_id), raw_league)
+        self._request_memo.store(("league", league.league_id), league)
 
     def get_all_leagues_for_user(
             self,
@@ -126,9 +148,21 @@ class Sleeper(Platform):
             name_substring: str = "",
             store_user_info: bool = True,
             include_pre_draft: bool = False) -> List[League]:
-        leagues = []
-
         raw_response_json = api.get_all_leagues_for_user(user, str(year))
+        leagues = self._create_matching_leagues_from_raw_response(
+            raw_response_json, name_regex, name_substring, include_pre_draft)
+
+        if store_user_info:
+            fanout.fan_out(self._store_roster_and_user_data_for_league,
+                           [(league, ) for league in leagues])
+            self._write_user_data_to_file()
+
+        return leagues
+
+    def _create_matching_leagues_from_raw_response(
+            self, raw_response_json, name_regex: re.Pattern,
+            name_substring: str, include_pre_draft: bool) -> List[League]:
+        leagues = []
 
         # We can treat None as just an empty response. This can happen in error
         # cases where we don't get a valid user.
@@ -137,12 +171,11 @@ class Sleeper(Platform):
 
         for raw_league in raw_response_json:
             league = self._create_league_from_raw_league(raw_league)
+            self._remember_league(raw_league, league)
 
             if (raw_league["status"] != "pre_draft"
                     or include_pre_draft) and self._league_name_matches(
                         league.name, name_substring, name_regex):
-                if store_user_info:
-                    self._store_roster_and_user_data_for_league(league)
                 leagues.append(league)
 
         return leagues
@@ -156,9 +189,51 @@ class Sleeper(Platform):
             self,
             league: League,
             year: int = common.DEFAULT_YEAR) -> List[DraftedPlayer]:
-        drafted_players = []
+        drafted_players = self._get_stored_drafted_players(league)
+        if drafted_players is not None:
+            return drafted_players
 
-        raw_draft_data = api.get_all_picks_for_draft(league.draft_id)
+        # Completed drafts never change, so their picks can be kept for good
+        raw_draft = api.get_draft(league.draft_id)
+        draft_complete = raw_draft["status"] == "complete"
+        raw_draft_data = api.get_all_picks_for_draft(league.draft_id,
+                                                     draft_complete)
+        drafted_players = self._create_drafted_players_from_raw_picks(
+            raw_draft_data)
+
+        if draft_complete:
+            self._store_drafted_players(league, drafted_players)
+
+        return drafted_players
+
+    def _get_stored_drafted_players(self,
+                                    league: League) -> List[DraftedPlayer]:
+        stored_picks = draftpickstore.lookup(
+            self._get_draft_pick_store_key(league))
+
+        if stored_picks is None:
+            return None
+
+        # Only IDs are stored, so players come out with today's team and status
+        return [
+            DraftedPlayer(self._player_id_to_player[player_id], pick_no)
+            for player_id, pick_no in stored_picks
+        ]
+
+    def _store_drafted_players(self, league: League,
+                               drafted_players: List[DraftedPlayer]):
+        draftpickstore.store(self._get_draft_pick_store_key(league),
+                             [[
+                                 drafted_player.player.player_id,
+                                 drafted_player.draft_position
+                             ] for drafted_player in drafted_players])
+
+    def _get_draft_pick_store_key(self, league: League) -> str:
+        return "sleeper:{draft_id}".format(draft_id=league.draft_id)
+
+    def _create_drafted_players_from_raw_picks(
+            self, raw_draft_data) -> List[DraftedPlayer]:
+        drafted_players = []
 
         for raw_draft_pick in raw_draft_data:
             drafted_players.append(
@@ -168,108 +243,173 @@ class Sleeper(Platform):
 
         return drafted_players
 
-    def get_all_trades_for_league(self, league: League,
-                                  year: int) -> List[Trade]:
+    def get_all_trades_for_league(self,
+                                  league: League,
+                                  year: int,
+                                  strict: bool = False) -> List[Trade]:
         all_trades = []
-        roster_num_to_user = self._league_id_to_roster_num_to_user[
-            league.league_id]
 
         # Save off the draft data in order to attribute picks
         raw_draft = api.get_draft(league.draft_id)
         draft = self._create_draft_from_response(raw_draft)
 
-        # Iterate through every week of the season (and then a couple more just to be sure)
-        for i in range(1, 20):
-            raw_transaction_data = api.get_league_transactions_for_week(
-                league.league_id, i)
+        raw_transaction_data_per_week = self._get_transactions_for_every_week(
+            league)
+        if strict:
+            self._check_every_week_fetched(league,
+                                           transactionindex.TRANSACTION_WEEKS,
+                                           raw_transaction_data_per_week)
+
+        for raw_transaction_data in raw_transaction_data_per_week:
+            all_trades.extend(
+                self._create_trades_from_raw_transactions(
+                    league, draft, raw_transaction_data))
 
-            # Guard against this coming back as None, and just skip the week
+        return all_trades
+
+    def get_newest_trades_for_league(self, league: League,
+                                     year: int) -> List[Trade]:
+        newest_trades = []
+
+        raw_draft = api.get_draft(league.draft_id)
+        draft = self._create_draft_from_response(raw_draft)
+
+        raw_nfl_state = self._get_raw_nfl_state()
+        weeks = self._get_newest_transaction_weeks(raw_nfl_state)
+        raw_transaction_data_per_week = [
+            api.get_league_transactions_for_week(league.league_id, week,
+                                                 raw_nfl_state)
+            for week in weeks
+        ]
+        self._check_every_week_fetched(league, weeks,
+                                       raw_transaction_data_per_week)
+
+        for raw_transaction_data in raw_transaction_data_per_week:
+            newest_trades.extend(
+                self._create_trades_from_raw_transactions(
+                    league, draft, raw_transaction_data))
+
+        return newest_trades
+
+    def _check_every_week_fetched(self, league: League, weeks: List[int],
+                                  raw_transaction_data_per_week: List[list]):
+        for week, raw_transaction_data in zip(weeks,
+                                              raw_transaction_data_per_week):
             if raw_transaction_data is None:
+                raise Exception(
+                    "Transactions for {league} week {week} failed to come back".
+                    format(league=league.name, week=week))
+
+    def _get_newest_transaction_weeks(self, raw_nfl_state) -> List[int]:
+        # Without the current week there's no telling which are newest
+        if raw_nfl_state is None:
+            return list(transactionindex.TRANSACTION_WEEKS)
+
+        # Include the week before, so trades from just before the week rolled
+        # over aren't missed. Offseason trades land in week 1.
+        current_week = max(raw_nfl_state["week"], 1)
+        return sorted({max(current_week - 1, 1), current_week})
+
+    def _create_trades_from_raw_transactions(self, league: League,
+                                             draft: Draft,
+                                             raw_transaction_data) -> List[Trade]:
+        trades = []
+        roster_num_to_user = self._league_id_to_roster_num_to_user[
+            league.league_id]
+
+        # Guard against this coming back as None, and just skip the week
+        if raw_transaction_data is None:
+            return trades
+
+        for transaction in raw_transaction_data:
+            if transaction["type"] != "trade":
                 continue
+            roster_id_to_trade_detail = {}
 
-            for transaction in raw_transaction_data:
-                if transaction["type"] != "trade":
-                    continue
-                roster_id_to_trade_detail = {}
+            # Initialize the list of trade details
+            for roster_id in transaction["roster_ids"]:
+                team = Team(
+                    roster_id, roster_num_to_user[roster_id],
+                    self._create_roster_link(league.league_id, roster_id))
+                roster_id_to_trade_detail[roster_id] = TradeDetail(team)
+
+            # Process adds
+            adds = transaction["adds"]
+            if adds is not None:
+                for player_id, roster_id in adds.items():
+                    roster_id_to_trade_detail[roster_id].add_player(
+                        self._player_id_to_player[player_id])
+
+            # Process drops
+            drops = transaction["drops"]
+            if drops is not None:
+                for player_id, roster_id in drops.items():
+                    roster_id_to_trade_detail[roster_id].lose_player(
+                        self._player_id_to_player[player_id])
+
+            # Process faab
+            faab_changes = transaction["waiver_budget"]
+            for line_item in faab_changes:
+                roster_id_to_trade_detail[line_item["sender"]].lose_faab(
+                    line_item["amount"])
+                roster_id_to_trade_detail[line_item["receiver"]].add_faab(
+                    line_item["amount"])
+
+            # Process draft picks
+            draft_picks = transaction["draft_picks"]
+            for pick in draft_picks:
+                # Include draft slot if it's for the current year
+                if pick["season"] == draft.year:
+                    # Owner id is the person who received the draft pick
+                    roster_id_to_trade_detail[
+                        pick["owner_id"]].add_draft_pick_with_slot(
+                            pick["season"], pick["round"],
+                            draft.get_pick_num_within_round(
+                                pick["roster_id"], pick["round"]))
+
+                    # Previous owner is who is trading it away
+                    roster_id_to_trade_detail[pick[
+                        "previous_owner_id"]].lose_draft_pick_with_slot(
+                            pick["season"], pick["round"],
+                            draft.get_pick_num_within_round(
+                                pick["roster_id"], pick["round"]))
+
+                # Otherwise just do the generic year/round
+                else:
+                    # Owner id is the person who received the draft pick
+                    roster_id_to_trade_detail[
+                        pick["owner_id"]].add_draft_pick(
+                            pick["season"], pick["round"])
 
-                # Initialize the list of trade details
-                for roster_id in transaction["roster_ids"]:
-                    team = Team(
-                        roster_id, roster_num_to_user[roster_id],
-                        self._create_roster_link(league.league_id, roster_id))
-                    roster_id_to_trade_detail[roster_id] = TradeDetail(team)
-
-                # Process adds
-                adds = transaction["adds"]
-                if adds is not None:
-                    for player_id, roster_id in adds.items():
-                        roster_id_to_trade_detail[roster_id].add_player(
-                            self._player_id_to_player[player_id])
-
-                # Process drops
-                drops = transaction["drops"]
-                if drops is not None:
-                    for player_id, roster_id in drops.items():
-                        roster_id_to_trade_detail[roster_id].lose_player(
-                            self._player_id_to_player[player_id])
-
-                # Process faab
-                faab_changes = transaction["waiver_budget"]
-                for line_item in faab_changes:
-                    roster_id_to_trade_detail[line_item["sender"]].lose_faab(
-                        line_item["amount"])
-                    roster_id_to_trade_detail[line_item["receiver"]].add_faab(
-                        line_item["amount"])
-
-                # Process draft picks
-                draft_picks = transaction["draft_picks"]
-                for pick in draft_picks:
-                    # Include draft slot if it's for the current year
-                    if pick["season"] == draft.year:
-                        # Owner id is the person who received the draft pick
-                        roster_id_to_trade_detail[
-                            pick["owner_id"]].add_draft_pick_with_slot(
-                                pick["season"], pick["round"],
-                                draft.get_pick_num_within_round(
-                                    pick["roster_id"], pick["round"]))
-
-                        # Previous owner is who is trading it away
-                        roster_id_to_trade_detail[pick[
-                            "previous_owner_id"]].lose_draft_pick_with_slot(
-                                pick["season"], pick["round"],
-                                draft.get_pick_num_within_round(
-                                    pick["roster_id"], pick["round"]))
-
-                    # Otherwise just do the generic year/round
-                    else:
-                        # Owner id is the person who received the draft pick
-                        roster_id_to_trade_detail[
-                            pick["owner_id"]].add_draft_pick(
-                                pick["season"], pick["round"])
-
-                        # Previous owner is who is trading it away
-                        roster_id_to_trade_detail[
-                            pick["previous_owner_id"]].lose_draft_pick(
-                                pick["season"], pick["round"])
-
-                all_details = []
-                for roster_id in roster_id_to_trade_detail:
-                    all_details.append(roster_id_to_trade_detail[roster_id])
+                    # Previous owner is who is trading it away
+                    roster_id_to_trade_detail[
+                        pick["previous_owner_id"]].lose_draft_pick(
+                            pick["season"], pick["round"])
 
-                transaction_time = datetime.fromtimestamp(
-                    transaction["status_updated"] / 1000)
-                trade_id = transaction["transaction_id"]
-                all_trades.append(
-                    Trade(trade_id, league, transaction_time, all_details))
+            all_details = []
+            for roster_id in roster_id_to_trade_detail:
+                all_details.append(roster_id_to_trade_detail[roster_id])
 
-        return all_trades
+            transaction_time = datetime.fromtimestamp(
+                transaction["status_updated"] / 1000)
+            trade_id = transaction["transaction_id"]
+            trades.append(
+                Trade(trade_id, league, transaction_time, all_details))
+
+        return trades
 
     def get_weekly_scores_for_league_and_week(self, league: League, week: int,
                                               year: int) -> List[WeeklyScore]:
-        weekly_scores = []
-
         weekly_matchups = api.get_matchups_for_league_and_week(
-            league.league_id, week)
+            league.league_id, week, self._get_raw_nfl_state())
+
+        return self._create_weekly_scores_from_raw_matchups(
+            league, week, weekly_matchups)
+
+    def _create_weekly_scores_from_raw_matchups(
+            self, league: League, week: int,
+            weekly_matchups) -> List[WeeklyScore]:
+        weekly_scores = []
         roster_num_to_user = self._league_id_to_roster_num_to_user[
             league.league_id]
 
@@ -285,8 +425,36 @@ class Sleeper(Platform):
 
     def get_season_scores_for_league(self, league: League,
                                      year: int) -> List[SeasonScore]:
+        raw_league_rosters = self._get_raw_rosters(league.league_id)
+
+        return self._create_season_scores_from_raw_rosters(
+            league, raw_league_rosters)
+
+    def is_week_complete(self, league: League, week: int, year: int) -> bool:
+        return self._is_week_complete(self._get_raw_nfl_state(), week, year)
+
+    def _is_week_complete(self, raw_nfl_state, week: int, year: int) -> bool:
+        # Without the NFL state, assume nothing is final
+        if raw_nfl_state is None:
+            return False
+
+        if self._is_season_complete(raw_nfl_state, year):
+            return True
+
+        return str(raw_nfl_state["season"]) == str(
+            year) and api.is_week_final(week, raw_nfl_state)
+
+    def is_season_complete(self, league: League, year: int) -> bool:
+        return self._is_season_complete(self._get_raw_nfl_state(), year)
+
+    def _is_season_complete(self, raw_nfl_state, year: int) -> bool:
+        # The state only moves on to the next season once this one is over
+        return raw_nfl_state is not None and int(
+            raw_nfl_state["season"]) > year
+
+    def _create_season_scores_from_raw_rosters(
+            self, league: League, raw_league_rosters) -> List[SeasonScore]:
         season_scores = []
-        raw_league_rosters = api.get_rosters_for_league(league.league_id)
         roster_num_to_user = self._league_id_to_roster_num_to_user[
             league.league_id]
 
@@ -309,50 +477,109 @@ class Sleeper(Platform):
 
     def get_last_transaction_for_teams_in_league(
             self, league: League, year: int) -> Dict[Team, Transaction]:
-        last_transaction_per_team = {}
-        all_transactions = []
-        roster_num_to_user = self._league_id_to_roster_num_to_user[
-            league.league_id]
-
-        # Iterate through every week of the season (and then a couple more
-        # just to be sure),  gathering all of the transactions
-        # A potential optimization would be to combine this step with the
-        # "one per team" logic by starting at the end. But that assumes either
-        # ordering within each week on the API or requires logic to order each
-        # week, and frankly not doing that is just easier for now.
-        for week in range(1, 20):
-            raw_transactions = api.get_league_transactions_for_week(
-                league.league_id, week)
-
+        roster_id_to_last_transaction = {}
+
+        # Go from the newest week back, and stop once every team has turned up
+        for week in self._get_transaction_weeks_newest_first(
+                self._get_raw_nfl_state(), year):
+            raw_transactions = self._get_transactions_for_week(league, week)
+            if self._update_last_transaction_per_roster(
+                    league, roster_id_to_last_transaction, week,
+                    raw_transactions):
+                break
+
+        return self._create_last_transaction_per_team(
+            league, roster_id_to_last_transaction)
+
+    def _get_transaction_weeks_newest_first(self, raw_nfl_state,
+                                            year: int) -> List[int]:
+        # Past seasons, or no NFL state at all, start from the last week
+        if raw_nfl_state is None or str(raw_nfl_state["season"]) != str(year):
+            return list(reversed(transactionindex.TRANSACTION_WEEKS))
+
+        current_week = max(raw_nfl_state["week"], 1)
+        return [
+            week for week in reversed(transactionindex.TRANSACTION_WEEKS)
+            if week <= current_week
+        ]
+
+    def _get_transactions_for_week(self, league: League, week: int) -> list:
+        # A whole season already pulled, e.g. for trades, costs nothing here
+        raw_transactions_per_week = self._transaction_index.get_transactions_per_week(
+            league.league_id)
+
+        if raw_transactions_per_week is not None:
+            return raw_transactions_per_week[
+                transactionindex.TRANSACTION_WEEKS.index(week)]
+
+        return api.get_league_transactions_for_week(league.league_id, week,
+                                                    self._get_raw_nfl_state())
+
+    def _get_transactions_for_every_week(self, league: League) -> List[list]:
+        raw_transactions_per_week = self._transaction_index.get_transactions_per_week(
+            league.league_id)
+
+        if raw_transactions_per_week is None:
+            raw_nfl_state = self._get_raw_nfl_state()
+            raw_transactions_per_week = [
+                api.get_league_transactions_for_week(league.league_id, week,
+                                                     raw_nfl_state)
+                for week in transactionindex.TRANSACTION_WEEKS
+            ]
+            self._transaction_index.store_transactions_per_week(
+                league.league_id, raw_transactions_per_week)
+
+        return raw_transactions_per_week
+
+    def _update_last_transaction_per_roster(
+            self, league: League,
+            roster_id_to_last_transaction: Dict[int, Tuple[datetime, str, int]],
+            week: int, raw_transactions) -> bool:
+        # Guard against this coming back as None, and just skip the week
+        if raw_transactions is not None:
             for raw_transaction in raw_transactions:
                 transaction_time = datetime.fromtimestamp(
                     raw_transaction["status_updated"] / 1000)
-                transaction_type = raw_transaction["type"]
 
-                # Creates a transaction entry for each involved team, which is easier to parse
-                # afterwards
                 for roster_id in raw_transaction["roster_ids"]:
-                    team = Team(
-                        roster_id, roster_num_to_user[roster_id],
-                        self._create_roster_link(league.league_id, roster_id))
-                    all_transactions.append(
-                        Transaction(transaction_time, transaction_type, team))
-
-        # Sort the transactions last to first and grab each team's most recent
-        all_transactions.sort(reverse=True)
-
-        for transaction in all_transactions:
-            if transaction.team not in last_transaction_per_team:
-                last_transaction_per_team[transaction.team] = transaction
+                    last_transaction = roster_id_to_last_transaction.get(
+                        roster_id)
+
+                    # Ties go to the earlier week, then whichever is listed
+                    # first within the week
+                    if last_transaction is None or transaction_time > last_transaction[
+                            0] or (transaction_time == last_transaction[0]
+                                   and week < last_transaction[2]):
+                        roster_id_to_last_transaction[roster_id] = (
+                            transaction_time, raw_transaction["type"], week)
+
+        # Weeks are processed in order, so nothing further back can be newer
+        # than what's been found once every team has something
+        return len(roster_id_to_last_transaction) >= league.size
+
+    def _create_last_transaction_per_team(
+        self, league: League,
+        roster_id_to_last_transaction: Dict[int, Tuple[datetime, str, int]]
+    ) -> Dict[Team, Transaction]:
+        last_transaction_per_team = {}
+        roster_num_to_user = self._league_id_to_roster_num_to_user[
+            league.league_id]
 
-            if len(last_transaction_per_team) >= league.size:
-                return last_transaction_per_team
+        roster_ids = set(range(1, league.size + 1))
+        roster_ids.update(roster_id_to_last_transaction)
 
-        # Backfill data for any team that doesn't have a transaction
-        for roster_id in range(1, league.size + 1):
+        for roster_id in sorted(roster_ids):
             team = Team(roster_id, roster_num_to_user[roster_id],
                         self._create_roster_link(league.league_id, roster_id))
-            if team not in last_transaction_per_team:
+
+            if roster_id in roster_id_to_last_transaction:
+                transaction_time, transaction_type, _ = roster_id_to_last_transaction[
+                    roster_id]
+                last_transaction_per_team[team] = Transaction(
+                    transaction_time, transaction_type, team)
+
+            # Backfill data for any team that doesn't have a transaction
+            else:
                 last_transaction_per_team[team] = Transaction(
                     datetime.fromtimestamp(common.DEC_31_1999_SECONDS), "None",
                     team)
@@ -367,13 +594,38 @@ class Sleeper(Platform):
             teams_to_ignore: List[str] = [],
             only_teams: List[str] = [],
             player_names_to_ignore: List[str] = []) -> List[InactiveRoster]:
+        raw_matchups = api.get_matchups_for_league_and_week(
+            league.league_id, week, live_lineups=True)
+
+        return self._create_inactive_rosters_from_raw_matchups(
+            league, week, raw_matchups, teams_to_ignore, only_teams,
+            player_names_to_ignore)
+
+    def get_inactive_rosters_for_leagues_and_week(
+            self,
+            leagues: List[League],
+            week: int,
+            year: int,
+            teams_to_ignore: List[str] = [],
+            only_teams: List[str] = [],
+            player_names_to_ignore: List[str] = [],
+            max_workers: int = fanout.DEFAULT_MAX_WORKERS
+    ) -> List[List[InactiveRoster]]:
+        # A single request per league, so one league per worker
+        return fanout.fan_out(
+            self.get_inactive_rosters_for_league_and_week,
+            [(league, week, year, teams_to_ignore, only_teams,
+              player_names_to_ignore) for league in leagues], max_workers)
+
+    def _create_inactive_rosters_from_raw_matchups(
+            self, league: League, week: int, raw_matchups,
+            teams_to_ignore: List[str], only_teams: List[str],
+            player_names_to_ignore: List[str]) -> List[InactiveRoster]:
         inactive_rosters = []
         roster_num_to_user = self._league_id_to_roster_num_to_user[
             league.league_id]
         teams_on_bye = common.TEAMS_ON_BYE[week]
 
-        raw_matchups = api.get_matchups_for_league_and_week(
-            league.league_id, week)
         for raw_matchup in raw_matchups:
             roster_id = raw_matchup["roster_id"]
             user = roster_num_to_user[roster_id]
@@ -403,8 +655,10 @@ class Sleeper(Platform):
                 if player.is_inactive():
                     inactive_players.append(player)
                 elif player.team in teams_on_bye:
-                    player.status = "BYE"
-                    inactive_players.append(player)
+                    # The registry's players are shared, so mark a copy
+                    inactive_players.append(
+                        Player(player.player_id, player.name, player.team,
+                               player.position, "BYE"))
 
             if inactive_players:
                 team = Team(
@@ -430,48 +684,69 @@ class Sleeper(Platform):
 
     def get_roster_for_league_and_user(self, league: League,
                                        user: User) -> Roster:
-        raw_rosters = api.get_rosters_for_league(league.league_id)
+        raw_rosters = self._get_raw_rosters(league.league_id)
 
         for raw_roster in raw_rosters:
             if raw_roster["owner_id"] == user.user_id or raw_roster[
                     "co_owners"] and user.user_id in raw_roster["co_owners"]:
-                return self._creater_roster_from_raw_roster(raw_roster, league.league_id)
+                return self._creater_roster_from_raw_roster(
+                    raw_roster, league,
+                    self._get_future_draft_picks_for_roster(
+                        league, raw_roster["roster_id"]))
 
         return None
 
 
     def get_roster_for_league_id_and_roster_id(self, league_id: str, roster_id: str) -> Roster:
-        raw_rosters = api.get_rosters_for_league(league_id)
+        raw_rosters = self._get_raw_rosters(league_id)
         league = self.get_league(league_id)
 
         for raw_roster in raw_rosters:
             if raw_roster["roster_id"] == int(roster_id):
-                return self._creater_roster_from_raw_roster(raw_roster, league_id)
+                return self._creater_roster_from_raw_roster(
+                    raw_roster, league,
+                    self._get_future_draft_picks_for_roster(
+                        league, raw_roster["roster_id"]))
 
         return None
 
-
-    def _creater_roster_from_raw_roster(self, raw_roster, league_id: str) -> Roster:
-        league = self.get_league(league_id)
+    # Every team's roster, from one fetch each of the rosters, the draft and the
+    # traded picks no matter how many teams are in the league
+    def get_all_rosters_for_league(self, league: League) -> List[Roster]:
+        raw_rosters = self._get_raw_rosters(league.league_id)
+        roster_id_to_future_picks = self._get_future_draft_picks_for_rosters(
+            league, [raw_roster["roster_id"] for raw_roster in raw_rosters])
+
+        return [
+            self._creater_roster_from_raw_roster(
+                raw_roster, league,
+                roster_id_to_future_picks[raw_roster["roster_id"]])
+            for raw_roster in raw_rosters
+        ]
+
+
+    def _creater_roster_from_raw_roster(
+            self, raw_roster, league: League,
+            future_picks: List[FutureDraftPick]) -> Roster:
+        league_id = league.league_id
         roster_id = raw_roster["roster_id"]
         starters = []
         bench = []
         taxi = []
-        future_picks = self._get_future_draft_picks_for_roster(
-            league, roster_id)
 
         team = Team(
             roster_id, User("0", "John Smith"),
             self._create_roster_link(league_id, roster_id))
 
         if raw_roster["players"]:
+            starter_ids = set(raw_roster["starters"] or [])
+            taxi_ids = set(raw_roster["taxi"] or [])
+
             for player_id in raw_roster["players"]:
                 player = self._player_id_to_player[player_id]
-                if player_id in raw_roster["starters"]:
+                if player_id in starter_ids:
                     starters.append(player)
-                elif raw_roster[
-                        "taxi"] is not None and player_id in raw_roster[
-                            "taxi"]:
+                elif player_id in taxi_ids:
                     taxi.append(player)
                 else:
                     bench.append(player)
@@ -481,7 +756,7 @@ class Sleeper(Platform):
 
     def get_roster_from_draft(self, league: League, user: User) -> Roster:
         raw_draft_data = api.get_all_picks_for_draft(league.draft_id)
-        raw_rosters = api.get_rosters_for_league(league.league_id)
+        raw_rosters = self._get_raw_rosters(league.league_id)
 
         roster_id = 0
         for raw_roster in raw_rosters:
@@ -510,16 +785,22 @@ class Sleeper(Platform):
 
     def _get_future_draft_picks_for_roster(
             self, league: League, roster_id: int) -> List[FutureDraftPick]:
+        return self._get_future_draft_picks_for_rosters(
+            league, [roster_id])[roster_id]
+
+    def _get_future_draft_picks_for_rosters(
+            self, league: League,
+            roster_ids: List[int]) -> Dict[int, List[FutureDraftPick]]:
         if league.type != LeagueType.DYNASTY:
-            return []
+            return {roster_id: [] for roster_id in roster_ids}
 
-        draft_picks = []
+        roster_id_to_draft_picks = {}
 
-        raw_draft = api.get_draft(league.draft_id)
-        raw_league = api.get_league(league.league_id)
-        current_draft = self._create_draft_from_response(raw_draft)
+        raw_draft = self._get_raw_draft(league.draft_id)
+        raw_league = self._get_raw_league(league.league_id)
+        current_draft = self._get_draft(league.draft_id)
 
-        # Initialize the base set of picks for a team
+        # Initialize the base set of picks for each team
         current_year = int(current_draft.year)
         starting_year = current_year
 
@@ -529,18 +810,21 @@ class Sleeper(Platform):
         current_year_draft_rounds = raw_draft["settings"]["rounds"]
         future_year_draft_rounds = raw_league["settings"]["draft_rounds"]
 
-        for year in range(starting_year, starting_year + 3):
-            if year == current_year:
-                for round in range(1, current_year_draft_rounds + 1):
-                    draft_picks.append(FutureDraftPick(year, 
-                                                      round,
-                                                      current_draft.get_pick_num_within_round(roster_id, round)))
-            else:
-                for round in range(1, future_year_draft_rounds + 1): 
-                    draft_picks.append(FutureDraftPick(year, round))
+        for roster_id in roster_ids:
+            draft_picks = []
+            for year in range(starting_year, starting_year + 3):
+                if year == current_year:
+                    for round in range(1, current_year_draft_rounds + 1):
+                        draft_picks.append(FutureDraftPick(year, 
+                                                          round,
+                                                          current_draft.get_pick_num_within_round(roster_id, round)))
+                else:
+                    for round in range(1, future_year_draft_rounds + 1): 
+                        draft_picks.append(FutureDraftPick(year, round))
+            roster_id_to_draft_picks[roster_id] = draft_picks
 
-        # Parse through all of the pick trades
-        all_traded_picks = api.get_traded_picks(league.league_id)
+        # Parse through all of the pick trades, once for every team
+        all_traded_picks = self._get_raw_traded_picks(league.league_id)
 
         for pick in all_traded_picks:
             year = int(pick["season"])
@@ -555,20 +839,47 @@ class Sleeper(Platform):
             else:
                 traded_pick = FutureDraftPick(year, pick_round)
 
-            # They traded for a pick
-            if pick["owner_id"] == roster_id:
-                draft_picks.append(traded_pick)
+            # Someone traded for a pick
+            if pick["owner_id"] in roster_id_to_draft_picks:
+                roster_id_to_draft_picks[pick["owner_id"]].append(traded_pick)
 
-            # Their pick was traded, and they're not the owner of it
-            if pick["roster_id"] == roster_id and pick["owner_id"] != roster_id:
+            # A pick was traded, and its original team isn't the owner of it
+            if pick["roster_id"] in roster_id_to_draft_picks and pick[
+                    "owner_id"] != pick["roster_id"]:
                 try:
-                    draft_picks.remove(traded_pick)
+                    roster_id_to_draft_picks[pick["roster_id"]].remove(
+                        traded_pick)
                 except Exception as e:
                     print("Error removing pick " + str(traded_pick) + " from team.")
                 
 
-        draft_picks.sort()
-        return draft_picks
+        for draft_picks in roster_id_to_draft_picks.values():
+            draft_picks.sort()
+        return roster_id_to_draft_picks
+
+    def _get_raw_rosters(self, league_id: str):
+        return self._request_memo.get(
+            ("raw_rosters", league_id),
+            lambda: api.get_rosters_for_league(league_id))
+
+    def _get_raw_draft(self, draft_id: str):
+        return self._request_memo.get(("raw_draft", draft_id),
+                                      lambda: api.get_draft(draft_id))
+
+    def _get_draft(self, draft_id: str) -> Draft:
+        return self._request_memo.get(
+            ("draft", draft_id), lambda: self._create_draft_from_response(
+                self._get_raw_draft(draft_id)))
+
+    def _get_raw_nfl_state(self):
+        # Fetched once for everything this instance does, rather than before
+        # every request whose cache lifetime depends on it
+        return self._request_memo.get(("raw_nfl_state", ), api.get_nfl_state)
+
+    def _get_raw_traded_picks(self, league_id: str):
+        return self._request_memo.get(
+            ("raw_traded_picks", league_id),
+            lambda: api.get_traded_picks(league_id))
 
     def _create_draft_from_response(self, raw_draft) -> Draft:
         raw_draft_type = raw_draft["type"]
@@ -598,98 +909,108 @@ class Sleeper(Platform):
         return template.format(league_id=league_id, roster_id=str(roster_id))
 
     def _store_roster_and_user_data_for_league(self, league: League):
-        raw_league_rosters = api.get_rosters_for_league(league.league_id)
-
-        roster_num_to_user = {}
-
-        for roster in raw_league_rosters:
-            owner_id = roster["owner_id"]
-
-            if owner_id not in self._owner_id_to_user:
-                user = api.get_user_from_identifier(owner_id)
-                self._owner_id_to_user[owner_id] = user
-
-            user = self._owner_id_to_user[owner_id]
-            roster_num_to_user[roster["roster_id"]] = user
-
-        self._league_id_to_roster_num_to_user[
-            league.league_id] = roster_num_to_user
-
-    def _initialize_player_data(self,
-                                force_refresh: bool) -> Dict[str, Player]:
-        if force_refresh or self._should_refresh_player_data():
-            return self._retrieve_player_data_from_api()
-
-        return self._retrieve_player_data_from_file()
-
-    def _should_refresh_player_data(self) -> bool:
-        if not os.path.exists(PLAYER_DATA_FILE_PATH):
-            return True
-
-        time_last_modified = int(os.path.getmtime(PLAYER_DATA_FILE_PATH))
-        time_now = int(time.time())
-
-        return time_now - time_last_modified > PLAYER_DATA_REFRESH_INTERVAL_SECONDS
-
-    def _retrieve_player_data_from_api(self) -> Dict[str, Player]:
-        # This should be happening infrequently enough that we don't see this log often.
-        # If we see this more than expected, investigate
-        print("Retrieving player data from the Sleeper API")
-        player_id_to_player = {}
+        raw_league_rosters = self._get_raw_rosters(league.league_id)
 
-        raw_player_map = api.get_all_players()
+        # Pull every member of the league in one request, rather than one for
+        # each owner we haven't seen before
+        if self._get_unknown_owner_ids(raw_league_rosters):
+            self._store_league_users(api.get_users_for_league(league.league_id))
 
-        for player_id in raw_player_map:
-            raw_player = raw_player_map[player_id]
-            player_name = "{first} {last}".format(
-                first=raw_player["first_name"], last=raw_player["last_name"])
+        # Anyone not in the league's member list gets looked up on their own
+        for owner_id in self._get_unknown_owner_ids(raw_league_rosters):
+            self._owner_id_to_user[owner_id] = api.get_user_from_identifier(
+                owner_id)
 
-            # Most players have one position. Most common dual-position is LB/DL, who
-            # should really just all be treated as DL.
-            fantasy_positions = raw_player["fantasy_positions"]
-            position = None
+        self._store_roster_num_to_user_for_league(league, raw_league_rosters)
 
-            if fantasy_positions is not None:
-                # If DL is in the list, treat them like a DL (as opposed to DT/Edge/DE or DL/LB)
-                if "DL" in fantasy_positions:
-                    position = "DL"
+    def _get_unknown_owner_ids(self, raw_league_rosters) -> List[str]:
+        unknown_owner_ids = []
 
-                # If WR is in the list, treat them like a WR (Travis Hunter)
-                if "WR" in fantasy_positions:
-                    position = "WR"
-
-                # Otherwise grab the first, and likely only, position
-                else:
-                    position = fantasy_positions[0]
-
-            player_id_to_player[player_id] = Player(
-                player_id, player_name, raw_player["team"], position,
-                raw_player["injury_status"])
+        for roster in raw_league_rosters:
+            owner_id = roster["owner_id"]
+            if owner_id not in self._owner_id_to_user and owner_id not in unknown_owner_ids:
+                unknown_owner_ids.append(owner_id)
 
-        # Insert a dummy missing player at ID 0
-        player_id_to_player["0"] = Player("0", "Missing", "None", "None",
-                                          "None")
+        return unknown_owner_ids
 
-        # Every time we pull data from the API, write it out to the file
-        self._write_player_data_to_file(player_id_to_player)
+    def _store_league_users(self, users: List[User]):
+        for user in users:
+            self._owner_id_to_user[user.user_id] = user
 
-        return player_id_to_player
+    def _store_roster_num_to_user_for_league(self, league: League,
+                                             raw_league_rosters):
+        # Every owner needs to already be in _owner_id_to_user
+        roster_num_to_user = {}
 
-    def _retrieve_player_data_from_file(self) -> Dict[str, Player]:
-        # The assumption is made that if we get here, the file exists
-        data = {}
-        with open(PLAYER_DATA_FILE_PATH, 'r') as file:
-            raw_data = json.load(file)
+        for roster in raw_league_rosters:
+            user = self._owner_id_to_user[roster["owner_id"]]
+            roster_num_to_user[roster["roster_id"]] = user
 
-            for player_id, player_raw_data in raw_data.items():
-                data[player_id] = Player(player_raw_data["player_id"],
-                                         player_raw_data["name"],
-                                         player_raw_data["team"],
-                                         player_raw_data["position"],
-                                         player_raw_data["status"])
+        self._league_id_to_roster_num_to_user[
+            league.league_id] = roster_num_to_user
 
-        return data
+    def _initialize_user_data(self) -> Dict[str, User]:
+        if not os.path.exists(USER_DATA_FILE_PATH):
+            return {}
+
+        try:
+            time_last_modified = int(os.path.getmtime(USER_DATA_FILE_PATH))
+            with open(USER_DATA_FILE_PATH, 'r') as file:
+                raw_data = json.load(file)
+
+            owner_id_to_user = {}
+            for owner_id, raw_user in raw_data.items():
+                # Files from before per-user times only have the name, so
+                # they're as old as the file itself
+                if isinstance(raw_user, str):
+                    raw_user = {
+                        "name": raw_user,
+                        "fetched_at": time_last_modified
+                    }
+
+                fetched_at = int(raw_user["fetched_at"])
+                if int(time.time()) - fetched_at > USER_DATA_REFRESH_INTERVAL_SECONDS:
+                    continue
 
-    def _write_player_data_to_file(self, player_data: Dict[str, Player]):
-        with open(PLAYER_DATA_FILE_PATH, 'w') as file:
-            file.write(json.dumps(player_data, cls=PlayerEncoder))
+                owner_id_to_user[owner_id] = User(owner_id, raw_user["name"])
+                self._owner_id_to_fetched_at[owner_id] = fetched_at
+        except (OSError, ValueError, AttributeError, KeyError, TypeError):
+            # Treat a corrupt or unreadable file as empty, it'll be overwritten
+            self._owner_id_to_fetched_at.clear()
+            return {}
+
+        return owner_id_to_user
+
+    def _write_user_data_to_file(self):
+        # Anyone without a fetch time was looked up during this run
+        now = int(time.time())
+        fetched_new_users = False
+        for owner_id in self._owner_id_to_user:
+            if owner_id not in self._owner_id_to_fetched_at:
+                self._owner_id_to_fetched_at[owner_id] = now
+                fetched_new_users = True
+
+        if not fetched_new_users:
+            return
+
+        # Only keep users that were found, so failed lookups get another try
+        raw_data = {
+            owner_id: {
+                "name": user.name,
+                "fetched_at": self._owner_id_to_fetched_at[owner_id]
+            }
+            for owner_id, user in self._owner_id_to_user.items()
+            if owner_id is not None and user.user_id == owner_id
+        }
+
+        os.makedirs(os.path.dirname(USER_DATA_FILE_PATH), exist_ok=True)
+
+        # Write then rename, so concurrent readers never see a partial file. The
+        # bot and scripts can write it at once, hence the process and thread.
+        temporary_file_path = "{path}.{pid}.{thread}.tmp".format(
+            path=USER_DATA_FILE_PATH,
+            pid=os.getpid(),
+            thread=threading.get_ident())
+        with open(temporary_file_path, 'w') as file:
+            file.write(json.dumps(raw_data))
+        os.replace(temporary_file_path, USER_DATA_FILE_PATH)
@@ -0,0 +1,63 @@
+"""
+   Copyright 2026 Kevin Emery
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import threading
+import time
+
+from typing import Dict, List, Tuple
+
+from ... import responsecache
+
+# Every week of the season, and then a couple more just to be sure
+TRANSACTION_WEEKS = range(1, 20)
+
+
+# Raw transactions for every week of a league, kept in memory so trades, last
+# transactions and anything else that needs the whole season share one walk
+# through the weeks. Completed weeks are also kept on disk by the response
+# cache, so rebuilding an entry only goes to the network for the current week.
+class TransactionIndex(object):
+    def __init__(self):
+        # League ID to when it was stored and the raw transactions per week
+        self._league_id_to_entry: Dict[str, Tuple[float, List[list]]] = {}
+        self._lock = threading.Lock()
+
+    def get_transactions_per_week(self, league_id: str) -> List[list]:
+        with self._lock:
+            entry = self._league_id_to_entry.get(league_id)
+
+        if entry is None:
+            return None
+
+        # The current week can still change, so don't hold it any longer than
+        # the response cache would
+        stored_at, raw_transactions_per_week = entry
+        if time.time() - stored_at > responsecache.CURRENT_WEEK_TTL_SECONDS:
+            return None
+
+        return raw_transactions_per_week
+
+    def store_transactions_per_week(self, league_id: str,
+                                    raw_transactions_per_week: List[list]):
+        # A week that failed to come back would hide its transactions from
+        # every later query, so leave it for the next caller to retry
+        if any(raw_transactions is None
+               for raw_transactions in raw_transactions_per_week):
+            return
+
+        with self._lock:
+            self._league_id_to_entry[league_id] = (time.time(),
+                                                   raw_transactions_per_week)
@@ -0,0 +1,204 @@
+"""
+   Copyright 2026 Kevin Emery
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import asyncio
+import random
+import threading
+import time
+
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+
+# Requests per second and burst size for each host. Sleeper asks callers to stay
+# under 1000 calls a minute. Fleaflicker doesn't publish a limit, so stay modest.
+HOST_TO_RATE_LIMIT: Dict[str, Tuple[float, int]] = {
+    "api.sleeper.app": (15.0, 30),
+    "www.fleaflicker.com": (10.0, 20),
+}
+DEFAULT_RATE_LIMIT = (10.0, 20)
+
+# Requests in flight to one host are adjusted AIMD-style: grow by one for every
+# window of successful requests, halve when the host pushes back
+INITIAL_CONCURRENCY_LIMIT = 8.0
+MIN_CONCURRENCY_LIMIT = 1.0
+MAX_CONCURRENCY_LIMIT = 32.0
+
+# A burst of failures from one overloaded moment should only halve the limit once
+DECREASE_COOLDOWN_SECONDS = 1.0
+
+# Retries use exponential backoff with full jitter, so callers that failed
+# together don't all come back at the same moment
+MAX_ATTEMPTS = 4
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_CAP_SECONDS = 30.0
+
+
+class HostRateLimiter(object):
+    def __init__(self, requests_per_second: float, burst: int):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.concurrency_limit = INITIAL_CONCURRENCY_LIMIT
+
+        self._condition = threading.Condition()
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+
+        # Coroutines waiting on a free slot, and the loop each is waiting on.
+        # Releases can come from any thread, so they're woken through the loop.
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop,
+                                        asyncio.Future]] = []
+
+    def acquire(self):
+        with self._condition:
+            while not self._has_free_slot():
+                self._condition.wait()
+            delay = self._take_slot_and_token()
+
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            with self._condition:
+                if self._has_free_slot():
+                    delay = self._take_slot_and_token()
+                    break
+
+                waiter = (loop, loop.create_future())
+                self._async_waiters.append(waiter)
+
+            try:
+                await waiter[1]
+            finally:
+                # Already gone if a release woke it, but not if it was cancelled
+                with self._condition:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def release(self, throttled: bool, retry_after_seconds: float = None):
+        with self._condition:
+            self._in_flight -= 1
+            now = time.monotonic()
+
+            if throttled:
+                if now - self._last_decrease >= DECREASE_COOLDOWN_SECONDS:
+                    self.concurrency_limit = max(MIN_CONCURRENCY_LIMIT,
+                                                 self.concurrency_limit / 2)
+                    self._last_decrease = now
+
+                # Honor the host's request to back off for every caller
+                if retry_after_seconds is not None:
+                    self._paused_until = max(self._paused_until,
+                                             now + retry_after_seconds)
+            else:
+                self.concurrency_limit = min(
+                    MAX_CONCURRENCY_LIMIT,
+                    self.concurrency_limit + 1 / self.concurrency_limit)
+
+            self._condition.notify_all()
+            self._wake_async_waiters()
+
+    def _wake_async_waiters(self):
+        # Must hold _condition. Every waiter checks for a slot again, the same
+        # as the threads woken by notify_all.
+        for loop, future in self._async_waiters:
+            try:
+                loop.call_soon_threadsafe(_set_future_result, future)
+            except RuntimeError:
+                # The waiter's loop has closed, so there's nobody to wake
+                pass
+        self._async_waiters = []
+
+    def _has_free_slot(self) -> bool:
+        return self._in_flight < int(self.concurrency_limit)
+
+    def _take_slot_and_token(self) -> float:
+        # Must hold _condition. Returns how long to wait before sending, since
+        # a token can be reserved ahead of the bucket refilling.
+        self._in_flight += 1
+        now = time.monotonic()
+
+        self._tokens = min(
+            self.burst, self._tokens +
+            (now - self._last_refill) * self.requests_per_second)
+        self._last_refill = now
+        self._tokens -= 1
+
+        token_delay = max(0.0, -self._tokens / self.requests_per_second)
+        pause_delay = max(0.0, self._paused_until - now)
+
+        return max(token_delay, pause_delay)
+
+
+def _set_future_result(future: asyncio.Future):
+    # The waiter may have been cancelled since it was woken
+    if not future.done():
+        future.set_result(None)
+
+
+_host_to_rate_limiter: Dict[str, HostRateLimiter] = {}
+_rate_limiter_lock = threading.Lock()
+
+
+def configure_host_rate_limit(host: str, requests_per_second: float,
+                              burst: int):
+    with _rate_limiter_lock:
+        HOST_TO_RATE_LIMIT[host] = (requests_per_second, burst)
+        _host_to_rate_limiter.pop(host, None)
+
+
+def get_rate_limiter_for_url(request_url: str) -> HostRateLimiter:
+    host = urlsplit(request_url).netloc
+
+    with _rate_limiter_lock:
+        if host not in _host_to_rate_limiter:
+            requests_per_second, burst = HOST_TO_RATE_LIMIT.get(
+                host, DEFAULT_RATE_LIMIT)
+            _host_to_rate_limiter[host] = HostRateLimiter(
+                requests_per_second, burst)
+
+        return _host_to_rate_limiter[host]
+
+
+def is_throttled_status(status_code: int) -> bool:
+    return status_code == 429 or status_code >= 500
+
+
+def parse_retry_after(header_value: str) -> float:
+    # Only the delay-seconds form shows up in practice; ignore HTTP dates
+    if header_value is None:
+        return None
+
+    try:
+        return max(0.0, float(header_value))
+    except ValueError:
+        return None
+
+
+def get_backoff_delay(attempt: int, retry_after_seconds: float = None) -> float:
+    if retry_after_seconds is not None:
+        return retry_after_seconds + random.uniform(0, BACKOFF_BASE_SECONDS)
+
+    return random.uniform(
+        0, min(BACKOFF_CAP_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt))
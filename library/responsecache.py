@@ -0,0 +1,173 @@
+"""
+   Copyright 2026 Kevin Emery
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from typing import Any, Callable, Dict, Union
+
+# Directory is relative to the directory where script is run
+CACHE_DIRECTORY_PATH = "./data/http_cache"
+
+# TTL policies. Anything else is a number of seconds the response stays fresh.
+# BYPASS never reads or writes the cache, for data that has to be live.
+# IMMUTABLE never expires, for closed weeks and completed drafts.
+BYPASS = 0
+IMMUTABLE = -1
+
+# The week in progress still changes as games finish and stats get corrected
+CURRENT_WEEK_TTL_SECONDS = 5 * 60
+
+# League membership, names, and settings rarely change within a run of scripts
+LEAGUE_DATA_TTL_SECONDS = 60 * 60
+
+# Usernames and ids only change when someone renames their account
+USER_DATA_TTL_SECONDS = 24 * 60 * 60
+
+# Either a fixed TTL, or a function that picks one once the response is in hand
+# (e.g. a draft is only immutable once its status says complete)
+TTLPolicy = Union[int, Callable[[Any], int]]
+
+_enabled = True
+_statistics_lock = threading.Lock()
+_hit_count = 0
+_miss_count = 0
+
+
+def configure_response_cache(enabled: bool = True):
+    global _enabled
+    _enabled = enabled
+
+
+def get_cache_statistics() -> Dict[str, int]:
+    with _statistics_lock:
+        return {"hits": _hit_count, "misses": _miss_count}
+
+
+def reset_cache_statistics():
+    global _hit_count, _miss_count
+    with _statistics_lock:
+        _hit_count = 0
+        _miss_count = 0
+
+
+def format_cache_statistics() -> str:
+    statistics = get_cache_statistics()
+    template = "Response cache: {hits} hits, {misses} misses"
+    return template.format(hits=statistics["hits"],
+                           misses=statistics["misses"])
+
+
+def lookup(request_url: str, ttl: TTLPolicy):
+    # Returns the cached response, or None if there isn't a fresh one. A fixed
+    # ttl also caps the age of what's accepted, since the same URL can have
+    # been stored as immutable by a caller with a different policy.
+    if not _should_use_cache(ttl):
+        return None
+
+    entry = _read_entry(request_url)
+    now = time.time()
+
+    if entry is not None and _is_entry_fresh(entry, ttl, now):
+        _record_hit()
+        return entry["response"]
+
+    _record_miss()
+    return None
+
+
+def store(request_url: str, ttl: TTLPolicy, response_json):
+    if not _should_use_cache(ttl) or response_json is None:
+        return
+
+    if callable(ttl):
+        ttl = ttl(response_json)
+
+    if ttl == BYPASS:
+        return
+
+    now = time.time()
+    entry = {
+        "url": request_url,
+        "stored_at": now,
+        "expires_at": None if ttl == IMMUTABLE else now + ttl,
+        "response": response_json
+    }
+
+    os.makedirs(CACHE_DIRECTORY_PATH, exist_ok=True)
+    file_path = _get_file_path_for_url(request_url)
+
+    # Write then rename, so concurrent readers never see a partial file. The
+    # bot and scripts can write it at once, hence the process and thread.
+    temporary_file_path = "{path}.{pid}.{thread}.tmp".format(
+        path=file_path, pid=os.getpid(), thread=threading.get_ident())
+    with open(temporary_file_path, "w") as temporary_file:
+        json.dump(entry, temporary_file)
+    os.replace(temporary_file_path, file_path)
+
+
+def _should_use_cache(ttl: TTLPolicy) -> bool:
+    return _enabled and (callable(ttl) or ttl != BYPASS)
+
+
+def _is_entry_fresh(entry, ttl: TTLPolicy, now: float) -> bool:
+    if entry["expires_at"] is not None and now >= entry["expires_at"]:
+        return False
+
+    if not callable(ttl) and ttl != IMMUTABLE:
+        return now - entry["stored_at"] <= ttl
+
+    return True
+
+
+def _read_entry(request_url: str):
+    file_path = _get_file_path_for_url(request_url)
+
+    if not os.path.exists(file_path):
+        return None
+
+    try:
+        with open(file_path, "r") as cache_file:
+            entry = json.load(cache_file)
+    except (OSError, ValueError):
+        # Treat a corrupt or unreadable entry as a miss, it'll be overwritten
+        return None
+
+    # Guard against hash collisions, however unlikely
+    if entry.get("url") != request_url:
+        return None
+
+    return entry
+
+
+def _get_file_path_for_url(request_url: str) -> str:
+    file_name = hashlib.sha256(request_url.encode()).hexdigest() + ".json"
+    return os.path.join(CACHE_DIRECTORY_PATH, file_name)
+
+
+def _record_hit():
+    global _hit_count
+    with _statistics_lock:
+        _hit_count += 1
+
+
+def _record_miss():
+    global _miss_count
+    with _statistics_lock:
+        _miss_count += 1
@@ -0,0 +1,252 @@
+"""
+   Copyright 2026 Kevin Emery
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import os
+import sqlite3
+import threading
+
+from typing import Dict, List, Tuple
+
+from .model.league import League
+from .model.seasonscore import SeasonScore
+from .model.team import Team
+from .model.user import User
+from .model.weeklyscore import WeeklyScore
+
+# Scores for weeks that have closed, and season totals for seasons that have
+# finished, which can never change. Everything a score needs is kept in its
+# row, so a leaderboard can be rebuilt without going back to the platform, and
+# every closed week a leaderboard needs comes back from a single query.
+
+# File is relative to the directory where script is run
+SCORE_STORE_FILE_PATH = "./data/scores.sqlite3"
+
+# Connections are opened per call, so this only keeps writers from tripping
+# over each other within the process
+_lock = threading.Lock()
+
+# The schema only needs creating once per process, not on every connection
+_schema_created = False
+
+# Team IDs are left untyped, since Sleeper's are numbers and Fleaflicker's are
+# strings, and they should come back the way they went in
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS weekly_scores (
+    platform TEXT NOT NULL,
+    league_id TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    team_id NOT NULL,
+    user_id TEXT NOT NULL,
+    user_name TEXT NOT NULL,
+    user_email TEXT NOT NULL,
+    roster_link TEXT NOT NULL,
+    score REAL,
+    PRIMARY KEY (platform, league_id, year, week, position)
+);
+CREATE TABLE IF NOT EXISTS season_scores (
+    platform TEXT NOT NULL,
+    league_id TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    team_id NOT NULL,
+    user_id TEXT NOT NULL,
+    user_name TEXT NOT NULL,
+    user_email TEXT NOT NULL,
+    roster_link TEXT NOT NULL,
+    score REAL,
+    PRIMARY KEY (platform, league_id, year, position)
+);
+"""
+
+
+def lookup_weekly_scores(
+        platform: str, leagues: List[League], year: int, starting_week: int,
+        ending_week: int) -> Dict[Tuple[str, int], List[WeeklyScore]]:
+    # Returns the stored scores by league ID and week, in the order they were
+    # stored. Weeks that haven't been stored are left out.
+    league_id_to_league = {league.league_id: league for league in leagues}
+    weekly_scores = {}
+
+    for row in _select(
+            "SELECT league_id, week, team_id, user_id, user_name, user_email,"
+            " roster_link, score FROM weekly_scores"
+            " WHERE platform = ? AND year = ? AND week BETWEEN ? AND ?"
+            " ORDER BY league_id, week, position",
+        (platform, year, starting_week, ending_week)):
+        league = league_id_to_league.get(row[0])
+        if league is None:
+            continue
+
+        weekly_scores.setdefault((row[0], row[1]), []).append(
+            WeeklyScore(league, _create_team_from_row(row[2:7]), row[1],
+                        row[7]))
+
+    return weekly_scores
+
+
+def store_weekly_scores(platform: str, league: League, year: int, week: int,
+                        weekly_scores: List[WeeklyScore]):
+    _replace(
+        "DELETE FROM weekly_scores"
+        " WHERE platform = ? AND league_id = ? AND year = ? AND week = ?",
+        (platform, league.league_id, year, week),
+        "INSERT INTO weekly_scores VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", [
+            (platform, league.league_id, year, week, position) +
+            _create_row_from_team(weekly_score.team) + (weekly_score.score, )
+            for position, weekly_score in enumerate(weekly_scores)
+        ])
+
+
+def lookup_season_scores(platform: str, leagues: List[League],
+                         year: int) -> Dict[str, List[SeasonScore]]:
+    # Returns the stored season totals by league ID, in the order they were
+    # stored. Seasons that haven't been stored are left out.
+    league_id_to_league = {league.league_id: league for league in leagues}
+    season_scores = {}
+
+    for row in _select(
+            "SELECT league_id, team_id, user_id, user_name, user_email,"
+            " roster_link, score FROM season_scores"
+            " WHERE platform = ? AND year = ?"
+            " ORDER BY league_id, position", (platform, year)):
+        league = league_id_to_league.get(row[0])
+        if league is None:
+            continue
+
+        season_scores.setdefault(row[0], []).append(
+            SeasonScore(league, _create_team_from_row(row[1:6]), row[6]))
+
+    return season_scores
+
+
+def store_season_scores(platform: str, league: League, year: int,
+                        season_scores: List[SeasonScore]):
+    _replace(
+        "DELETE FROM season_scores"
+        " WHERE platform = ? AND league_id = ? AND year = ?",
+        (platform, league.league_id, year),
+        "INSERT INTO season_scores VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", [
+            (platform, league.league_id, year, position) +
+            _create_row_from_team(season_score.team) + (season_score.score, )
+            for position, season_score in enumerate(season_scores)
+        ])
+
+
+def delete_scores(platform: str, year: int, starting_week: int,
+                  ending_week: int):
+    # Drops stored weeks, and the season total, so they're fetched again. For
+    # when a platform changes a score after it was stored.
+    _delete(
+        "DELETE FROM weekly_scores"
+        " WHERE platform = ? AND year = ? AND week BETWEEN ? AND ?",
+        (platform, year, starting_week, ending_week))
+    _delete("DELETE FROM season_scores WHERE platform = ? AND year = ?",
+            (platform, year))
+
+
+def _create_row_from_team(team: Team) -> tuple:
+    return (team.team_id, team.manager.user_id, team.manager.name,
+            team.manager.email, team.roster_link)
+
+
+def _create_team_from_row(row: tuple) -> Team:
+    team_id, user_id, user_name, user_email, roster_link = row
+    return Team(team_id, User(user_id, user_name, user_email), roster_link)
+
+
+def _select(query: str, parameters: tuple) -> List[tuple]:
+    # Nothing has been stored yet, so don't create the file just to read it
+    if not os.path.exists(SCORE_STORE_FILE_PATH):
+        return []
+
+    try:
+        with _lock:
+            connection = _connect()
+            try:
+                return connection.execute(query, parameters).fetchall()
+            finally:
+                connection.close()
+    except sqlite3.Error:
+        # Treat a corrupt or unreadable store as empty, it'll be refilled
+        _forget_schema()
+        return []
+
+
+def _replace(delete_query: str, delete_parameters: tuple, insert_query: str,
+             rows: List[tuple]):
+    try:
+        os.makedirs(os.path.dirname(SCORE_STORE_FILE_PATH), exist_ok=True)
+
+        with _lock:
+            connection = _connect()
+            try:
+                # One transaction, so readers never see a partial week
+                with connection:
+                    connection.execute(delete_query, delete_parameters)
+                    connection.executemany(insert_query, rows)
+            finally:
+                connection.close()
+    except (OSError, sqlite3.Error) as e:
+        _forget_schema()
+
+        # The scores are already in hand, so failing to keep them only means
+        # they get fetched again next time
+        print("Failed to store scores in {path}".format(
+            path=SCORE_STORE_FILE_PATH))
+        print("Exception: {e}".format(e=e))
+
+
+def _delete(query: str, parameters: tuple):
+    # Nothing has been stored yet, so there's nothing to drop
+    if not os.path.exists(SCORE_STORE_FILE_PATH):
+        return
+
+    with _lock:
+        connection = _connect()
+        try:
+            with connection:
+                connection.execute(query, parameters)
+        finally:
+            connection.close()
+
+
+# The store may have been deleted or replaced since the schema was created, so
+# create it again on the next connection
+def _forget_schema():
+    global _schema_created
+    _schema_created = False
+
+
+# Must be called with _lock held
+def _connect() -> sqlite3.Connection:
+    global _schema_created
+
+    # A missing file means the store was deleted, and connecting creates it
+    # empty
+    if not os.path.exists(SCORE_STORE_FILE_PATH):
+        _schema_created = False
+
+    connection = sqlite3.connect(SCORE_STORE_FILE_PATH)
+    if not _schema_created:
+        try:
+            connection.executescript(_SCHEMA)
+        except sqlite3.Error:
+            connection.close()
+            raise
+        _schema_created = True
+    return connection
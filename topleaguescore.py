@@ -15,57 +15,70 @@
 """
 
 import argparse
-import re
 import sys
 
 import common
+import leaguescoring
 import library.common as libCommon
+import library.fanout as fanout
+import library.responsecache as responsecache
 
 from typing import List
 
 from library.model.weeklyscore import WeeklyScore
 
-from library.platforms.fleaflicker.fleaflicker import Fleaflicker
-from library.platforms.sleeper.sleeper import Sleeper
-
 DEFAULT_LEAGUE_REGEX_STRING = ".*"
 DEFAULT_PLATFORM = common.PlatformSelection.SLEEPER
 
+# Closed weeks come out of the score store, same as the scoring leaderboards
 def get_top_weekly_score_for_each_league(account_identifier: str,
                                          starting_week: int,
                                          ending_week: int,
                                          year: int = libCommon.DEFAULT_YEAR,
                                          league_regex_string: str = DEFAULT_LEAGUE_REGEX_STRING,
-                                         platform_selection: common.PlatformSelection = DEFAULT_PLATFORM,) -> List[WeeklyScore]:
-
-    if platform_selection == common.PlatformSelection.SLEEPER:
-        platform = Sleeper()
-    elif platform_selection == common.PlatformSelection.FLEAFLICKER:
-        platform = Fleaflicker()
-
-    league_regex = re.compile(league_regex_string)
-
-    top_scores = []
-
-    user = platform.get_admin_user_by_identifier(account_identifier)
-    leagues = platform.get_all_leagues_for_user(user, year, league_regex)
-
-    for league in leagues:
-        weekly_scores = []
-        for week_num in range(starting_week, ending_week + 1):
-            weekly_scores.extend(
-                platform.get_weekly_scores_for_league_and_week(
-                    league, week_num, year))
-
-        weekly_scores.sort(key=lambda weekly_score: weekly_score.score,
-                           reverse=True)
-
-        if len(weekly_scores) > 0:
-            top_scores.append(weekly_scores[0])
-
-    top_scores.sort(key=lambda weekly_score: weekly_score.league.name)
-
-    return top_scores
+                                         platform_selection: common.PlatformSelection = DEFAULT_PLATFORM,
+                                         max_workers: int = fanout.DEFAULT_MAX_WORKERS) -> List[WeeklyScore]:
+    scoring_results = leaguescoring.get_partitioned_scoring_results(
+        account_identifier,
+        starting_week,
+        ending_week, {},
+        get_weekly_results=False,
+        get_current_weeks_results=False,
+        get_season_results=False,
+        get_max_scores=False,
+        get_min_scores=False,
+        year=year,
+        league_regex_string=league_regex_string,
+        platform_selection=platform_selection,
+        max_workers=max_workers,
+        get_top_score_per_league=True)
+
+    return scoring_results.overall.top_weekly_score_per_league
+
+
+async def get_top_weekly_score_for_each_league_async(
+        account_identifier: str,
+        starting_week: int,
+        ending_week: int,
+        year: int = libCommon.DEFAULT_YEAR,
+        league_regex_string: str = DEFAULT_LEAGUE_REGEX_STRING,
+        platform_selection: common.PlatformSelection = DEFAULT_PLATFORM
+) -> List[WeeklyScore]:
+    scoring_results = await leaguescoring.get_partitioned_scoring_results_async(
+        account_identifier,
+        starting_week,
+        ending_week, {},
+        get_weekly_results=False,
+        get_current_weeks_results=False,
+        get_season_results=False,
+        get_max_scores=False,
+        get_min_scores=False,
+        year=year,
+        league_regex_string=league_regex_string,
+        platform_selection=platform_selection,
+        get_top_score_per_league=True)
+
+    return scoring_results.overall.top_weekly_score_per_league
 
 
 def parse_user_provided_flags() -> argparse.Namespace:
@@ -132,6 +145,8 @@ def main(argv):
     common.print_weekly_scores_with_header(top_scores,
                                            "TOP WEEKLY SCORE IN EACH LEAGUE")
 
+    print(responsecache.format_cache_statistics())
+
 
 if __name__ == "__main__":
     main(sys.argv[1:])
@@ -15,15 +15,19 @@
 """
 
 import argparse
+import asyncio
 import re
 import sys
+import time
 
 from datetime import datetime
 from dateutil import parser
-from typing import List
+from typing import Dict, List, Set, Tuple
 
 import common
 import library.common as libCommon
+import library.fanout as fanout
+import library.responsecache as responsecache
 
 from library.model.league import League
 from library.model.player import Player
@@ -42,6 +46,10 @@ DEFAULT_START = "12-31-1999"
 DEFAULT_END = "12-31-2099"
 DEFAULT_PLATFORM = common.PlatformSelection.SLEEPER
 
+# How often a trade feed rebuilds its platform and re-lists leagues, so new
+# leagues, owners and players get picked up without redoing it every poll
+TRADE_FEED_LEAGUE_REFRESH_SECONDS = responsecache.LEAGUE_DATA_TTL_SECONDS
+
 
 def _filter_and_sort_trades_by_date(trades: List[Trade], start: datetime,
                                     end: datetime) -> List[Trade]:
@@ -282,24 +290,243 @@ def fetch_and_filter_trades(
     league_regex_string: str = DEFAULT_LEAGUE_REGEX_STRING,
     start_date_string: str = DEFAULT_START,
     end_date_string: str = DEFAULT_END,
-    platform_selection: common.PlatformSelection = DEFAULT_PLATFORM
+    platform_selection: common.PlatformSelection = DEFAULT_PLATFORM,
+    max_workers: int = fanout.DEFAULT_MAX_WORKERS
 ) -> List[Trade]:
-    if platform_selection == common.PlatformSelection.SLEEPER:
-        platform = Sleeper()
-    elif platform_selection == common.PlatformSelection.FLEAFLICKER:
-        platform = Fleaflicker()
+    platform = _create_platform(platform_selection)
 
     user = platform.get_admin_user_by_identifier(account_identifier)
     leagues = platform.get_all_leagues_for_user(user, year, re.compile(league_regex_string))
+
+    all_league_trades = fanout.fan_out(platform.get_all_trades_for_league,
+                                       [(league, year) for league in leagues],
+                                       max_workers)
+
+    return _combine_and_filter_trades(all_league_trades, start_date_string,
+                                      end_date_string)
+
+
+async def fetch_and_filter_trades_async(
+    account_identifier: str,
+    year: int = libCommon.DEFAULT_YEAR,
+    league_regex_string: str = DEFAULT_LEAGUE_REGEX_STRING,
+    start_date_string: str = DEFAULT_START,
+    end_date_string: str = DEFAULT_END,
+    platform_selection: common.PlatformSelection = DEFAULT_PLATFORM
+) -> List[Trade]:
+    platform = await common.create_async_platform(platform_selection)
+
+    user = await platform.get_admin_user_by_identifier(account_identifier)
+    leagues = await platform.get_all_leagues_for_user(user, year, re.compile(league_regex_string))
+
+    all_league_trades = await asyncio.gather(*[
+        platform.get_all_trades_for_league(league, year) for league in leagues
+    ])
+
+    return _combine_and_filter_trades(all_league_trades, start_date_string,
+                                      end_date_string)
+
+
+# Shared by the sync and async fetches, which only differ in how they go to the
+# platform
+def _combine_and_filter_trades(all_league_trades: List[List[Trade]],
+                               start_date_string: str,
+                               end_date_string: str) -> List[Trade]:
     trades = []
+    for league_trades in all_league_trades:
+        trades.extend(league_trades)
 
-    for league in leagues:
-        trades.extend(platform.get_all_trades_for_league(league, year))
+    return _filter_and_sort_trades_by_date(trades,
+                                           parser.parse(start_date_string),
+                                           parser.parse(end_date_string))
 
-    filtered_trades = _filter_and_sort_trades_by_date(
-        trades, parser.parse(start_date_string), parser.parse(end_date_string))
 
-    return filtered_trades
+def _create_platform(
+        platform_selection: common.PlatformSelection) -> Platform:
+    if platform_selection == common.PlatformSelection.SLEEPER:
+        return Sleeper()
+    elif platform_selection == common.PlatformSelection.FLEAFLICKER:
+        return Fleaflicker()
+
+
+# The state a trade feed keeps between polls, shared by the sync and async
+# feeds. Holds the platform and leagues being polled, and the newest trade seen
+# in each league.
+class _TradeFeedState(object):
+    def __init__(self, account_identifier: str, year: int,
+                 league_regex_string: str,
+                 platform_selection: common.PlatformSelection):
+        self.account_identifier = account_identifier
+        self.year = year
+        self.league_regex = re.compile(league_regex_string)
+        self.platform_selection = platform_selection
+
+        self.platform = None
+        self.leagues: List[League] = []
+        self._leagues_loaded_at = 0.0
+
+        # League ID to the time of the newest trade seen, and the IDs of every
+        # trade made at exactly that time
+        self._league_id_to_high_water_mark: Dict[str, Tuple[datetime,
+                                                            Set[str]]] = {}
+
+    def should_reload_leagues(self) -> bool:
+        return self.platform is None or time.time(
+        ) - self._leagues_loaded_at > TRADE_FEED_LEAGUE_REFRESH_SECONDS
+
+    def set_leagues(self, platform, leagues: List[League]):
+        self.platform = platform
+        self.leagues = leagues
+        self._leagues_loaded_at = time.time()
+
+    def has_seen_league(self, league: League) -> bool:
+        return league.league_id in self._league_id_to_high_water_mark
+
+    def request_trades_to_check(self, league: League):
+        # The first poll of a league goes through its whole season. Hands back
+        # whatever the platform does, so the async feed gets something to await.
+        if self.has_seen_league(league):
+            return self.platform.get_newest_trades_for_league(
+                league, self.year)
+
+        return self.platform.get_all_trades_for_league(league,
+                                                       self.year,
+                                                       strict=True)
+
+    def reset(self):
+        self._league_id_to_high_water_mark = {}
+
+    def take_new_trades(self, leagues: List[League],
+                        trades_per_league: List[List[Trade]]) -> List[Trade]:
+        # A league whose trades are None couldn't be fully fetched. Its newest
+        # trade seen stays where it was, so nothing it missed gets skipped.
+        new_trades = []
+
+        for league, league_trades in zip(leagues, trades_per_league):
+            if league_trades is None:
+                continue
+
+            newest_time, newest_trade_ids = self._league_id_to_high_water_mark.get(
+                league.league_id, (datetime.min, set()))
+
+            league_new_trades = [
+                trade for trade in league_trades
+                if trade.trade_time > newest_time or (
+                    trade.trade_time == newest_time
+                    and str(trade.id) not in newest_trade_ids)
+            ]
+
+            for trade in league_new_trades:
+                if trade.trade_time > newest_time:
+                    newest_time = trade.trade_time
+                    newest_trade_ids = set()
+                if trade.trade_time == newest_time:
+                    newest_trade_ids.add(str(trade.id))
+
+            self._league_id_to_high_water_mark[league.league_id] = (
+                newest_time, newest_trade_ids)
+            new_trades.extend(league_new_trades)
+
+        new_trades.sort()
+        return new_trades
+
+
+def _print_trade_feed_failure(league: League, e: Exception):
+    print("Couldn't fetch trades for {league}, trying again next poll".format(
+        league=league.name))
+    print("Exception: {e}".format(e=e))
+
+
+# Polls a user's leagues for trades made since the last poll. The first poll of
+# a league goes through its whole season, and after that only the newest
+# trades are requested (the current week on Sleeper, the first page on
+# Fleaflicker) and compared against the newest trade already seen there.
+class TradeFeed(object):
+    def __init__(self,
+                 account_identifier: str,
+                 year: int = libCommon.DEFAULT_YEAR,
+                 league_regex_string: str = DEFAULT_LEAGUE_REGEX_STRING,
+                 platform_selection: common.PlatformSelection = DEFAULT_PLATFORM):
+        self._state = _TradeFeedState(account_identifier, year,
+                                      league_regex_string, platform_selection)
+
+    def get_new_trades(
+            self,
+            max_workers: int = fanout.DEFAULT_MAX_WORKERS) -> List[Trade]:
+        state = self._state
+
+        if state.should_reload_leagues():
+            platform = _create_platform(state.platform_selection)
+            user = platform.get_admin_user_by_identifier(
+                state.account_identifier)
+            state.set_leagues(
+                platform,
+                platform.get_all_leagues_for_user(user, state.year,
+                                                  state.league_regex))
+
+        leagues = state.leagues
+        trades_per_league = fanout.fan_out(self._get_trades_to_check,
+                                           [(league, ) for league in leagues],
+                                           max_workers)
+
+        return state.take_new_trades(leagues, trades_per_league)
+
+    # Forget the newest trade seen in every league, so the next poll goes
+    # through whole seasons again. For when the last batch handed out couldn't
+    # be handled.
+    def reset(self):
+        self._state.reset()
+
+    def _get_trades_to_check(self, league: League) -> List[Trade]:
+        state = self._state
+
+        try:
+            return state.request_trades_to_check(league)
+        except Exception as e:
+            _print_trade_feed_failure(league, e)
+            return None
+
+
+# Same as TradeFeed, for the bot's event loop
+class AsyncTradeFeed(object):
+    def __init__(self,
+                 account_identifier: str,
+                 year: int = libCommon.DEFAULT_YEAR,
+                 league_regex_string: str = DEFAULT_LEAGUE_REGEX_STRING,
+                 platform_selection: common.PlatformSelection = DEFAULT_PLATFORM):
+        self._state = _TradeFeedState(account_identifier, year,
+                                      league_regex_string, platform_selection)
+
+    async def get_new_trades(self) -> List[Trade]:
+        state = self._state
+
+        if state.should_reload_leagues():
+            platform = await common.create_async_platform(
+                state.platform_selection)
+            user = await platform.get_admin_user_by_identifier(
+                state.account_identifier)
+            state.set_leagues(
+                platform, await
+                platform.get_all_leagues_for_user(user, state.year,
+                                                  state.league_regex))
+
+        leagues = state.leagues
+        trades_per_league = await asyncio.gather(
+            *[self._get_trades_to_check(league) for league in leagues])
+
+        return state.take_new_trades(leagues, trades_per_league)
+
+    def reset(self):
+        self._state.reset()
+
+    async def _get_trades_to_check(self, league: League) -> List[Trade]:
+        state = self._state
+
+        try:
+            return await state.request_trades_to_check(league)
+        except Exception as e:
+            _print_trade_feed_failure(league, e)
+            return None
 
 
 def main(argv):